@@ -0,0 +1,273 @@
+"""
+Benchmark suite for BetterPassphrase.
+
+Measures passphrase generation throughput, `generate_lengths` latency, the metric
+properties of `Passphrase`, the CLI, cold import time and peak memory. Results are
+written to a JSON file and compared against a stored baseline, flagging every metric
+that got worse by more than the tolerance.
+
+Usage:
+
+```bash
+python benchmarks/run.py                    # run and compare against benchmarks/baseline.json
+python benchmarks/run.py --quick            # smaller workloads, for a quick check
+python benchmarks/run.py --update-baseline  # run and store the results as the new baseline
+```
+
+Exits with status 1 if any metric regressed. Timings depend on the machine, so the
+baseline should be updated when switching machines.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from betterpassphrase import generate_phrase, generate_phrases  # noqa: E402
+from betterpassphrase.generator import generate_lengths  # noqa: E402
+from betterpassphrase.mappings import UNIT_PHRASE_LENGTHS  # noqa: E402
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+RESULTS_PATH = BENCHMARKS_DIR / "results.json"
+
+COMPOSITE_LENGTHS = [12, 24, 48]
+"""Long passphrase lengths, made of several sub-phrases."""
+
+Metrics = dict[str, dict]
+"""Benchmark results: metric name to `{"value": ..., "unit": ..., "better": "lower" | "higher"}`."""
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    """A benchmark result, where `better` tells whether lower or higher values are better."""
+    return {"value": round(value, 3), "unit": unit, "better": better}
+
+
+def best_rate(func: Callable[[], object], count: int, repeat: int = 3) -> float:
+    """Best rate, in calls per second, over `repeat` runs of `count` calls of `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """The value below which `fraction` of the (sorted) values fall."""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def run_python(code: str) -> str:
+    """Run `code` in a fresh interpreter from the repository root and return its output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def bench_generate_phrase(scale: float) -> Metrics:
+    # Warm up the wordlists and tables, which are loaded on first use
+    generate_phrases(100, max(COMPOSITE_LENGTHS))
+
+    results = {}
+    for length in [*UNIT_PHRASE_LENGTHS, *COMPOSITE_LENGTHS]:
+        count = int(20_000 * scale * 6 / length) or 1
+        results[f"generate_phrase[{length}]"] = metric(
+            best_rate(lambda: generate_phrase(length, "-"), count), "phrases/s", "higher"
+        )
+        results[f"generate_phrases[{length}]"] = metric(
+            best_rate(lambda: generate_phrases(count, length, "-"), 1) * count, "phrases/s", "higher"
+        )
+    return results
+
+
+def bench_generate_lengths(scale: float) -> Metrics:
+    results = {}
+    for length in COMPOSITE_LENGTHS:
+        timings = []
+        for _ in range(int(20_000 * scale) or 1):
+            start = time.perf_counter_ns()
+            generate_lengths(length)
+            timings.append((time.perf_counter_ns() - start) / 1000)
+        timings.sort()
+        for name, fraction in [("p50", 0.5), ("p90", 0.9), ("p99", 0.99)]:
+            results[f"generate_lengths[{length}].{name}"] = metric(percentile(timings, fraction), "us")
+    return results
+
+
+def bench_vectorized(scale: float) -> Metrics:
+    from betterpassphrase.vectorized import HAS_NUMPY, generate_passphrase_strings
+
+    # Only measured with NumPy installed, otherwise it is the regular path
+    if not HAS_NUMPY:
+        return {}
+    generate_passphrase_strings(100)
+    n = int(1_000_000 * scale) or 1
+    return {
+        "generate_passphrase_strings[6]": metric(
+            best_rate(lambda: generate_passphrase_strings(n, 6, "-"), 1) * n, "phrases/s", "higher"
+        )
+    }
+
+
+def bench_passphrase_metrics(scale: float) -> Metrics:
+    phrases = generate_phrases(int(5_000 * scale) or 1, 6, "-")
+    results = {}
+    for name in ["one_of", "wordlist_probability", "entropy_bits", "character_one_of", "character_entropy_bits"]:
+        start = time.perf_counter()
+        for phrase in phrases:
+            getattr(phrase, name)
+        results[f"Passphrase.{name}"] = metric((time.perf_counter() - start) / len(phrases) * 1e6, "us")
+    return results
+
+
+def bench_cli(scale: float) -> Metrics:
+    n = int(200_000 * scale) or 1
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "betterpassphrase.cli", "-n", str(n), "-w", "1"],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return {"cli.main[-n]": metric(n / (time.perf_counter() - start), "phrases/s", "higher")}
+
+
+def bench_import(scale: float) -> Metrics:
+    def best_time(code: str) -> float:
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            run_python(code)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    interpreter = best_time("pass")
+    return {
+        "import": metric((best_time("import betterpassphrase") - interpreter) * 1000, "ms"),
+        "first_phrase": metric(
+            (best_time("import betterpassphrase; betterpassphrase.generate_phrase()") - interpreter) * 1000, "ms"
+        ),
+    }
+
+
+def bench_memory(scale: float) -> Metrics:
+    n = int(1_000_000 * scale) or 1
+    peak_rss = (
+        "import resource, sys\n"
+        "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss\n"
+        # Reported in kilobytes on Linux, in bytes on macOS
+        "print(rss / 1024 if sys.platform != 'darwin' else rss / 1024 ** 2)\n"
+    )
+    setup = "from betterpassphrase.parallel import iter_phrase_batches\nfrom betterpassphrase import generate_phrases\n"
+    idle = float(run_python(setup + "generate_phrases(1)\n" + peak_rss))
+    held = float(run_python(setup + f"phrases = generate_phrases({n})\n" + peak_rss))
+    streamed = float(run_python(
+        setup + f"for batch in iter_phrase_batches({n}, workers=1):\n    pass\n" + peak_rss
+    ))
+    return {
+        "memory.generate_phrases": metric((held - idle) * 1_000_000 / n, "MB per million phrases"),
+        "memory.streamed": metric(streamed - idle, "MB"),
+    }
+
+
+BENCHMARKS: dict[str, Callable[[float], Metrics]] = {
+    "generate_phrase": bench_generate_phrase,
+    "generate_lengths": bench_generate_lengths,
+    "vectorized": bench_vectorized,
+    "passphrase_metrics": bench_passphrase_metrics,
+    "cli": bench_cli,
+    "import": bench_import,
+    "memory": bench_memory,
+}
+
+
+def compare(results: Metrics, baseline: Metrics, tolerance: float) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results (Metrics): The new results.
+        baseline (Metrics): The baseline results.
+        tolerance (float): The relative change allowed before a metric counts as regressed.
+
+    Returns:
+        list[str]: The names of the regressed metrics.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline or not baseline[name]["value"]:
+            continue
+        change = result["value"] / baseline[name]["value"] - 1
+        if result["better"] == "higher":
+            change = -change
+        marker = "REGRESSED" if change > tolerance else ""
+        print(f"  {name:40} {baseline[name]['value']:>14,.2f} -> {result['value']:>14,.2f} {result['unit']:24} {marker}")
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def main(_args: list[str] = None):
+    parser = argparse.ArgumentParser(description="Run the BetterPassphrase benchmark suite.")
+    parser.add_argument("--quick", action="store_true", help="Run smaller workloads (default: False).")
+    parser.add_argument(
+        "-b", "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+        help="Benchmarks to run (default: all).",
+    )
+    parser.add_argument("-o", "--output", type=Path, default=RESULTS_PATH, help=f"Results file (default: {RESULTS_PATH.name}).")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help=f"Baseline file (default: {BASELINE_PATH.name}).")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=0.25,
+        help="Relative change allowed before a metric counts as regressed (default: 0.25).",
+    )
+    args = parser.parse_args(_args)
+
+    scale = 0.1 if args.quick else 1.0
+    results: Metrics = {}
+    for name in args.benchmarks:
+        print(f"Running {name}...", flush=True)
+        results.update(BENCHMARKS[name](scale))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "quick": args.quick,
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one.")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["quick"] != args.quick:
+        print("Warning: the baseline was run with different workloads (--quick), results may differ.")
+    print(f"Compared to {args.baseline}:")
+    regressions = compare(results, baseline["results"], args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} metric(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
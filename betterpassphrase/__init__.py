@@ -2,10 +2,48 @@
 The main module for the betterpassphrase package.
 
 Contains the following submodules:
-- `generator`: Contains the `generate_phrase` function and the `Passphrase` class.
+- `generator`: Contains the `generate_phrase` and `generate_phrases` functions and the `Passphrase` class.
+- `grammar`: Compiles the grammar into direct wordlist references and alias tables weighted by phrase counts.
+- `wordlists`: A registry of named wordlist sets, loaded from any directory and cached with LRU eviction.
+- `shared`: Publishes wordlist sets in shared memory, for worker processes to attach to without loading them.
+- `reload`: Reloads changed wordlist sets in long-running processes, swapping them in atomically.
+- `blocklist`: Excludes words, substrings and regular expressions from wordlist sets when they load.
+- `chars`: Generates passphrases within character bounds, drawing only from the words that fit.
+- `codec`: Converts between passphrases and their ranks (integers), e.g. for sharded generation.
+- `export`: Formats batches of passphrases with their metadata as NDJSON, CSV or TSV records.
+- `provision`: Provisions credentials, generating passphrases and hashing them with scrypt or PBKDF2 across processes.
+- `aio`: Asyncio counterparts of the generation functions, which do not block the event loop.
+- `daemon` and `client`: A long-lived daemon serving passphrases from a prefetched pool, and its client.
+- `unique`: Generates large batches of guaranteed-unique passphrases in constant memory.
+- `vectorized`: An optional NumPy backend generating large batches of passphrase strings.
+- `seeded`: Reproducible, seeded passphrases for tests (NOT SECURE), with independent per-index streams.
+- `compact`: Contains the `CompactPassphrase` class, an index-backed, memory-efficient `Passphrase`.
+- `entropy`: Contains precomputed entropy tables (in bits) for the passphrase grammar.
+- `stats`: Optional counters and timers on the generation hot paths (see `STATS`).
 - `config`: Contains the `PARTS_OF_SPEECH_DIR` constant, which is the path to the directory containing the parts of speech files.
 """
-from .generator import generate_phrase, Passphrase
-from .config import PARTS_OF_SPEECH_DIR
+from importlib import import_module
 
-__all__ = ["generate_phrase", "Passphrase", "PARTS_OF_SPEECH_DIR"]
+__all__ = ["generate_phrase", "generate_phrases", "Passphrase", "CompactPassphrase", "PARTS_OF_SPEECH_DIR"]
+
+# Exported names are imported from their submodules on first access, so importing the
+# package (e.g. to run the CLI) only loads the modules that are actually used
+_EXPORTS = {
+    "generate_phrase": "generator",
+    "generate_phrases": "generator",
+    "Passphrase": "generator",
+    "CompactPassphrase": "compact",
+    "PARTS_OF_SPEECH_DIR": "config",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,219 @@
+"""
+Asyncio API for generating passphrases without blocking the event loop.
+
+Passphrases are generated in small chunks, with control handed back to the event loop
+between chunks, so other coroutines keep being served while a large batch is generated.
+Large batches can instead be offloaded to an executor (e.g. a `ProcessPoolExecutor`),
+in which case the event loop only waits on the results.
+"""
+import os
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice, repeat
+from typing import AsyncIterator
+
+from .config import ASYNC_CHUNK_SIZE, PARALLEL_CHUNK_SIZE
+from .generator import generate_phrase, generate_phrases, iter_phrases, phrase_factory
+from .models import Passphrase
+from .wordlists import WordlistSet, get_wordlists
+
+
+async def agenerate_phrase(
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> Passphrase:
+    """
+    Generate a passphrase of the specified length, or with at least `min_bits` bits of entropy.
+
+    A single passphrase takes microseconds, so it is generated in place.
+
+    Args:
+        length (int): The number of words in the passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Returns:
+        Passphrase: The generated passphrase with metadata.
+    """
+    return generate_phrase(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+
+
+async def agenerate_phrases(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> list[Passphrase]:
+    """
+    Generate `n` passphrases of the specified length.
+
+    See `aiter_phrase_batches` for how the work is split up.
+
+    Args:
+        n (int): The number of passphrases to generate.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        executor (Executor | None): Executor to offload the chunks to (`None` to
+                                    generate them in the event loop thread).
+        chunk_size (int | None): Number of phrases generated per chunk.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Returns:
+        list[Passphrase]: The generated passphrases with metadata.
+    """
+    phrases: list[Passphrase] = []
+    async for batch in aiter_phrase_batches(
+        n, length, sep, capitalize, executor, chunk_size, wordlists, min_bits, min_chars, max_chars
+    ):
+        phrases.extend(batch)
+    return phrases
+
+
+async def aiter_phrases(
+    n: int | None = None,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> AsyncIterator[Passphrase]:
+    """
+    Lazily generate passphrases of the specified length, one at a time.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for no limit).
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        executor (Executor | None): Executor to offload the chunks to (`None` to
+                                    generate them in the event loop thread).
+        chunk_size (int | None): Number of phrases generated per chunk.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Yields:
+        Passphrase: Generated passphrases with metadata.
+    """
+    async for batch in aiter_phrase_batches(
+        n, length, sep, capitalize, executor, chunk_size, wordlists, min_bits, min_chars, max_chars
+    ):
+        for phrase in batch:
+            yield phrase
+
+
+async def aiter_phrase_batches(
+    n: int | None = None,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> AsyncIterator[list[Passphrase]]:
+    """
+    Generate passphrases in chunks, without blocking the event loop for long.
+
+    Without an executor, each chunk is generated in the event loop thread, which then
+    yields to other coroutines before the next one; `ASYNC_CHUNK_SIZE` (the default)
+    keeps each chunk to about a millisecond. With an executor, chunks (of
+    `PARALLEL_CHUNK_SIZE` by default) are generated there, a bounded number at a time,
+    and yielded in order.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for no limit).
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        executor (Executor | None): Executor to offload the chunks to (`None` to
+                                    generate them in the event loop thread).
+        chunk_size (int | None): Number of phrases generated per chunk.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Yields:
+        list[Passphrase]: Batches of generated passphrases.
+
+    Raises:
+        ValueError: If no passphrase meets the given length, target and bounds.
+    """
+    if n is not None and n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    if chunk_size is None:
+        chunk_size = ASYNC_CHUNK_SIZE if executor is None else PARALLEL_CHUNK_SIZE
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    wordlists = get_wordlists(wordlists)
+    # Fail before any work is handed out if the target or bounds cannot be met
+    phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    if executor is None:
+        phrases = iter_phrases(n, length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+        while batch := list(islice(phrases, chunk_size)):
+            yield batch
+            # Let other coroutines run before generating the next chunk
+            await asyncio.sleep(0)
+        return
+
+    loop = asyncio.get_running_loop()
+    generate_chunk = partial(
+        generate_phrases,
+        length=length,
+        sep=sep,
+        capitalize=capitalize,
+        wordlists=wordlists,
+        min_bits=min_bits,
+        min_chars=min_chars,
+        max_chars=max_chars,
+    )
+    if n is None:
+        sizes = repeat(chunk_size)
+    else:
+        sizes = (min(chunk_size, n - start) for start in range(0, n, chunk_size))
+    pending: deque[asyncio.Future] = deque()
+    try:
+        for size in sizes:
+            pending.append(loop.run_in_executor(executor, generate_chunk, size))
+            # Keep a couple of chunks per CPU in flight, but no more
+            if len(pending) >= 2 * (os.cpu_count() or 1):
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
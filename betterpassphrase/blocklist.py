@@ -0,0 +1,119 @@
+"""
+Blocklists of words never to use in passphrases.
+
+A blocklist excludes exact words, words containing a substring, and words matching a
+regular expression (anywhere in the word). All rules are case-insensitive. It is applied
+once, when a wordlist set is loaded (see `wordlists.register_wordlists`): the set then
+only holds the allowed words, so the grammar weights and the entropy of its passphrases
+reflect the filtered wordlists, and generation never has to retry.
+
+```python
+from betterpassphrase import generate_phrase
+from betterpassphrase.blocklist import Blocklist
+from betterpassphrase.config import PARTS_OF_SPEECH_DIR
+from betterpassphrase.wordlists import register_wordlists
+
+register_wordlists("clean", PARTS_OF_SPEECH_DIR, exclude=Blocklist.from_rules(["nine", "*ship*", r"re:^un"]))
+phrase = generate_phrase(6, "-", wordlists="clean")
+```
+
+In a blocklist file, each line is a rule: `*text*` for a substring, `re:pattern` for a
+regular expression, and anything else for an exact word. Blank lines and lines starting
+with `#` are ignored.
+"""
+import re
+from pathlib import Path
+from typing import Iterable, NamedTuple, Sequence
+
+
+_SUBSTRING = "*"
+_PATTERN = "re:"
+
+
+class Blocklist(NamedTuple):
+    """Rules excluding words from wordlists."""
+
+    words: frozenset[str] = frozenset()
+    """Words to exclude, in lower case."""
+
+    substrings: tuple[str, ...] = ()
+    """Substrings excluding the words containing them, in lower case."""
+
+    patterns: tuple[str, ...] = ()
+    """Regular expressions excluding the words they match."""
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[str]) -> "Blocklist":
+        """
+        Parse blocklist rules (see the module documentation for their syntax).
+
+        Args:
+            rules (Iterable[str]): The rules.
+
+        Returns:
+            Blocklist: The blocklist.
+
+        Raises:
+            ValueError: If a regular expression is invalid.
+        """
+        words, substrings, patterns = set(), [], []
+        for rule in map(str.strip, rules):
+            if not rule or rule.startswith("#"):
+                continue
+            if rule.startswith(_PATTERN):
+                pattern = rule[len(_PATTERN):]
+                try:
+                    # Checked as `filter` compiles it, within a group of the combined expression
+                    re.compile(_group(pattern))
+                except re.error as e:
+                    raise ValueError(f"Invalid pattern {pattern!r}: {e}")
+                patterns.append(pattern)
+            elif len(rule) > 2 and rule.startswith(_SUBSTRING) and rule.endswith(_SUBSTRING):
+                substrings.append(rule[1:-1].lower())
+            else:
+                words.add(rule.lower())
+        try:
+            # Patterns can also conflict with each other (e.g. with the same group names)
+            re.compile("|".join(map(_group, patterns)))
+        except re.error as e:
+            raise ValueError(f"Invalid patterns {patterns!r}: {e}")
+        return cls(frozenset(words), tuple(substrings), tuple(patterns))
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "Blocklist":
+        """
+        Read a blocklist file, one rule per line.
+
+        Args:
+            path (Path | str): The path to the file.
+
+        Returns:
+            Blocklist: The blocklist.
+
+        Raises:
+            ValueError: If a regular expression is invalid.
+        """
+        return cls.from_rules(Path(path).read_text().splitlines())
+
+    def filter(self, words: Sequence[str]) -> list[str]:
+        """
+        The words the blocklist allows, in order.
+
+        Args:
+            words (Sequence[str]): The words.
+
+        Returns:
+            list[str]: The allowed words.
+        """
+        # Substrings and patterns are matched in a single pass, as one regular expression
+        rules = [*map(re.escape, self.substrings), *map(_group, self.patterns)]
+        search = re.compile("|".join(rules), re.IGNORECASE).search if rules else None
+        return [
+            word for word in words
+            if word.lower() not in self.words and not (search and search(word))
+        ]
+
+
+def _group(pattern: str) -> str:
+    """A regular expression as a group, to be combined with others."""
+    return f"(?:{pattern})"
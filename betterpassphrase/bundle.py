@@ -0,0 +1,284 @@
+"""
+Precompiled, memory-mappable wordlist bundle.
+
+All parts of speech wordlists are compiled into a single binary file with the layout:
+
+```
+header   : magic (4s), version (H), section count (H), checksum of the sources (32s)
+sections : name (32s), first offset index (I), word count (I)     -- one per section
+offsets  : file positions of the word boundaries (I)              -- words + sections
+data     : UTF-8 encoded words, back to back
+```
+
+Word `i` of a section spans `bundle[offsets[first + i]:offsets[first + i + 1]]`. All
+integers are little-endian. The bundle is loaded with `mmap` and words are decoded on
+access, so no list of strings has to be built up front.
+"""
+import os
+import sys
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from .config import PARTS_OF_SPEECH_DIR, WORDLIST_BUNDLE_PATH
+
+
+MAGIC = b"BPWL"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH32s")
+_SECTION = struct.Struct("<32sII")
+_OFFSET_SIZE = 4
+
+
+def read_wordlist(path: Path) -> list[str]:
+    """
+    Parse a wordlist text file (one word per line).
+
+    Args:
+        path (Path): The path to the wordlist file.
+
+    Returns:
+        list[str]: List of words (empty if the file does not exist).
+    """
+    if not path.exists():
+        return []
+    return [x.strip() for x in path.read_text().splitlines()]
+
+
+def source_checksum(directory: Path, names: Iterable[str]) -> bytes:
+    """
+    SHA-256 checksum of the wordlist text files a bundle is built from.
+
+    Args:
+        directory (Path): The directory containing the wordlist files.
+        names (Iterable[str]): The wordlist file names, in section order.
+
+    Returns:
+        bytes: The 32 byte digest.
+    """
+    # Imported here, as it is slow to import and only needed when loading or building a bundle
+    import hashlib
+
+    digest = hashlib.sha256()
+    for name in names:
+        path = directory / name
+        digest.update(name.encode() + b"\0")
+        digest.update(path.read_bytes() if path.exists() else b"")
+        digest.update(b"\0")
+    return digest.digest()
+
+
+class BundleSection(Sequence[str]):
+    """
+    A read-only view of one wordlist inside a `WordlistBundle`.
+
+    Words are decoded from the bundle the first time they are accessed and memoized,
+    so repeated picks of the same word cost a single list lookup.
+    """
+
+    __slots__ = ("name", "_buffer", "_offsets", "_first", "_decoded")
+
+    def __init__(self, name: str, buffer: mmap.mmap | memoryview, offsets: memoryview, first: int, count: int):
+        self.name = name
+        self._buffer = buffer
+        self._offsets = offsets
+        self._first = first
+        self._decoded: list[str | None] = [None] * count
+
+    def __len__(self) -> int:
+        return len(self._decoded)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._decoded)))]
+        word = self._decoded[index]
+        if word is None:
+            position = self._first + index % len(self._decoded)
+            word = str(self._buffer[self._offsets[position]:self._offsets[position + 1]], "utf-8")
+            self._decoded[index] = word
+        return word
+
+    def __repr__(self) -> str:
+        return f"BundleSection({self.name!r}, {len(self._decoded)} words)"
+
+
+class WordlistBundle:
+    """A memory-mapped wordlist bundle, indexable by wordlist file name."""
+
+    def __init__(self, path: Path | None = None, buffer: memoryview | None = None):
+        """
+        Args:
+            path (Path | None): The path to the bundle file, mapped into memory.
+            buffer (memoryview | None): The bundle itself, if it is already in memory
+                                        (e.g. in shared memory, see `shared`).
+
+        Raises:
+            ValueError: If the file or buffer is not a valid bundle for this platform.
+        """
+        self.path = None if path is None else Path(path)
+        if buffer is not None:
+            self._buffer = buffer
+        elif self.path is not None:
+            with open(self.path, "rb") as f:
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            raise ValueError("A wordlist bundle needs a path or a buffer")
+        source = self.path or "<buffer>"
+
+        try:
+            magic, version, count, self.checksum = _HEADER.unpack_from(self._buffer, 0)
+            sections = [
+                _SECTION.unpack_from(self._buffer, _HEADER.size + i * _SECTION.size)
+                for i in range(count)
+            ]
+        except struct.error:
+            raise ValueError(f"Invalid wordlist bundle: {source}")
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Invalid wordlist bundle: {source}")
+
+        # The offsets table is read in place, which requires a little-endian platform
+        if sys.byteorder != "little":
+            raise ValueError("Wordlist bundles are only supported on little-endian platforms")
+
+        offsets_start = _HEADER.size + count * _SECTION.size
+        offsets_end = offsets_start + (sum(words for *_, words in sections) + count) * _OFFSET_SIZE
+        if len(self._buffer) < offsets_end:
+            raise ValueError(f"Invalid wordlist bundle: {source}")
+        offsets = memoryview(self._buffer)[offsets_start:offsets_end].cast("I")
+
+        self._sections = {
+            (name := raw_name.rstrip(b"\0").decode()): BundleSection(name, self._buffer, offsets, first, words)
+            for raw_name, first, words in sections
+        }
+
+    @property
+    def size(self) -> int:
+        """The size of the bundle in bytes."""
+        return len(self._buffer)
+
+    def copy_into(self, target: memoryview) -> None:
+        """Copy the whole bundle into a writable buffer of at least `size` bytes."""
+        target[:len(self._buffer)] = self._buffer
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def __getitem__(self, name: str) -> BundleSection:
+        return self._sections[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+
+def encode_bundle(names: Sequence[str], wordlists: Sequence[Sequence[str]], checksum: bytes) -> bytes:
+    """
+    Encode wordlists as a bundle.
+
+    Args:
+        names (Sequence[str]): The name of each section.
+        wordlists (Sequence[Sequence[str]]): The words of each section.
+        checksum (bytes): The 32 byte checksum of the sources (see `source_checksum`).
+
+    Returns:
+        bytes: The bundle.
+    """
+    encoded = [[word.encode() for word in words] for words in wordlists]
+
+    offsets_start = _HEADER.size + len(names) * _SECTION.size
+    position = offsets_start + (sum(map(len, encoded)) + len(names)) * _OFFSET_SIZE
+
+    sections, offsets = [], []
+    for name, words in zip(names, encoded):
+        sections.append(_SECTION.pack(name.encode(), len(offsets), len(words)))
+        for word in words:
+            offsets.append(position)
+            position += len(word)
+        offsets.append(position)
+
+    return b"".join([
+        _HEADER.pack(MAGIC, VERSION, len(names), checksum),
+        *sections,
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        *(word for words in encoded for word in words),
+    ])
+
+
+def build_bundle(
+    names: Sequence[str],
+    directory: Path = PARTS_OF_SPEECH_DIR,
+    path: Path = WORDLIST_BUNDLE_PATH,
+) -> Path:
+    """
+    Compile wordlist text files into a bundle.
+
+    The bundle is written to a temporary file first and then moved into place, so
+    readers never observe a partially written bundle.
+
+    Args:
+        names (Sequence[str]): The wordlist file names to include.
+        directory (Path): The directory containing the wordlist files.
+        path (Path): Where to write the bundle.
+
+    Returns:
+        Path: The path to the written bundle.
+    """
+    data = encode_bundle(
+        names, [read_wordlist(directory / name) for name in names], source_checksum(directory, names)
+    )
+
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_bundle(
+    names: Sequence[str],
+    directory: Path = PARTS_OF_SPEECH_DIR,
+    path: Path = WORDLIST_BUNDLE_PATH,
+    build: bool = True,
+) -> WordlistBundle | None:
+    """
+    Load the wordlist bundle, (re)building it if it is missing or stale.
+
+    Args:
+        names (Sequence[str]): The wordlist file names the bundle must contain.
+        directory (Path): The directory containing the wordlist files.
+        path (Path): The path to the bundle.
+        build (bool): Whether to build the bundle if it is missing or stale.
+
+    Returns:
+        WordlistBundle | None: The bundle, or `None` if no up-to-date bundle is available
+                               (e.g. it is stale and the directory is read-only).
+    """
+    checksum = source_checksum(directory, names)
+    try:
+        bundle = WordlistBundle(path)
+        if bundle.checksum == checksum and all(name in bundle for name in names):
+            return bundle
+    except (OSError, ValueError):
+        pass
+
+    if not build:
+        return None
+    try:
+        return WordlistBundle(build_bundle(names, directory, path))
+    except (OSError, ValueError):
+        return None
+
+
+if __name__ == "__main__":
+    from .models import PartsOfSpeech
+
+    print(build_bundle([pos.value for pos in PartsOfSpeech]))
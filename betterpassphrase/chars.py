@@ -0,0 +1,205 @@
+"""
+Passphrases bounded by their number of characters.
+
+Generating passphrases and discarding those that are too long (or too short) wastes
+most draws at tight limits. Instead, the words of each part of speech are indexed by
+their number of characters (see `WordlistSet.length_buckets`), and a dynamic-programming
+table over each combination counts the ways to complete a passphrase within the bounds.
+Words are then drawn straight from the valid ones, so every draw succeeds.
+
+```python
+from betterpassphrase import generate_phrase
+
+phrase = generate_phrase(length=5, sep="-", max_chars=24)
+assert len(phrase.passphrase) <= 24
+```
+
+Passphrases follow the same distribution as filtering unbounded ones would give: every
+valid passphrase is equally likely, as a combination is picked with a probability
+proportional to its number of valid passphrases (see `grammar`), then a valid passphrase
+of it uniformly. Their `entropy_bits` reflects the restricted space, i.e. the number of
+valid passphrases of their combination.
+"""
+from typing import NamedTuple
+
+from .generator import RandBelow
+from .grammar import AliasTable
+from .models import P, Passphrase
+from .wordlists import DEFAULT_WORDLISTS, WordlistSet
+from .mappings import UNIT_PHRASE_MAX_LENGTH, LENGTH_TO_WORD_COMBINATIONS_MAP
+
+
+Buckets = list[tuple[int, list[int]]]
+"""The word indices of a part of speech grouped by length, as `(length, indices)` pairs."""
+
+
+class CombinationTable(NamedTuple):
+    """The valid ways to fill a combination of parts of speech within character bounds."""
+
+    combination: list[P]
+    """The combination of parts of speech."""
+
+    buckets: list[Buckets]
+    """The length buckets of each position's part of speech."""
+
+    ways: list[list[int]]
+    """
+    Entry `[i][used]` is the number of ways to fill positions `i` onwards when the words
+    before them use `used` characters. Entry `[0][0]` is the number of valid passphrases.
+    """
+
+
+class CharPlan(NamedTuple):
+    """The combinations of a length that fit the character bounds, with their selection weights."""
+
+    tables: list[CombinationTable]
+    """The table of each combination with at least one valid passphrase."""
+
+    alias: AliasTable
+    """Alias table over the combinations, weighted by their numbers of valid passphrases."""
+
+
+def char_plan(
+    length: int,
+    sep: str,
+    min_chars: int | None,
+    max_chars: int | None,
+    wordlists: WordlistSet,
+) -> CharPlan:
+    """
+    The tables for generating passphrases of `length` words within character bounds.
+
+    Plans are cached per wordlist set, so they are only built once per set of arguments.
+
+    Args:
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words, counted in the number of characters.
+        min_chars (int | None): The minimum number of characters (`None` for no minimum).
+        max_chars (int | None): The maximum number of characters (`None` for no maximum).
+        wordlists (WordlistSet): The wordlist set to draw words from.
+
+    Returns:
+        CharPlan: The plan.
+
+    Raises:
+        ValueError: If `length` is not a unit phrase length, or no passphrase fits the bounds.
+    """
+    plans = wordlists.tables.setdefault("char_plans", {})
+    key = (length, len(sep), min_chars, max_chars)
+    plan = plans.get(key)
+    if plan is None:
+        plan = plans[key] = _char_plan(length, len(sep), min_chars, max_chars, wordlists)
+    return plan
+
+
+def _char_plan(
+    length: int,
+    sep_chars: int,
+    min_chars: int | None,
+    max_chars: int | None,
+    wordlists: WordlistSet,
+) -> CharPlan:
+    """Build the tables for `char_plan`."""
+    if length > UNIT_PHRASE_MAX_LENGTH or length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+        # Long passphrases are split at random, which would need a table per split
+        raise ValueError(
+            f"Character bounds only support passphrases of up to {UNIT_PHRASE_MAX_LENGTH} words, not {length}"
+        )
+
+    # Bounds on the characters of the words alone, without the separators
+    separators = sep_chars * (length - 1)
+    low = max(0, (min_chars or 0) - separators)
+    high = (max_chars - separators) if max_chars is not None else None
+
+    # Every bucket of every position, to bound the tables when there is no maximum
+    all_buckets = {pos: _buckets(pos, wordlists) for pos in P}
+    if high is None:
+        high = length * max(buckets[-1][0] for buckets in all_buckets.values())
+
+    tables = []
+    for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[length] if low <= high else []:
+        buckets = [all_buckets[pos] for pos in combination]
+        ways = _ways(buckets, low, high)
+        if ways[0][0]:
+            tables.append(CombinationTable(combination, buckets, ways))
+
+    if not tables:
+        raise ValueError(
+            f"No passphrase of {length} words has between {min_chars or 0} and {max_chars} characters"
+        )
+
+    return CharPlan(tables, AliasTable([table.ways[0][0] for table in tables]))
+
+
+def _buckets(pos: P, wordlists: WordlistSet) -> Buckets:
+    """The length buckets of a part of speech. An empty wordlist has a single empty word."""
+    buckets = wordlists.length_buckets(pos)
+    return list(buckets.items()) if buckets else [(0, [-1])]
+
+
+def _ways(buckets: list[Buckets], low: int, high: int) -> list[list[int]]:
+    """The `CombinationTable.ways` table for word characters between `low` and `high`."""
+    ways = [[0] * (high + 1) for _ in range(len(buckets) + 1)]
+    ways[-1][low:] = [1] * (high + 1 - low)
+    for index in range(len(buckets) - 1, -1, -1):
+        row, after = ways[index], ways[index + 1]
+        for used in range(high + 1):
+            row[used] = sum(
+                len(indices) * after[used + length]
+                for length, indices in buckets[index]
+                if used + length <= high
+            )
+    return ways
+
+
+def generate_bounded_phrase(
+    plan: CharPlan,
+    sep: str,
+    capitalize: bool,
+    randbelow: RandBelow,
+    wordlists: WordlistSet,
+) -> Passphrase:
+    """
+    Generate a passphrase within the character bounds of a plan.
+
+    Args:
+        plan (CharPlan): The plan (see `char_plan`).
+        sep (str): Separator between words (the one the plan was built for).
+        capitalize (bool): Whether to capitalize words.
+        randbelow (RandBelow): The source of randomness.
+        wordlists (WordlistSet): The wordlist set the plan was built from.
+
+    Returns:
+        Passphrase: Generated passphrase with metadata.
+    """
+    # Pick a combination by weight
+    table = plan.tables[plan.alias.sample(randbelow)]
+
+    # Pick each word among those that still leave a valid completion
+    lists = wordlists.lists
+    words: list[str] = []
+    used = 0
+    for pos, buckets, after in zip(table.combination, table.buckets, table.ways[1:]):
+        draw = randbelow(table.ways[len(words)][used])
+        for length, indices in buckets:
+            if used + length >= len(after):
+                break
+            count = len(indices) * after[used + length]
+            if draw < count:
+                index = indices[draw // after[used + length]]
+                words.append(lists[pos][index] if index >= 0 else "")
+                used += length
+                break
+            draw -= count
+
+    if capitalize:
+        words = [word.capitalize() for word in words]
+    return Passphrase(
+        words=words,
+        word_count=len(words),
+        separator=sep,
+        capitalize=capitalize,
+        sub_combinations=[table.combination],
+        wordlists=None if wordlists.name == DEFAULT_WORDLISTS else wordlists,
+        space=table.ways[0][0],
+    )
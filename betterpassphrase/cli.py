@@ -1,8 +1,74 @@
+import os
+import sys
 import argparse
+from contextlib import nullcontext
 
+from betterpassphrase.config import (
+    PARALLEL_CHUNK_SIZE,
+    PBKDF2_ITERATIONS,
+    PROVISION_CHUNK_SIZE,
+    SCRYPT_N,
+    VECTORIZED_MIN_PHRASES,
+)
 from betterpassphrase.models import Passphrase
-from betterpassphrase.utils import run_parallel_exec_but_return_in_order
-from .generator import generate_phrase
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.stats import STATS
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parse a shard specification of the form `i/N` (shard `i` of `N`, counting from 0).
+
+    Args:
+        value (str): The shard specification.
+
+    Returns:
+        tuple[int, int]: The shard index and the number of shards.
+    """
+    try:
+        shard, shards = map(int, value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard {value!r}, expected i/N")
+    if not 0 <= shard < shards:
+        raise argparse.ArgumentTypeError(f"invalid shard {value!r}, expected 0 <= i < N")
+    return shard, shards
+
+
+def format_phrase(phrase: Passphrase, verbosity: int = 0) -> str:
+    """
+    Format a passphrase for display at the given verbosity level.
+
+    Args:
+        phrase (Passphrase): The passphrase to format.
+        verbosity (int): 0 for passphrase only, 1 for basic info, 2 for detailed info.
+
+    Returns:
+        str: The formatted passphrase, including the trailing newline.
+    """
+    if verbosity == 0:
+        # Only the passphrase
+        return f"{phrase.passphrase}\n"
+
+    if verbosity == 1:
+        # Basic info
+        return (
+            "\n"
+            f"Generated phrase: {phrase.passphrase}\n"
+            f"Word count:       {phrase.word_count}\n"
+        )
+
+    # Detailed info
+    pos_sep = ", "
+    phrase_sep = "\n                        "
+    return (
+        "\n"
+        f"Generated phrase:       {phrase.passphrase}\n"
+        f"Word count:             {phrase.word_count}\n"
+        f"Wordlist Probability:   {phrase.wordlist_probability:.2e}\n"
+        f"Character Probability:  {phrase.character_probability:.2e}\n"
+        f"Entropy:                {phrase.entropy_bits:.1f} bits\n"
+        f"Parts of speech:        {phrase_sep.join(pos_sep.join(pos.name.lower() for pos in phrase) for phrase in phrase.sub_combinations)}\n\n"
+    )
 
 
 def main(_args: list[str] = None):
@@ -19,6 +85,31 @@ def main(_args: list[str] = None):
         help="Number of words in the phrase (default: 6).",
     )
 
+    # -b flag for a minimum entropy instead of a fixed length
+    parser.add_argument(
+        "-b",
+        "--min-bits",
+        type=float,
+        default=None,
+        help="Use the fewest words giving at least this many bits of entropy, overriding --length (default: off).",
+    )
+
+    # --min-chars flag for a minimum number of characters
+    parser.add_argument(
+        "--min-chars",
+        type=int,
+        default=None,
+        help="Minimum number of characters in the phrase, separators included (default: no minimum).",
+    )
+
+    # --max-chars flag for a maximum number of characters
+    parser.add_argument(
+        "--max-chars",
+        type=int,
+        default=None,
+        help="Maximum number of characters in the phrase, separators included (default: no maximum).",
+    )
+
     # -s flag for separator
     parser.add_argument(
         "-s",
@@ -54,6 +145,112 @@ def main(_args: list[str] = None):
         help="Number of phrases to generate (default: 1).",
     )
 
+    # -w flag for number of worker processes
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=0,
+        help="Number of worker processes for generating multiple phrases (default: 0, one per CPU core).",
+    )
+
+    # -k flag for number of phrases per output chunk
+    parser.add_argument(
+        "-k",
+        "--chunk-size",
+        type=int,
+        default=None,
+        help=f"Number of phrases generated and written at a time (default: {PARALLEL_CHUNK_SIZE}, "
+        f"or {PROVISION_CHUNK_SIZE} with --kdf).",
+    )
+
+    # --shard flag for generating from a disjoint slice of all passphrases
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        metavar="i/N",
+        help="Only generate passphrases from shard i of N disjoint shards of all passphrases (default: no sharding).",
+    )
+
+    # --wordlists flag for a custom wordlist directory
+    parser.add_argument(
+        "--wordlists",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help="Directory with one wordlist file per part of speech (default: the built-in wordlists).",
+    )
+
+    # --exclude flag for a blocklist file
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Blocklist file of words never to use: one word, *substring* or re:pattern per line (default: none).",
+    )
+
+    # --shm flag for sharing the wordlists with the worker processes
+    parser.add_argument(
+        "--shm",
+        action="store_true",
+        help="Publish the wordlists in shared memory once, for worker processes to attach to instead "
+        "of each loading them (default: False).",
+    )
+
+    # -u flag for guaranteed-unique phrases
+    parser.add_argument(
+        "-u",
+        "--unique",
+        action="store_true",
+        help="Never generate the same phrase twice in one run (default: False).",
+    )
+
+    # --seed flag for reproducible (insecure) phrases
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="INSECURE: generate reproducible phrases from this seed, for tests only (default: secure randomness).",
+    )
+
+    # --stats flag for printing instrumentation counters and timings
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print generation statistics and per-stage timings to stderr when done (default: False).",
+    )
+
+    # --format flag for structured export
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=["text", "ndjson", "csv", "tsv"],
+        default="text",
+        help="Output format: text, or records with metadata as ndjson, csv or tsv, written to the output "
+        "file if given, otherwise to stdout (default: text).",
+    )
+
+    # --kdf flag for provisioning hashed credentials
+    parser.add_argument(
+        "--kdf",
+        type=str,
+        choices=["scrypt", "pbkdf2"],
+        default=None,
+        help="Provision credentials: hash each phrase with this key derivation function, and output "
+        "(id, phrase, hash) records, one per line (default: no hashing).",
+    )
+
+    # --kdf-cost flag for the cost of the key derivation function
+    parser.add_argument(
+        "--kdf-cost",
+        type=int,
+        default=None,
+        help="Cost of the key derivation function: scrypt N (a power of 2) or PBKDF2 iterations "
+        f"(default: {SCRYPT_N} for scrypt, {PBKDF2_ITERATIONS} for PBKDF2).",
+    )
+
     # -v flag for verbosity level
     parser.add_argument(
         "-v",
@@ -68,42 +265,217 @@ def main(_args: list[str] = None):
 
     capitalize = args.capitalize
 
-    if args.num_phrases >= 1:
-        phrases: list[Passphrase] = run_parallel_exec_but_return_in_order(
-            generate_phrase,
-            [args.length] * args.num_phrases, 
-            args.sep, 
-            capitalize, 
-        )
-    else:
+    if args.num_phrases < 1:
         print("Invalid number of phrases to generate.")
         exit(1)
 
-    for i, phrase in enumerate(phrases):
-        if args.output:
-            _mode = "w" if i == 0 else "a"
-            with open(args.output, _mode) as f:
-                f.write(f"{phrase.passphrase}\n")
-
-        pos_sep = ", "
-        phrase_sep = "\n                        "
-
-        if args.verbosity == 0:
-            # Only the passphrase
-            print(phrase.passphrase)
-        elif args.verbosity == 1:
-            # Basic info
-            print()
-            print(f"Generated phrase: {phrase.passphrase}")
-            print(f"Word count:       {phrase.word_count}")
-        elif args.verbosity == 2:
-            # Detailed info
-            print()
-            print(f"Generated phrase:       {phrase.passphrase}")
-            print(f"Word count:             {phrase.word_count}")
-            print(f"Wordlist Probability:   {phrase.wordlist_probability:.2e}")
-            print(f"Character Probability:  {phrase.character_probability:.2e}")
-            print(f"Parts of speech:        {phrase_sep.join(pos_sep.join(pos.name.lower() for pos in phrase) for phrase in phrase.sub_combinations)}\n")
+    if args.workers < 0:
+        print("Invalid number of workers.")
+        exit(1)
+
+    if args.chunk_size is None:
+        # Hashing is slow, so credentials are provisioned in smaller chunks
+        args.chunk_size = PROVISION_CHUNK_SIZE if args.kdf is not None else PARALLEL_CHUNK_SIZE
+    if args.chunk_size < 1:
+        print("Invalid chunk size.")
+        exit(1)
+
+    if args.stats:
+        STATS.enable()
+
+    # Only import what the options need, to keep startup fast
+    if args.unique:
+        from betterpassphrase.unique import check_separable
+
+        try:
+            check_separable(args.sep, capitalize)
+        except ValueError as e:
+            print(f"Invalid separator for unique phrases: {e}.")
+            exit(1)
+
+    if args.min_bits is not None and (args.min_bits < 0 or args.shard or args.unique):
+        print("Invalid entropy target: must be positive, and cannot be combined with --shard or --unique.")
+        exit(1)
+
+    if (args.min_chars is not None or args.max_chars is not None) and (
+        args.min_bits is not None or args.shard or args.unique
+    ):
+        print("Invalid character bounds: cannot be combined with --min-bits, --shard or --unique.")
+        exit(1)
+
+    if args.seed is not None:
+        if args.shard or args.unique:
+            print("Invalid seed: cannot be combined with --shard or --unique.")
+            exit(1)
+        print("Warning: seeded phrases are reproducible and NOT SECURE, only use them for tests.", file=sys.stderr)
+
+    if args.kdf is not None:
+        from betterpassphrase.provision import resolve_cost
+
+        if args.shard or args.unique or args.seed is not None or args.verbosity:
+            print("Invalid KDF: cannot be combined with --shard, --unique, --seed or --verbosity.")
+            exit(1)
+        try:
+            resolve_cost(args.kdf, args.kdf_cost)
+        except ValueError as e:
+            print(f"Invalid KDF cost: {e}.")
+            exit(1)
+
+    if args.shard:
+        from betterpassphrase.codec import shard_range
+
+    wordlists = None
+    if args.wordlists:
+        from betterpassphrase.wordlists import register_wordlists
+
+        try:
+            wordlists = os.path.abspath(args.wordlists)
+            register_wordlists(wordlists, wordlists)
+        except ValueError as e:
+            print(f"Invalid wordlists: {e}.")
+            exit(1)
+        if args.shard or args.unique:
+            print("Invalid wordlists: --shard and --unique only support the built-in wordlists.")
+            exit(1)
+
+    if args.exclude:
+        from betterpassphrase.blocklist import Blocklist
+        from betterpassphrase.config import PARTS_OF_SPEECH_DIR
+        from betterpassphrase.wordlists import register_wordlists
+
+        if args.shard or args.unique:
+            print("Invalid blocklist: cannot be combined with --shard or --unique.")
+            exit(1)
+        try:
+            exclude = Blocklist.from_file(args.exclude)
+        except (OSError, ValueError) as e:
+            print(f"Invalid blocklist: {e}.")
+            exit(1)
+        # The filtered wordlists are a set of their own, loaded once
+        directory = wordlists or PARTS_OF_SPEECH_DIR
+        wordlists = f"{directory} excluding {os.path.abspath(args.exclude)}"
+        register_wordlists(wordlists, directory, exclude)
+
+    # Large batches of bare passphrases are generated as strings, by the NumPy backend if installed
+    vectorized = (
+        args.kdf is None
+        and args.format == "text"
+        and args.verbosity == 0
+        and args.num_phrases >= VECTORIZED_MIN_PHRASES
+        and not (args.shard or args.unique)
+        and all(value is None for value in (args.seed, args.min_bits, args.min_chars, args.max_chars))
+    )
+    if args.kdf is not None:
+        from betterpassphrase.provision import iter_credential_batches
+
+        try:
+            batches = iter_credential_batches(
+                args.num_phrases,
+                args.length,
+                args.sep,
+                capitalize,
+                kdf=args.kdf,
+                cost=args.kdf_cost,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                wordlists=wordlists,
+                min_bits=args.min_bits,
+                min_chars=args.min_chars,
+                max_chars=args.max_chars,
+            )
+        except ValueError as e:
+            print(f"Invalid length: {e}.")
+            exit(1)
+    elif vectorized:
+        from betterpassphrase.vectorized import iter_passphrase_string_batches
+
+        batches = iter_passphrase_string_batches(
+            args.num_phrases,
+            args.length,
+            args.sep,
+            capitalize,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            wordlists=wordlists,
+            share_wordlists=args.shm,
+        )
+    else:
+        try:
+            batches = iter_phrase_batches(
+                args.num_phrases,
+                args.length,
+                args.sep,
+                capitalize,
+                workers=args.workers,
+                chunk_size=args.chunk_size,
+                ranks=shard_range(*args.shard, args.length) if args.shard else None,
+                unique=args.unique,
+                wordlists=wordlists,
+                min_bits=args.min_bits,
+                min_chars=args.min_chars,
+                max_chars=args.max_chars,
+                seed=args.seed,
+                share_wordlists=args.shm,
+            )
+        except ValueError as e:
+            # The entropy target or character bounds cannot be met
+            print(f"Invalid length: {e}.")
+            exit(1)
+
+    if args.format != "text":
+        from betterpassphrase.export import FIELDS, export_batch, export_header
+
+        fields, format_records = FIELDS, export_batch
+        if args.kdf is not None:
+            from betterpassphrase.provision import CREDENTIAL_FIELDS, export_credentials
+
+            fields, format_records = CREDENTIAL_FIELDS, export_credentials
+
+    # Stream each batch out as a single write, through one handle per destination
+    with open(args.output, "w") if args.output else nullcontext() as outfile:
+        try:
+            if args.format != "text":
+                (outfile or sys.stdout).write(export_header(args.format, fields))
+            while True:
+                with STATS.timer("cli.generate"):
+                    try:
+                        batch = next(batches, None)
+                    except ValueError as e:
+                        # Raised while generating, e.g. when fewer unique phrases exist than requested
+                        print(f"\n{e}.", file=sys.stderr)
+                        exit(1)
+                if batch is None:
+                    break
+                if args.format != "text":
+                    # Records go to a single destination
+                    with STATS.timer("cli.format"):
+                        records = format_records(batch, args.format)
+                    with STATS.timer("cli.write"):
+                        (outfile or sys.stdout).write(records)
+                    if STATS.enabled:
+                        STATS.count("cli.phrases", len(batch))
+                    continue
+
+                with STATS.timer("cli.format"):
+                    # Batches hold passphrases, their strings if vectorized, or credentials
+                    lines = "".join(f"{phrase}\n" for phrase in batch) if outfile or not args.verbosity else ""
+                    text = lines if not args.verbosity else "".join(
+                        format_phrase(phrase, args.verbosity) for phrase in batch
+                    )
+                with STATS.timer("cli.write"):
+                    if outfile:
+                        outfile.write(lines)
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                if STATS.enabled:
+                    STATS.count("cli.phrases", len(batch))
+        except BrokenPipeError:
+            # The reader went away (e.g. piped into `head`), stop quietly
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            exit(1)
+
+    if args.stats:
+        print(STATS.format(), file=sys.stderr)
 
 
 if __name__ == "__main__":
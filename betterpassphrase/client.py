@@ -0,0 +1,196 @@
+"""
+Thin client for the passphrase daemon (see `daemon`).
+
+Only talks to the daemon's Unix socket, so it does not load any wordlists itself.
+"""
+import os
+import json
+import socket
+import struct
+import getpass
+import argparse
+import tempfile
+
+from .config import DAEMON_SOCKET_PATH
+
+
+def default_socket_path() -> str:
+    """
+    The path of the daemon's Unix socket, when none is given.
+
+    `DAEMON_SOCKET_PATH` if set, otherwise a socket in the user's runtime directory, or in a
+    private per-user directory (created by the daemon) under the temporary directory if
+    there is none. Resolved on call, so that importing the package never looks up the user.
+
+    Returns:
+        str: The path of the socket.
+    """
+    if DAEMON_SOCKET_PATH is not None:
+        return DAEMON_SOCKET_PATH
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = "default"
+        directory = os.path.join(tempfile.gettempdir(), f"betterpassphrase-{user}")
+    return os.path.join(directory, "betterpassphrase.sock")
+
+
+class PassphraseClient:
+    """A connection to the passphrase daemon, reused across requests."""
+
+    def __init__(self, path: str | None = None, timeout: float | None = 10.0):
+        """
+        Args:
+            path (str | None): The path of the daemon's Unix socket (see `default_socket_path`).
+            timeout (float | None): Socket timeout in seconds (`None` to wait forever).
+        """
+        self.path = path or default_socket_path()
+        self.timeout = timeout
+        self._socket: socket.socket | None = None
+        self._reader = None
+
+    def connect(self) -> "PassphraseClient":
+        """Connect to the daemon (done automatically by the first request)."""
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(self.timeout)
+            try:
+                self._socket.connect(self.path)
+                self._check_peer()
+            except OSError:
+                self.close()
+                raise
+            self._reader = self._socket.makefile("rb")
+        return self
+
+    def _check_peer(self) -> None:
+        """
+        Check that the daemon runs as the current user, so passphrases are never taken from
+        a socket someone else planted at the path.
+
+        Raises:
+            PermissionError: If the daemon belongs to another user.
+        """
+        if hasattr(socket, "SO_PEERCRED"):
+            credentials = self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            _, uid, _ = struct.unpack("3i", credentials)
+        else:
+            # No peer credentials on this platform: trust the owner of the socket file instead
+            uid = os.stat(self.path).st_uid
+        if uid != os.getuid():
+            raise PermissionError(f"The socket {self.path} belongs to another user (uid {uid})")
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def request(self, n: int = 1, length: int = 6, sep: str = "", capitalize: bool = True) -> list[str]:
+        """
+        Request passphrases from the daemon.
+
+        Args:
+            n (int): The number of passphrases.
+            length (int): The number of words in each passphrase.
+            sep (str): Separator between words.
+            capitalize (bool): Whether to capitalize words.
+
+        Returns:
+            list[str]: The passphrases.
+
+        Raises:
+            OSError: If the daemon cannot be reached.
+            ValueError: If the daemon rejected the request.
+        """
+        self.connect()
+        request = {"n": n, "length": length, "sep": sep, "capitalize": capitalize}
+        self._socket.sendall(json.dumps(request).encode() + b"\n")
+        line = self._reader.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("The passphrase daemon closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["phrases"]
+
+    def __enter__(self) -> "PassphraseClient":
+        return self.connect()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(_args: list[str] = None):
+    parser = argparse.ArgumentParser(description="Get passphrases from a running passphrase daemon.")
+
+    # -l flag for phrase length
+    parser.add_argument(
+        "-l",
+        "--length",
+        type=int,
+        default=6,
+        help="Number of words in the phrase (default: 6).",
+    )
+
+    # -s flag for separator
+    parser.add_argument(
+        "-s",
+        "--sep",
+        type=str,
+        default="-",
+        help="Separator between words (default: -).",
+    )
+
+    # -c flag for capitalization
+    parser.add_argument(
+        "-c",
+        "--capitalize",
+        action="store_true",
+        help="Capitalize the phrase (default: False).",
+    )
+
+    # -n flag for generating multiple phrases
+    parser.add_argument(
+        "-n",
+        "--num-phrases",
+        type=int,
+        default=1,
+        help="Number of phrases to get (default: 1).",
+    )
+
+    socket_path = default_socket_path()
+
+    # -S flag for the socket path
+    parser.add_argument(
+        "-S",
+        "--socket",
+        type=str,
+        default=socket_path,
+        help=f"Path of the daemon's Unix socket (default: {socket_path}).",
+    )
+
+    args = parser.parse_args(_args)
+
+    try:
+        with PassphraseClient(args.socket) as client:
+            phrases = client.request(args.num_phrases, args.length, args.sep, args.capitalize)
+    except OSError as e:
+        print(f"Could not reach the passphrase daemon at {args.socket}: {e}.")
+        exit(1)
+    except ValueError as e:
+        print(f"Invalid request: {e}.")
+        exit(1)
+
+    print("\n".join(phrases))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,501 @@
+"""
+Bijective codec between integers and passphrases.
+
+Every passphrase that can be generated for a requested length is assigned a rank in
+`[0, phrase_space(length))`. Ranks are decoded with mixed-radix arithmetic over the
+combinations in `LENGTH_TO_WORD_COMBINATIONS_MAP`, the wordlist sizes and, for long
+passphrases, the valid splits into sub-phrases (see `generator.generate_lengths`):
+
+```
+rank -> split into sub-phrase lengths -> combination of each sub-phrase -> word indices
+```
+
+Disjoint rank ranges therefore map to disjoint sets of passphrases, which allows
+generation to be sharded across nodes without coordination (see `shard_range`).
+
+Ranks are defined over the default wordlist set. Each call resolves the set once and
+reads its tables from it (they are kept on the set, see `build_tables`), so a set
+swapped in by `reload` is only seen by later calls.
+"""
+from collections import Counter
+from functools import cache
+from itertools import product
+from typing import Iterator, Sequence
+
+from .config import BUFFER
+from .generator import RandBelow
+from .models import P, Passphrase
+from .sampling import EntropyPool
+from .wordlists import WordlistSet, get_wordlists
+from .mappings import (
+    UNIT_PHRASE_LENGTHS,
+    UNIT_PHRASE_MAX_LENGTH,
+    LENGTH_TO_WORD_COMBINATIONS_MAP,
+)
+
+
+def unit_phrase_space(length: int) -> int:
+    """
+    Number of different passphrases of a length with its own combinations.
+
+    Args:
+        length (int): The number of words (must be in `UNIT_PHRASE_LENGTHS`).
+
+    Returns:
+        int: The number of passphrases.
+    """
+    if length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+        raise ValueError(f"Cannot generate phrase of length {length}")
+    return _unit_spaces(get_wordlists())[length]
+
+
+def _split_spaces(length: int, buffer: int, wordlists: WordlistSet) -> tuple[int, ...]:
+    """
+    Number of passphrases that complete a split into sub-phrases, by total so far.
+
+    Same table as `generator.length_partition_counts`, with each sub-phrase length
+    weighted by its number of passphrases and each joining conjunction by the size
+    of the conjunctions wordlist. Cached on the wordlist set.
+    """
+    cached = wordlists.tables.setdefault("split_spaces", {})
+    spaces = cached.get((length, buffer))
+    if spaces is not None:
+        return spaces
+
+    options = [x for x in UNIT_PHRASE_LENGTHS if x != 1]
+    unit_spaces = _unit_spaces(wordlists)
+    conjunctions = wordlists.n(P.CONJUNCTION)
+    spaces = [0] * (length + buffer + 1)
+    for total in range(length + buffer, -1, -1):
+        if total >= length:
+            spaces[total] = 1
+            continue
+        joiners = conjunctions if total else 1
+        spaces[total] = sum(
+            joiners * unit_spaces[option] * spaces[after]
+            for option in options
+            if (after := total + option + (1 if total else 0)) <= length + buffer
+        )
+    spaces = cached[(length, buffer)] = tuple(spaces)
+    return spaces
+
+
+def phrase_space(length: int, buffer: int = BUFFER) -> int:
+    """
+    Number of different passphrases that can be generated for a requested length.
+
+    Args:
+        length (int): The requested number of words.
+        buffer (int): The buffer used to split long passphrases into sub-phrases.
+
+    Returns:
+        int: The number of passphrases, i.e. the exclusive upper bound of their ranks.
+    """
+    return _phrase_space(length, buffer, get_wordlists())
+
+
+def _phrase_space(length: int, buffer: int, wordlists: WordlistSet) -> int:
+    """`phrase_space` for the given wordlist set."""
+    if length <= UNIT_PHRASE_MAX_LENGTH:
+        if length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+            raise ValueError(f"Cannot generate phrase of length {length}")
+        return _unit_spaces(wordlists)[length]
+    return _split_spaces(length, max(3, buffer), wordlists)[0]
+
+
+def unrank(
+    rank: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    buffer: int = BUFFER,
+) -> Passphrase:
+    """
+    Decode a rank into its passphrase.
+
+    Args:
+        rank (int): The rank, in `[0, phrase_space(length))`.
+        length (int): The requested number of words.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        buffer (int): The buffer used to split long passphrases into sub-phrases.
+
+    Returns:
+        Passphrase: The passphrase with that rank.
+    """
+    wordlists = get_wordlists()
+    space = _phrase_space(length, buffer, wordlists)
+    if not 0 <= rank < space:
+        raise ValueError(f"Rank {rank} is out of range for phrases of length {length}")
+
+    sub_phrases: list[tuple[list[P], list[int]]] = []
+    if length <= UNIT_PHRASE_MAX_LENGTH:
+        sub_phrases.append(_unrank_unit(rank, length, wordlists))
+    else:
+        buffer = max(3, buffer)
+        spaces = _split_spaces(length, buffer, wordlists)
+        unit_spaces = _unit_spaces(wordlists)
+        total = 0
+        while total < length:
+            for option in UNIT_PHRASE_LENGTHS:
+                after = total + option + (1 if total else 0)
+                if option == 1 or after > length + buffer:
+                    continue
+                joiners = wordlists.n(P.CONJUNCTION) if total else 1
+                block = joiners * unit_spaces[option] * spaces[after]
+                if rank < block:
+                    break
+                rank -= block
+
+            # Within the block: conjunction, then the sub-phrase, then the rest of the split
+            rank, rest = divmod(rank, spaces[after])
+            conjunction, unit_rank = divmod(rank, unit_spaces[option])
+            if total:
+                sub_phrases.append(([P.CONJUNCTION], [conjunction]))
+            sub_phrases.append(_unrank_unit(unit_rank, option, wordlists))
+            rank, total = rest, after
+
+    lists = wordlists.lists
+    words = [
+        lists[pos][index]
+        for combination, indices in sub_phrases
+        for pos, index in zip(combination, indices)
+    ]
+    if capitalize:
+        words = [word.capitalize() for word in words]
+
+    return Passphrase(
+        words=words,
+        word_count=len(words),
+        separator=sep,
+        capitalize=capitalize,
+        sub_combinations=[combination for combination, _ in sub_phrases],
+    )
+
+
+def rank(
+    phrase: Passphrase | str | Sequence[str],
+    length: int | None = None,
+    sep: str = "-",
+    buffer: int = BUFFER,
+) -> int:
+    """
+    Encode a passphrase into its rank.
+
+    A `Passphrase` is encoded using its own combinations. Strings (split on `sep`) and
+    word sequences are parsed by looking each word up in the wordlists of the parts of
+    speech it could stand for (see `PartsOfSpeech.word_indices`). A word may belong to
+    several wordlists (or appear twice in one), so a string can have more than one rank;
+    the lowest one is returned.
+
+    Args:
+        phrase (Passphrase | str | Sequence[str]): The passphrase to encode.
+        length (int | None): The requested number of words the rank is relative to
+                             (defaults to the number of words in the passphrase).
+        sep (str): Separator between words, when `phrase` is a string.
+        buffer (int): The buffer used to split long passphrases into sub-phrases.
+
+    Returns:
+        int: The rank, in `[0, phrase_space(length))`.
+
+    Raises:
+        ValueError: If the passphrase cannot be generated for the requested length.
+    """
+    if isinstance(phrase, Passphrase):
+        words = phrase.words
+        combinations = [tuple(combination) for combination in phrase.sub_combinations]
+    else:
+        words = phrase.split(sep) if isinstance(phrase, str) else list(phrase)
+        combinations = None
+
+    wordlists = get_wordlists()
+    lookup = _word_lookup(wordlists)
+    entries = [lookup.get(word.lower(), {}) for word in words]
+    length = len(words) if length is None else length
+    buffer = max(3, buffer)
+
+    result = None
+    if length <= UNIT_PHRASE_MAX_LENGTH:
+        if len(words) == length and (combinations is None or len(combinations) == 1):
+            result = _rank_unit(entries, wordlists, combinations[0] if combinations else None)
+    else:
+        result = _rank_split(entries, combinations, length, buffer, wordlists)
+
+    if result is None:
+        raise ValueError(f"Not a passphrase of length {length}: {' '.join(words)!r}")
+    return result
+
+
+def shard_range(shard: int, shards: int, length: int, buffer: int = BUFFER) -> range:
+    """
+    The ranks assigned to one of `shards` equally sized, disjoint shards.
+
+    Args:
+        shard (int): The shard index, in `[0, shards)`.
+        shards (int): The total number of shards.
+        length (int): The requested number of words.
+        buffer (int): The buffer used to split long passphrases into sub-phrases.
+
+    Returns:
+        range: The ranks of the shard.
+    """
+    if not 0 <= shard < shards:
+        raise ValueError(f"Invalid shard {shard}/{shards}")
+    space = phrase_space(length, buffer)
+    return range(space * shard // shards, space * (shard + 1) // shards)
+
+
+def iter_ranked_phrases(
+    n: int | None,
+    ranks: range,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    randbelow: RandBelow | None = None,
+) -> Iterator[Passphrase]:
+    """
+    Generate passphrases whose ranks are drawn uniformly from `ranks`.
+
+    Every passphrase within the range is equally likely. Drawing from the disjoint
+    ranges of `shard_range` lets independent nodes generate without ever producing
+    the same passphrase as another node.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for no limit).
+        ranks (range): The ranks to draw from (a contiguous range).
+        length (int): The requested number of words.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        randbelow (RandBelow | None): Function used to draw random integers
+                                      (defaults to a block-buffered entropy pool).
+
+    Yields:
+        Passphrase: Generated passphrases with metadata.
+    """
+    # `len()` cannot be used, as ranges of ranks are usually larger than a machine word
+    if ranks.step != 1:
+        raise ValueError("Ranks must be a contiguous range")
+    span = ranks.stop - ranks.start
+    if span <= 0:
+        raise ValueError("Cannot draw from an empty range of ranks")
+
+    randbelow = randbelow or EntropyPool().randbelow
+    count = 0
+    while n is None or count < n:
+        yield unrank(ranks.start + randbelow(span), length, sep, capitalize)
+        count += 1
+
+
+def generate_ranked_phrases(
+    n: int, ranks: range, length: int = 6, sep: str = "", capitalize: bool = True
+) -> list[Passphrase]:
+    """
+    Generate `n` passphrases whose ranks are drawn uniformly from `ranks`.
+
+    See `iter_ranked_phrases` for details.
+    """
+    return list(iter_ranked_phrases(n, ranks, length, sep, capitalize))
+
+
+def _unrank_unit(rank: int, length: int, wordlists: WordlistSet) -> tuple[list[P], list[int]]:
+    """Decode a rank into the combination and word indices of a unit passphrase."""
+    for combination, size, radices in _unit_layouts(wordlists)[length]:
+        if rank < size:
+            break
+        rank -= size
+
+    # Mixed-radix digits, the first word being the most significant
+    indices = [0] * len(radices)
+    for position in range(len(radices) - 1, -1, -1):
+        rank, indices[position] = divmod(rank, radices[position])
+    return combination, indices
+
+
+def build_tables(wordlists: WordlistSet) -> None:
+    """
+    Compute the codec tables of a wordlist set up front, e.g. before it is swapped in
+    (see `reload`), rather than on the first calls that need them.
+
+    Args:
+        wordlists (WordlistSet): The wordlist set.
+    """
+    _unit_layouts(wordlists)
+    _unit_spaces(wordlists)
+    _combination_offsets(wordlists)
+    _word_lookup(wordlists)
+    _list_sizes(wordlists)
+    _ambiguous_words(wordlists)
+
+
+def _unit_layouts(wordlists: WordlistSet) -> dict[int, tuple[tuple[list[P], int, tuple[int, ...]], ...]]:
+    """Each combination of each unit length, in rank order, with its number of passphrases and wordlist sizes."""
+    layouts = wordlists.tables.get("unit_layouts")
+    if layouts is None:
+        layouts = wordlists.tables["unit_layouts"] = {
+            length: tuple(
+                (
+                    combination,
+                    wordlists.combination_one_of(tuple(combination)),
+                    tuple(wordlists.n(pos) for pos in combination),
+                )
+                for combination in combinations
+            )
+            for length, combinations in LENGTH_TO_WORD_COMBINATIONS_MAP.items()
+        }
+    return layouts
+
+
+def _unit_spaces(wordlists: WordlistSet) -> dict[int, int]:
+    """Number of different passphrases of each unit length (see `unit_phrase_space`)."""
+    spaces = wordlists.tables.get("unit_spaces")
+    if spaces is None:
+        spaces = wordlists.tables["unit_spaces"] = {
+            length: sum(size for _, size, _ in layout) for length, layout in _unit_layouts(wordlists).items()
+        }
+    return spaces
+
+
+def ambiguous_words() -> frozenset[str]:
+    """
+    The (lowercased) words that can be read in more than one way.
+
+    They belong to several wordlists, or appear more than once in one. Only passphrases
+    containing one of them can have more than one rank.
+
+    Returns:
+        frozenset[str]: The ambiguous words.
+    """
+    return _ambiguous_words(get_wordlists())
+
+
+def _ambiguous_words(wordlists: WordlistSet) -> frozenset[str]:
+    """`ambiguous_words` of a wordlist set."""
+    ambiguous = wordlists.tables.get("ambiguous_words")
+    if ambiguous is None:
+        counts = Counter(word.lower() for words in wordlists.lists.values() for word in words)
+        ambiguous = wordlists.tables["ambiguous_words"] = frozenset(
+            word for word, count in counts.items() if count > 1
+        )
+    return ambiguous
+
+
+def _word_lookup(wordlists: WordlistSet) -> dict[str, dict[P, int]]:
+    """Mapping of each (lowercased) word to its index in every wordlist it belongs to."""
+    lookup = wordlists.tables.get("word_lookup")
+    if lookup is None:
+        lookup = {}
+        for pos in P:
+            for word, index in wordlists.word_indices(pos).items():
+                lookup.setdefault(word, {})[pos] = index
+        wordlists.tables["word_lookup"] = lookup
+    return lookup
+
+
+def _rank_combination(
+    entries: Sequence[dict[P, int]], combination: Sequence[P], wordlists: WordlistSet
+) -> int | None:
+    """Rank of words (given by their lookup entries) within a combination, or `None` if they do not match it."""
+    sizes = _list_sizes(wordlists)
+    rank = 0
+    for entry, pos in zip(entries, combination):
+        index = entry.get(pos)
+        if index is None:
+            return None
+        rank = rank * sizes[pos] + index
+    return rank
+
+
+def _list_sizes(wordlists: WordlistSet) -> dict[P, int]:
+    """Number of words in each wordlist, read once rather than on every word that is ranked."""
+    sizes = wordlists.tables.get("list_sizes")
+    if sizes is None:
+        sizes = wordlists.tables["list_sizes"] = {pos: wordlists.n(pos) for pos in P}
+    return sizes
+
+
+def _combination_offsets(wordlists: WordlistSet) -> dict[tuple[P, ...], int]:
+    """Mapping of each unit combination to the rank of its first passphrase, within its length."""
+    offsets = wordlists.tables.get("combination_offsets")
+    if offsets is None:
+        offsets = {}
+        for combinations in LENGTH_TO_WORD_COMBINATIONS_MAP.values():
+            offset = 0
+            for combination in combinations:
+                offsets[tuple(combination)] = offset
+                offset += wordlists.combination_one_of(tuple(combination))
+        wordlists.tables["combination_offsets"] = offsets
+    return offsets
+
+
+def _rank_unit(
+    entries: Sequence[dict[P, int]], wordlists: WordlistSet, combination: tuple[P, ...] | None = None
+) -> int | None:
+    """Lowest rank of words (given by their lookup entries) as a unit passphrase (within `combination`, if given)."""
+    offsets = _combination_offsets(wordlists)
+    # Most words belong to a single wordlist, so there are usually one or no candidates
+    candidates = [combination] if combination is not None else product(*entries)
+
+    ranks = [
+        offsets[candidate] + rank
+        for candidate in candidates
+        if candidate in offsets and len(candidate) == len(entries)
+        and (rank := _rank_combination(entries, candidate, wordlists)) is not None
+    ]
+    return min(ranks, default=None)
+
+
+def _rank_split(
+    entries: Sequence[dict[P, int]],
+    combinations: list[tuple[P, ...]] | None,
+    length: int,
+    buffer: int,
+    wordlists: WordlistSet,
+) -> int | None:
+    """Lowest rank of words (given by their lookup entries) as a long passphrase, trying splits in rank order."""
+    spaces = _split_spaces(length, buffer, wordlists)
+    unit_spaces = _unit_spaces(wordlists)
+    conjunction = wordlists.n(P.CONJUNCTION)
+
+    @cache
+    def parse(total: int, part: int) -> int | None:
+        # `total` words have been consumed, as `part` sub-phrases and their conjunctions
+        if total >= length:
+            complete = total == len(entries) and (combinations is None or part == len(combinations))
+            return 0 if complete else None
+
+        offset = 0
+        for option in UNIT_PHRASE_LENGTHS:
+            after = total + option + (1 if total else 0)
+            if option == 1 or after > length + buffer:
+                continue
+            block = (conjunction if total else 1) * unit_spaces[option] * spaces[after]
+            rank = _rank_block(total, option, after, part) if after <= len(entries) else None
+            if rank is not None:
+                return offset + rank
+            offset += block
+        return None
+
+    def _rank_block(total: int, option: int, after: int, part: int) -> int | None:
+        # Rank within the block of splits continuing with a sub-phrase of `option` words
+        joiner = 0
+        if total:
+            if combinations is not None and combinations[part] != (P.CONJUNCTION,):
+                return None
+            joiner = _rank_combination(entries[total:total + 1], [P.CONJUNCTION], wordlists)
+            if joiner is None:
+                return None
+            part += 1
+
+        combination = None
+        if combinations is not None:
+            combination = combinations[part] if part < len(combinations) else ()
+        unit = _rank_unit(entries[after - option:after], wordlists, combination)
+        if unit is None:
+            return None
+
+        rest = parse(after, part + 1)
+        if rest is None:
+            return None
+        return (joiner * unit_spaces[option] + unit) * spaces[after] + rest
+
+    return parse(0, 0)
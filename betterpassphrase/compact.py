@@ -0,0 +1,198 @@
+from array import array
+from typing import Iterable
+
+from .models import P, Passphrase
+from .mappings import COMBINATIONS, COMBINATION_IDS
+from .wordlists import DEFAULT_WORDLISTS, REGISTRY, get_wordlists
+
+
+class CompactPassphrase:
+    """
+    A memory-efficient, index-backed passphrase.
+
+    Stores only the combination ids of its sub-phrases and the index of each word in its
+    part of speech wordlist, packed into a single `bytes` object, along with the name of
+    its wordlist set and its restricted space, if any. The words, the joined
+    passphrase and the metadata are built on demand, and the words and passphrase are
+    cached once built. Holds the same information as a `Passphrase` and converts to and
+    from it losslessly (see `from_passphrase` and `to_passphrase`).
+    """
+
+    __slots__ = ("codes", "separator", "capitalize", "wordlists", "space", "_words", "_passphrase")
+
+    def __init__(
+        self,
+        combination_ids: Iterable[int],
+        indices: Iterable[int],
+        separator: str = "",
+        capitalize: bool = True,
+        wordlists: str | None = None,
+        space: int | None = None,
+    ):
+        """
+        Args:
+            combination_ids (Iterable[int]): Combination ids of the sub-phrases (see `mappings.COMBINATIONS`).
+            indices (Iterable[int]): Index of each word in its part of speech wordlist.
+            separator (str): The separator between words in the passphrase.
+            capitalize (bool): Whether the words in the passphrase should be capitalized.
+            wordlists (str | None): The name of the wordlist set the words are from, in the
+                                    registry (`None` for the default set).
+            space (int | None): The number of passphrases it was drawn from, if restricted
+                                (see `Passphrase.space`).
+        """
+        combination_ids = list(combination_ids)
+        # The sub-phrase count, the combination ids and the word indices, as 32-bit integers
+        self.codes = array("I", [len(combination_ids), *combination_ids, *indices]).tobytes()
+        self.separator = separator
+        self.capitalize = capitalize
+        self.wordlists = wordlists
+        self.space = space
+        self._words: list[str] | None = None
+        self._passphrase: str | None = None
+
+    @classmethod
+    def from_passphrase(cls, phrase: Passphrase) -> "CompactPassphrase":
+        """
+        Build the compact form of a passphrase.
+
+        Args:
+            phrase (Passphrase): The passphrase to convert.
+
+        Returns:
+            CompactPassphrase: The compact passphrase.
+
+        Raises:
+            ValueError: If a sub-combination or a word is not part of the known grammar and wordlists,
+                        or the wordlist set of the passphrase is not the one registered under its name.
+        """
+        wordlists = get_wordlists(phrase.wordlists)
+        # Only the name of the set is kept, so it must resolve back to the same set
+        if wordlists.name not in REGISTRY.names() or get_wordlists(wordlists.name) is not wordlists:
+            raise ValueError(f"The {wordlists.name!r} wordlists are not the registered ones")
+
+        combination_ids = []
+        for combination in phrase.sub_combinations:
+            combination_id = COMBINATION_IDS.get(tuple(combination))
+            if combination_id is None:
+                raise ValueError(f"Unknown combination of parts of speech: {combination}")
+            combination_ids.append(combination_id)
+
+        indices = []
+        for word, pos in zip(phrase.words, phrase.combination):
+            index = wordlists.word_indices(pos).get(word.lower())
+            if index is None:
+                raise ValueError(f"{word!r} is not a known {pos.name.lower()}")
+            indices.append(index)
+
+        name = None if wordlists.name == DEFAULT_WORDLISTS else wordlists.name
+        return cls(combination_ids, indices, phrase.separator, phrase.capitalize, name, phrase.space)
+
+    def to_passphrase(self) -> Passphrase:
+        """
+        Build the equivalent `Passphrase`.
+
+        Returns:
+            Passphrase: The passphrase with all its words materialized.
+        """
+        return Passphrase(
+            words=list(self.words),
+            word_count=self.word_count,
+            separator=self.separator,
+            capitalize=self.capitalize,
+            sub_combinations=self.sub_combinations,
+            wordlists=None if self.wordlists is None else get_wordlists(self.wordlists),
+            space=self.space,
+        )
+
+    @property
+    def combination_ids(self) -> list[int]:
+        """The combination ids of the sub-phrases of the passphrase."""
+        codes = memoryview(self.codes).cast("I")
+        return codes[1:1 + codes[0]].tolist()
+
+    @property
+    def indices(self) -> list[int]:
+        """The index of each word of the passphrase in its part of speech wordlist."""
+        codes = memoryview(self.codes).cast("I")
+        return codes[1 + codes[0]:].tolist()
+
+    @property
+    def word_count(self) -> int:
+        """The number of words in the passphrase."""
+        codes = memoryview(self.codes).cast("I")
+        return len(codes) - 1 - codes[0]
+
+    @property
+    def sub_combinations(self) -> list[list[P]]:
+        """A list of sub-combinations of parts of speech used to generate the passphrase."""
+        return [list(COMBINATIONS[combination_id]) for combination_id in self.combination_ids]
+
+    @property
+    def combination(self) -> list[P]:
+        """The combination of parts of speech used to generate the passphrase."""
+        return [
+            pos for combination_id in self.combination_ids for pos in COMBINATIONS[combination_id]
+        ]
+
+    @property
+    def words(self) -> list[str]:
+        """The list of words in the passphrase."""
+        if self._words is None:
+            wordlists = get_wordlists(self.wordlists)
+            words = [
+                wordlists[pos][index] if wordlists[pos] else ""
+                for pos, index in zip(self.combination, self.indices)
+            ]
+            self._words = [word.capitalize() for word in words] if self.capitalize else words
+        return self._words
+
+    @property
+    def passphrase(self) -> str:
+        """The generated passphrase."""
+        if self._passphrase is None:
+            self._passphrase = self.separator.join(self.words)
+        return self._passphrase
+
+    @property
+    def one_of(self) -> int:
+        """This is one of the different passphrases can be generated using the same set of parts of speech wordlists."""
+        return self.to_passphrase().one_of
+
+    @property
+    def wordlist_probability(self) -> float:
+        """The probability of generating the passphrase using the same set of parts of speech wordlists."""
+        return 1 / self.one_of
+
+    @property
+    def character_one_of(self) -> int:
+        """This is one of the different passphrases can be generated using the same of alphabetical characters."""
+        return self.to_passphrase().character_one_of
+
+    @property
+    def character_probability(self) -> float:
+        """The probability of generating the passphrase using alphabetical characters."""
+        return 1 / self.character_one_of
+
+    def release(self) -> None:
+        """Drop the cached words and passphrase, returning to the compact footprint."""
+        self._words = None
+        self._passphrase = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactPassphrase):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        """Everything that identifies the passphrase."""
+        return self.codes, self.separator, self.capitalize, self.wordlists, self.space
+
+    def __str__(self) -> str:
+        """The string representation of the passphrase."""
+        return self.passphrase
+
+    def __repr__(self) -> str:
+        return f"CompactPassphrase({self.passphrase!r})"
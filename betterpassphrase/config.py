@@ -1,5 +1,6 @@
-import secrets
+import os
 from pathlib import Path
+from random import SystemRandom
 
 
 BUFFER = 3
@@ -9,15 +10,73 @@ Buffer to add to the length of the passphrase.
 This when added to length defines the maximum length of the passphrase.
 """
 
-assert BUFFER >= 3, "Buffer must be at least 3 as the program might go into an infinite loop."
+assert BUFFER >= 3, "Buffer must be at least 3, or some lengths could not be split into sub-phrases."
 
 PARTS_OF_SPEECH_DIR = Path(__file__).parent / "parts_of_speech"
 """Path to the directory containing the parts of speech files."""
 
+WORDLIST_BUNDLE_PATH = PARTS_OF_SPEECH_DIR / "wordlists.bin"
+"""Path to the precompiled wordlist bundle (built from the parts of speech files on first use)."""
+
+USE_WORDLIST_BUNDLE = True
+"""Whether to read words from the memory-mapped wordlist bundle instead of the text files."""
+
+WORDLIST_CACHE_SIZE = 8
+"""Maximum number of custom wordlist sets kept loaded at a time (see `wordlists.WordlistRegistry`)."""
+
+WORDLIST_RELOAD_INTERVAL = 5.0
+"""Seconds between two checks of the wordlist files for changes, when watching them (see `reload`)."""
+
+ENTROPY_BLOCK_SIZE = 4096
+"""Number of bytes read from the OS at a time when generating passphrases in batches."""
+
+VECTORIZED_MIN_PHRASES = 10_000
+"""Number of phrases from which the CLI uses the NumPy backend, if installed (see `vectorized`)."""
+
+PARALLEL_CHUNK_SIZE = 10_000
+"""Number of passphrases generated per work unit when generating across processes."""
+
+PROVISION_CHUNK_SIZE = 64
+"""Number of credentials generated and hashed per work unit when provisioning (see `provision`)."""
+
+PROVISION_KDF = "scrypt"
+"""Default key derivation function used to hash provisioned passphrases (`scrypt` or `pbkdf2`)."""
+
+SCRYPT_N = 2**14
+"""Default scrypt CPU/memory cost (a power of 2)."""
+
+SCRYPT_R = 8
+"""scrypt block size."""
+
+SCRYPT_P = 1
+"""scrypt parallelization."""
+
+PBKDF2_ITERATIONS = 600_000
+"""Default number of PBKDF2-HMAC-SHA256 iterations."""
+
+ASYNC_CHUNK_SIZE = 256
+"""Number of passphrases generated between yields to the event loop by the asyncio API."""
+
+DAEMON_SOCKET_PATH: str | None = None
+"""
+Path of the Unix socket the passphrase daemon listens on, or `None` for a per-user default
+(see `client.default_socket_path`).
+"""
+
+DAEMON_POOL_SIZE = 1000
+"""Number of ready passphrases the daemon keeps per length and capitalization setting (high-water mark)."""
+
+DAEMON_REFILL_CHUNK_SIZE = 64
+"""Number of passphrases the daemon generates at a time when refilling its pools in the background."""
+
 SEED: int | None = None
-"""Seed for the random number generator."""
+"""
+Default seed of the deterministic mode (see `seeded`). NOT SECURE: only for tests.
+Regular generation always uses the OS's secure randomness and ignores it.
+"""
+
+RANDOM_SELECTOR = SystemRandom().choice
+"""Function picking a random element of a sequence, from the OS's secure randomness."""
 
-try:
-    RANDOM_SELECTOR = secrets.SystemRandom(SEED).choice
-except:
-    RANDOM_SELECTOR = secrets.choice
+RANDOM_BELOW = SystemRandom().randrange
+"""Function returning a random integer in `[0, n)`, for draws that are not picks from a sequence."""
@@ -0,0 +1,294 @@
+"""
+Long-lived passphrase generator daemon.
+
+Keeps the wordlists and grammar loaded and holds a pool of ready passphrases per
+length and capitalization setting, refilled in the background, so a request is served
+straight from memory. Requests and responses are JSON lines over a local Unix socket:
+
+```
+request  : {"n": 1, "length": 6, "sep": "-", "capitalize": false}
+response : {"phrases": ["..."]}   or   {"error": "..."}
+```
+
+A connection can carry any number of requests. See `client` for a thin client.
+"""
+import os
+import sys
+import json
+import stat
+import signal
+import argparse
+import threading
+import socketserver
+from collections import deque
+
+from .client import default_socket_path
+from .config import DAEMON_POOL_SIZE, DAEMON_REFILL_CHUNK_SIZE
+from .generator import generate_phrases, phrase_factory
+
+
+PoolKey = tuple[int, bool]
+"""The length and capitalization setting of the passphrases in a pool."""
+
+
+class PhrasePool:
+    """
+    Pools of ready passphrases (as word lists), refilled by a background thread.
+
+    A pool is created for each length and capitalization setting on its first request,
+    and refilled up to `high_water` passphrases whenever it drops to `low_water`.
+    Separators are applied when serving, so all separators share the same pools.
+    """
+
+    def __init__(self, high_water: int = DAEMON_POOL_SIZE, low_water: int | None = None):
+        """
+        Args:
+            high_water (int): The number of passphrases each pool is refilled up to.
+            low_water (int | None): The size at which a pool is refilled (defaults
+                                    to half of `high_water`).
+        """
+        if high_water < 0:
+            raise ValueError(f"Invalid pool size: {high_water}")
+        self.high_water = high_water
+        self.low_water = high_water // 2 if low_water is None else low_water
+        self._pools: dict[PoolKey, deque[list[str]]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._refill_loop, name="phrase-pool", daemon=True)
+
+    def start(self) -> "PhrasePool":
+        """Start the background refill thread."""
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the background refill thread."""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def clear(self) -> None:
+        """Drop every ready passphrase (e.g. after the wordlists are reloaded), and refill the pools."""
+        with self._lock:
+            for pool in self._pools.values():
+                pool.clear()
+        self._wakeup.set()
+
+    def size(self, length: int, capitalize: bool) -> int:
+        """The number of ready passphrases of the given length and capitalization setting."""
+        pool = self._pools.get((length, capitalize))
+        return len(pool) if pool is not None else 0
+
+    def take(self, n: int, length: int = 6, capitalize: bool = True) -> list[list[str]]:
+        """
+        Take `n` passphrases from the pool, generating any shortfall on the spot.
+
+        Args:
+            n (int): The number of passphrases.
+            length (int): The number of words in each passphrase.
+            capitalize (bool): Whether words are capitalized.
+
+        Returns:
+            list[list[str]]: The words of each passphrase.
+
+        Raises:
+            ValueError: If `n` or `length` is invalid.
+        """
+        if n < 0:
+            raise ValueError(f"Cannot generate {n} phrases")
+        key = (length, capitalize)
+        with self._lock:
+            pool = self._pools.get(key)
+            taken = [pool.popleft() for _ in range(min(n, len(pool)))] if pool is not None else []
+
+        if pool is None:
+            # Validate the settings before a pool is created for them, even if `n` is 0:
+            # the refill thread could not fill a pool with invalid settings
+            phrase_factory(length, "", capitalize)
+        if len(taken) < n:
+            taken.extend(phrase.words for phrase in generate_phrases(n - len(taken), length, "", capitalize))
+
+        if pool is None:
+            with self._lock:
+                pool = self._pools.setdefault(key, deque())
+        if len(pool) <= self.low_water:
+            self._wakeup.set()
+        return taken
+
+    def _refill_loop(self) -> None:
+        """Refill every pool that is below its low-water mark, whenever woken up."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._closed:
+                return
+            for key in list(self._pools):
+                if len(self._pools[key]) <= self.low_water:
+                    try:
+                        self._refill(key)
+                    except Exception as e:
+                        # Keep refilling the other pools; `take` still generates on the spot
+                        print(f"Could not refill the pool of {key}: {e!r}", file=sys.stderr)
+
+    def _refill(self, key: PoolKey) -> None:
+        """Refill a pool up to the high-water mark, in small chunks to keep serving responsive."""
+        length, capitalize = key
+        pool = self._pools[key]
+        while not self._closed and (missing := self.high_water - len(pool)) > 0:
+            phrases = generate_phrases(min(missing, DAEMON_REFILL_CHUNK_SIZE), length, "", capitalize)
+            with self._lock:
+                pool.extend(phrase.words for phrase in phrases)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves JSON line requests until the client disconnects."""
+
+    server: "PassphraseServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                sep = str(request.get("sep", ""))
+                phrases = self.server.pool.take(
+                    int(request.get("n", 1)),
+                    int(request.get("length", 6)),
+                    bool(request.get("capitalize", True)),
+                )
+                response = {"phrases": [sep.join(words) for words in phrases]}
+            except (ValueError, TypeError, AttributeError) as e:
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class PassphraseServer(socketserver.ThreadingUnixStreamServer):
+    """A Unix socket server handing out passphrases from a `PhrasePool`."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str | None = None, pool: PhrasePool | None = None):
+        """
+        Args:
+            path (str | None): The path of the Unix socket (see `client.default_socket_path`).
+                               A stale socket file is replaced, and a missing directory
+                               is created, private to the user.
+            pool (PhrasePool | None): The passphrase pool (a new, started one if not given).
+        """
+        path = path or default_socket_path()
+        _prepare_socket_directory(path)
+        if os.path.lexists(path) and stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)
+        self.pool = pool or PhrasePool().start()
+        super().__init__(path, _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Passphrases are secrets: only the owner may connect, from the moment the socket exists
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def _prepare_socket_directory(path: str) -> None:
+    """
+    Create the directory of a socket, private to the user, or check that the existing one is safe.
+
+    An existing directory must belong to the user (or root), and if others can write to
+    it, be sticky (as `/tmp` is), so that nobody else can replace the socket.
+
+    Raises:
+        PermissionError: If the directory is unsafe.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, 0o700)
+        return
+    except FileExistsError:
+        pass
+    info = os.stat(directory)
+    if info.st_uid not in (0, os.getuid()) or (info.st_mode & 0o022 and not info.st_mode & stat.S_ISVTX):
+        raise PermissionError(f"Unsafe socket directory {directory}: others can replace the socket")
+
+
+def main(_args: list[str] = None):
+    parser = argparse.ArgumentParser(description="Serve passphrases from a prefetched pool over a Unix socket.")
+
+    socket_path = default_socket_path()
+
+    # -S flag for the socket path
+    parser.add_argument(
+        "-S",
+        "--socket",
+        type=str,
+        default=socket_path,
+        help=f"Path of the Unix socket to listen on (default: {socket_path}).",
+    )
+
+    # -p flag for the pool high-water mark
+    parser.add_argument(
+        "-p",
+        "--pool-size",
+        type=int,
+        default=DAEMON_POOL_SIZE,
+        help=f"Number of ready phrases kept per length and capitalization (default: {DAEMON_POOL_SIZE}).",
+    )
+
+    # -r flag for reloading the wordlists when they change
+    parser.add_argument(
+        "-r",
+        "--reload-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Check the wordlist files for changes every SECONDS seconds, and reload them without "
+        "restarting (default: never).",
+    )
+
+    args = parser.parse_args(_args)
+
+    if args.pool_size < 0:
+        print("Invalid pool size.")
+        exit(1)
+
+    if args.reload_interval is not None and args.reload_interval <= 0:
+        print("Invalid reload interval.")
+        exit(1)
+
+    # Shut down cleanly (removing the socket) when terminated, as on Ctrl+C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        server = PassphraseServer(args.socket, PhrasePool(args.pool_size).start())
+    except OSError as e:
+        print(f"Could not listen on {args.socket}: {e}.")
+        exit(1)
+
+    with server:
+        watcher = None
+        if args.reload_interval is not None:
+            from .reload import WordlistWatcher
+
+            # Phrases prefetched from the old wordlists are dropped
+            watcher = WordlistWatcher(interval=args.reload_interval, on_reload=lambda _: server.pool.clear())
+            watcher.start()
+        print(f"Serving passphrases on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if watcher is not None:
+                watcher.stop()
+
+
+if __name__ == "__main__":
+    main()
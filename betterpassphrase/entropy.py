@@ -0,0 +1,170 @@
+"""
+Precomputed entropy tables for the passphrase grammar.
+
+All figures are in bits and describe the random choices made by `generate_phrase`:
+the sub-phrase lengths (for long passphrases), the combination of parts of speech for
+each sub-phrase, and the words. Tables are computed from a wordlist set (the default
+one unless given) on first use and kept on the set, so every lookup afterwards is O(1),
+and a set swapped in by `reload` brings its own tables (see `build_tables`).
+
+Different choices can occasionally spell the same passphrase (a word may appear in
+more than one wordlist), so these figures are upper bounds on the entropy of the
+passphrase string itself.
+"""
+import math
+
+from .config import BUFFER
+from .generator import length_partition_counts
+from .models import P
+from .wordlists import WordlistSet, get_wordlists
+from .mappings import (
+    COMBINATIONS,
+    UNIT_PHRASE_LENGTHS,
+    UNIT_PHRASE_MAX_LENGTH,
+    LENGTH_TO_WORD_COMBINATIONS_MAP,
+)
+
+
+def combination_sizes(wordlists: str | WordlistSet | None = None) -> tuple[int, ...]:
+    """
+    Number of different phrases for each combination, indexed by combination id.
+
+    Args:
+        wordlists (str | WordlistSet | None): The wordlist set (defaults to the default set).
+
+    Returns:
+        tuple[int, ...]: Phrase counts (see `mappings.COMBINATIONS`).
+    """
+    wordlists = get_wordlists(wordlists)
+    sizes = wordlists.tables.get("combination_sizes")
+    if sizes is None:
+        sizes = wordlists.tables["combination_sizes"] = tuple(
+            wordlists.combination_one_of(combination) for combination in COMBINATIONS
+        )
+    return sizes
+
+
+def combination_bits(wordlists: str | WordlistSet | None = None) -> tuple[float, ...]:
+    """
+    Entropy of each combination in bits, indexed by combination id.
+
+    Args:
+        wordlists (str | WordlistSet | None): The wordlist set (defaults to the default set).
+
+    Returns:
+        tuple[float, ...]: Entropy of a phrase drawn uniformly from each combination.
+    """
+    wordlists = get_wordlists(wordlists)
+    bits = wordlists.tables.get("combination_bits")
+    if bits is None:
+        bits = wordlists.tables["combination_bits"] = tuple(
+            wordlists.combination_entropy_bits(combination) for combination in COMBINATIONS
+        )
+    return bits
+
+
+def unit_length_entropy(length: int, wordlists: str | WordlistSet | None = None) -> float:
+    """
+    Entropy in bits of a passphrase of a length with its own combinations.
+
+    Accounts for the choice of a combination among those of the given length in
+    `LENGTH_TO_WORD_COMBINATIONS_MAP` and the choice of the words. Combinations are
+    weighted by their number of phrases (see `grammar`), so every phrase is equally
+    likely and the entropy is `log2` of the number of phrases.
+
+    Args:
+        length (int): The number of words (must be in `UNIT_PHRASE_LENGTHS`).
+        wordlists (str | WordlistSet | None): The wordlist set (defaults to the default set).
+
+    Returns:
+        float: The entropy in bits.
+    """
+    if length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+        raise ValueError(f"Cannot generate phrase of length {length}")
+    wordlists = get_wordlists(wordlists)
+    table = wordlists.tables.setdefault("unit_length_entropy", {})
+    bits = table.get(length)
+    if bits is None:
+        bits = table[length] = math.log2(sum(
+            wordlists.combination_one_of(tuple(combination))
+            for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[length]
+        ))
+    return bits
+
+
+def length_entropy(length: int, buffer: int = BUFFER, wordlists: str | WordlistSet | None = None) -> float:
+    """
+    Entropy in bits of the whole distribution of passphrases of a requested length.
+
+    For lengths above `UNIT_PHRASE_MAX_LENGTH`, this also accounts for the choice of the
+    sub-phrase lengths made by `generate_lengths` and for the joining conjunctions.
+    Lengths are looked up in cached tables, so long lengths take no longer than short ones
+    once computed.
+
+    Args:
+        length (int): The requested number of words.
+        buffer (int): The buffer passed to `generate_lengths`.
+        wordlists (str | WordlistSet | None): The wordlist set (defaults to the default set).
+
+    Returns:
+        float: The entropy in bits.
+    """
+    wordlists = get_wordlists(wordlists)
+    if length <= UNIT_PHRASE_MAX_LENGTH:
+        return unit_length_entropy(length, wordlists)
+    table = wordlists.tables.setdefault("length_entropy", {})
+    key = (length, max(3, buffer))
+    bits = table.get(key)
+    if bits is None:
+        bits = table[key] = _lengths_entropy(*key, wordlists)
+    return bits
+
+
+def conjunction_entropy(wordlists: str | WordlistSet | None = None) -> float:
+    """Entropy in bits of a conjunction joining two sub-phrases."""
+    return get_wordlists(wordlists).combination_entropy_bits((P.CONJUNCTION,))
+
+
+def build_tables(wordlists: WordlistSet) -> None:
+    """
+    Compute the tables of every unit length for a wordlist set up front, e.g. before it is
+    swapped in (see `reload`), rather than on the first calls that need them.
+
+    Args:
+        wordlists (WordlistSet): The wordlist set.
+    """
+    combination_sizes(wordlists)
+    combination_bits(wordlists)
+    for length in LENGTH_TO_WORD_COMBINATIONS_MAP:
+        unit_length_entropy(length, wordlists)
+
+
+def _lengths_entropy(length: int, buffer: int, wordlists: WordlistSet) -> float:
+    """
+    Entropy of a long passphrase, whose sub-phrase lengths are drawn by `generate_lengths`.
+
+    Every valid split into sub-phrase lengths is equally likely, which contributes
+    `log2` of their number. On top of that, `expected[total]` is the expected entropy of
+    the sub-phrases and conjunctions still to be drawn once the split has reached `total`
+    words, following the same table as `generate_lengths`.
+    """
+    counts = length_partition_counts(length, buffer)
+    if not counts[0]:
+        raise ValueError(f"Cannot generate phrase of length {length}")
+
+    lengths = [x for x in UNIT_PHRASE_LENGTHS if x != 1]
+    conjunction_bits = conjunction_entropy(wordlists)
+    expected = [0.0] * len(counts)
+
+    for total in range(length - 1, -1, -1):
+        if not counts[total]:
+            continue
+        joiner_bits = conjunction_bits if total else 0.0
+        for option in lengths:
+            after = total + option + (1 if total else 0)
+            if after < len(counts) and counts[after]:
+                expected[total] += counts[after] / counts[total] * (
+                    joiner_bits + unit_length_entropy(option, wordlists) + expected[after]
+                )
+
+    return math.log2(counts[0]) + expected[0]
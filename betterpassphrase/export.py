@@ -0,0 +1,150 @@
+"""
+Structured export of passphrases with their metadata, as NDJSON, CSV or TSV.
+
+Each record holds the passphrase, its word count, its flat combination of parts of
+speech and its entropy in bits. Batches are formatted into one string each, to be
+written in a single call, and the metadata of each combination is computed once and
+cached, so exporting costs little more than formatting the passphrases themselves.
+
+```python
+from betterpassphrase.export import export_batch, export_header
+from betterpassphrase.parallel import iter_phrase_batches
+
+with open("phrases.csv", "w") as file:
+    file.write(export_header("csv"))
+    for batch in iter_phrase_batches(1_000_000, length=6, sep="-"):
+        file.write(export_batch(batch, "csv"))
+```
+"""
+import io
+import csv
+import json
+import math
+from typing import Iterable
+
+from .models import P, Passphrase
+from .wordlists import WordlistSet, get_wordlists
+
+
+EXPORT_FORMATS = ("ndjson", "csv", "tsv")
+"""The supported export formats."""
+
+FIELDS = ("passphrase", "word_count", "combination", "entropy_bits")
+"""The fields of each record, in order."""
+
+_DELIMITERS = {"csv": ",", "tsv": "\t"}
+
+_METADATA_CACHE_SIZE = 4096
+"""The maximum number of combinations whose metadata is cached per wordlist set."""
+
+
+def export_header(fmt: str, fields: tuple[str, ...] = FIELDS) -> str:
+    """
+    The header of an export: the field names for CSV and TSV, nothing for NDJSON.
+
+    Args:
+        fmt (str): The export format (see `EXPORT_FORMATS`).
+        fields (tuple[str, ...]): The fields of the records.
+
+    Returns:
+        str: The header, including its trailing newline.
+    """
+    _check_format(fmt)
+    return "" if fmt == "ndjson" else _DELIMITERS[fmt].join(fields) + "\n"
+
+
+def export_batch(batch: list[Passphrase], fmt: str) -> str:
+    """
+    Format a batch of passphrases as records, one per line.
+
+    Args:
+        batch (list[Passphrase]): The passphrases.
+        fmt (str): The export format (see `EXPORT_FORMATS`).
+
+    Returns:
+        str: The records, including the trailing newline.
+    """
+    _check_format(fmt)
+    if fmt == "ndjson":
+        return "".join(
+            f'{{"passphrase": {json.dumps(phrase.passphrase)}, "word_count": {phrase.word_count}, '
+            f"{_metadata(phrase)[1]}}}\n"
+            for phrase in batch
+        )
+
+    return export_rows(((phrase.passphrase, phrase.word_count, *_metadata(phrase)[0]) for phrase in batch), fmt)
+
+
+def export_rows(rows: Iterable[tuple], fmt: str, fields: tuple[str, ...] = FIELDS) -> str:
+    """
+    Format rows of values as records, one per line.
+
+    Args:
+        rows (Iterable[tuple]): The values of each record, in the order of `fields`.
+        fmt (str): The export format (see `EXPORT_FORMATS`).
+        fields (tuple[str, ...]): The fields of the records.
+
+    Returns:
+        str: The records, including the trailing newline.
+    """
+    _check_format(fmt)
+    if fmt == "ndjson":
+        return "".join(f"{json.dumps(dict(zip(fields, row)))}\n" for row in rows)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=_DELIMITERS[fmt], lineterminator="\n")
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _check_format(fmt: str) -> None:
+    """Raise a `ValueError` for an unsupported export format."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt!r}")
+
+
+def _metadata(phrase: Passphrase) -> tuple[tuple[str, float], str]:
+    """
+    The combination and entropy fields of a passphrase, as values and as an NDJSON fragment.
+
+    Cached per combination, unless the passphrase was drawn from a restricted space.
+    """
+    sub_combinations = tuple(map(tuple, phrase.sub_combinations))
+    if phrase.space is not None:
+        return _fields(sub_combinations, math.log2(phrase.space))
+    return combination_metadata(sub_combinations, get_wordlists(phrase.wordlists))
+
+
+def combination_metadata(
+    sub_combinations: tuple[tuple[P, ...], ...], wordlists: WordlistSet
+) -> tuple[tuple[str, float], str]:
+    """
+    The combination and entropy fields of the passphrases of a combination.
+
+    Cached on the wordlist set (up to `_METADATA_CACHE_SIZE` combinations), so a set
+    swapped in by `reload` starts afresh and the old one is not kept alive.
+
+    Args:
+        sub_combinations (tuple[tuple[P, ...], ...]): The sub-combinations (see `Passphrase.sub_combinations`).
+        wordlists (WordlistSet): The wordlist set the passphrases are drawn from.
+
+    Returns:
+        tuple[tuple[str, float], str]: The combination (space-separated part of speech names)
+                                       and entropy bits, and the same as an NDJSON fragment.
+    """
+    cached = wordlists.tables.setdefault("combination_metadata", {})
+    metadata = cached.get(sub_combinations)
+    if metadata is None:
+        if len(cached) >= _METADATA_CACHE_SIZE:
+            # Long passphrases have too many combinations to keep them all
+            cached.clear()
+        bits = sum(wordlists.combination_entropy_bits(phrase) for phrase in sub_combinations)
+        metadata = cached[sub_combinations] = _fields(sub_combinations, bits)
+    return metadata
+
+
+def _fields(sub_combinations: tuple[tuple[P, ...], ...], bits: float) -> tuple[tuple[str, float], str]:
+    """The fields of `combination_metadata`, for the given entropy."""
+    names = [pos.name.lower() for phrase in sub_combinations for pos in phrase]
+    fragment = f'"combination": {json.dumps(names)}, "entropy_bits": {json.dumps(bits)}'
+    return (" ".join(names), bits), fragment
@@ -1,7 +1,13 @@
-from functools import reduce
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, Iterator, Sequence
 
-from .config import BUFFER, RANDOM_SELECTOR
+from .config import BUFFER, RANDOM_BELOW, RANDOM_SELECTOR
+from .grammar import CompiledCombinations, compile_combinations, compile_grammar
 from .models import P, Passphrase
+from .sampling import EntropyPool
+from .stats import COUNTING_RANDOM, STATS
+from .wordlists import DEFAULT_WORDLISTS, WordlistSet, get_wordlists
 from .mappings import (
     UNIT_PHRASE_LENGTHS,
     UNIT_PHRASE_MAX_LENGTH,
@@ -9,7 +15,50 @@ from .mappings import (
 )
 
 
-def generate_lengths(length: int = 10, buffer: int = 3) -> list[int]:
+Selector = Callable[[Sequence], object]
+"""A function that picks a random element from a sequence (e.g. `RANDOM_SELECTOR`)."""
+
+RandBelow = Callable[[int], int]
+"""A function that returns a random integer in `[0, n)` (e.g. `RANDOM_BELOW`)."""
+
+
+@lru_cache(maxsize=256)
+def length_partition_counts(length: int, buffer: int = BUFFER) -> tuple[int, ...]:
+    """
+    Dynamic-programming table of the valid ways to split a passphrase into sub-phrases.
+
+    A split is a sequence of sub-phrase lengths from `UNIT_PHRASE_LENGTHS`, joined by
+    one conjunction each, whose total length is between `length` and `length + buffer`.
+    Sub-phrases are only added while the total is below `length`.
+
+    Entry `total` of the table is the number of ways to complete a split whose sub-phrases
+    (and conjunctions) add up to `total` words so far, so entry `0` is the number of
+    valid splits. Tables are cached per `length` and `buffer`.
+
+    Args:
+        length (int): The target length of the passphrase.
+        buffer (int): The maximum additional length allowed beyond the target length.
+
+    Returns:
+        tuple[int, ...]: Number of ways to complete a split, indexed by the total so far.
+    """
+    options = [x for x in UNIT_PHRASE_LENGTHS if x != 1]
+    counts = [0] * (length + buffer + 1)
+    for total in range(length + buffer, -1, -1):
+        if total >= length:
+            counts[total] = 1
+            continue
+        counts[total] = sum(
+            counts[after]
+            for option in options
+            if (after := total + option + (1 if total else 0)) <= length + buffer
+        )
+    return tuple(counts)
+
+
+def generate_lengths(
+    length: int = 10, buffer: int = 3, randbelow: RandBelow = RANDOM_BELOW
+) -> list[int]:
     """
     Generate a list of word lengths for a passphrase generator.
 
@@ -22,19 +71,26 @@ def generate_lengths(length: int = 10, buffer: int = 3) -> list[int]:
     - The total length of the passphrase (including separators) is between
       `length` and `length + buffer`.
     - Word lengths of 1 are not used, except for separators.
+    - Every valid list of word lengths is equally likely.
+
+    Word lengths are drawn one at a time, each weighted by the number of valid ways
+    to complete the list after it (see `length_partition_counts`), so there are no
+    retries and the time taken is linear in the number of word lengths.
 
     Args:
         length (int): The target length of the passphrase.
         buffer (int): The maximum additional length allowed beyond the target length.
                       Must be at least 3.
+        randbelow (RandBelow): Function used to draw random integers.
 
     Returns:
         list[int]: A list of integers representing word lengths for the passphrase.
                    Separators are not explicitly included in the output.
 
+    Raises:
+        ValueError: If no valid list of word lengths exists.
+
     Notes:
-        - The function ensures that separators of length 1 are used during generation
-          but are removed from the final output list.
         - The function relies on a predefined `UNIT_PHRASE_LENGTHS` list, which should
           include acceptable word lengths.
 
@@ -43,113 +99,382 @@ def generate_lengths(length: int = 10, buffer: int = 3) -> list[int]:
         >>> generate_lengths(length=10, buffer=3)
         [5, 4]  # Example output, actual values may vary due to randomness.
     """
-    lengths = []
     # Ensure a minimum buffer value of 3
     buffer = max(3, buffer)
 
-    # UNIT_PHRASE_LENGTHS should be a predefined list of acceptable word lengths.
-    options = UNIT_PHRASE_LENGTHS
-    if 1 in options:
+    counts = length_partition_counts(length, buffer)
+    if not counts[0]:
+        raise ValueError(f"Cannot generate phrase of length {length}")
 
-        # Remove 1 as a valid word length (used only for separators).
-        options.remove(1)
+    options = [x for x in UNIT_PHRASE_LENGTHS if x != 1]
+    lengths: list[int] = []
+    total = 0
+    while total < length:
+        # Pick the n-th valid completion, and follow the word length it starts with
+        choice = randbelow(counts[total])
+        for option in options:
+            after = total + option + (1 if total else 0)
+            if after > length + buffer:
+                continue
+            if choice < counts[after]:
+                break
+            choice -= counts[after]
 
-    while sum(lengths[:-1]) < length:
-        # Calculate the difference between the target length and current sum of lengths
-        diff = length - sum(lengths[:-1]) - 1  # -1 for the added separator
+        lengths.append(option)
+        total = after
 
-        if diff in options:
-            # If the difference matches an option, use it as the next word length
-            sub_length = diff
-        else:
-            # Otherwise, choose a random word length from the available options
-            sub_length = RANDOM_SELECTOR(options)
+    return lengths
 
-        lengths.append(sub_length)
 
-        # Check if the total length exceeds the allowed range
-        if sum(lengths) > length + buffer:
-            # If the length exceeds, remove the last added word and try again
-            lengths = lengths[:-1]
-            continue
+MinBitsPlan = tuple[int, tuple[list[P], ...] | None]
+"""The length to generate for an entropy target, and the combinations to sample from (`None` for all)."""
 
-        # Add a separator (length of 1) after the word length
-        lengths.append(1)
+_MIN_BITS_MAX_LENGTH = 1024
+"""Longest passphrase length considered when searching for an entropy target."""
 
-    # Remove any standalone separators (lengths of 1) from the final list
-    lengths = [x for x in lengths if not x == 1]
+_MIN_BITS_CACHE_SIZE = 4096
+"""The maximum number of entropy targets whose plan is cached per wordlist set."""
 
-    return lengths
+
+def min_bits_plan(min_bits: float, wordlists: str | WordlistSet | None = None) -> MinBitsPlan:
+    """
+    The fewest words that give a passphrase of at least `min_bits` bits of entropy.
+
+    Up to `UNIT_PHRASE_MAX_LENGTH` words, the combinations of each length are filtered
+    down to those with at least `min_bits` bits (see `Passphrase.entropy_bits`), and the
+    shortest length with any is picked. Longer passphrases are split into sub-phrases at
+    random, so the shortest length whose every possible split and combination reaches
+    `min_bits` is picked instead. Plans are cached per wordlist set (up to
+    `_MIN_BITS_CACHE_SIZE` targets), so generating for an entropy target costs the same as
+    generating for a fixed length.
+
+    Args:
+        min_bits (float): The entropy target in bits.
+        wordlists (str | WordlistSet | None): The wordlist set (see `generate_phrase`).
+
+    Returns:
+        MinBitsPlan: The length, and the combinations that meet the target (`None` if all do).
+
+    Raises:
+        ValueError: If the target cannot be reached.
+    """
+    wordlists = get_wordlists(wordlists)
+    plans = wordlists.tables.setdefault("min_bits_plans", {})
+    plan = plans.get(min_bits)
+    if plan is None:
+        if len(plans) >= _MIN_BITS_CACHE_SIZE:
+            # Targets are arbitrary floats, so there is no bound on how many are asked for
+            plans.clear()
+        plan = plans[min_bits] = _min_bits_plan(min_bits, wordlists)
+    return plan
+
+
+def _min_bits_plan(min_bits: float, wordlists: WordlistSet) -> MinBitsPlan:
+    """Search the combination entropy tables for `min_bits_plan`."""
+    bits = wordlists.combination_entropy_bits
+    if min_bits > _MIN_BITS_MAX_LENGTH * max(bits((pos,)) for pos in P):
+        raise ValueError(f"Cannot generate a passphrase with {min_bits} bits of entropy")
+
+    for length in UNIT_PHRASE_LENGTHS:
+        combinations = tuple(
+            combination
+            for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[length]
+            if bits(tuple(combination)) >= min_bits
+        )
+        if combinations:
+            return length, combinations
+
+    # Least entropy of a sub-phrase of each length, and of a joining conjunction
+    unit_bits = {
+        length: min(bits(tuple(combination)) for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[length])
+        for length in UNIT_PHRASE_LENGTHS
+    }
+    conjunction_bits = bits((P.CONJUNCTION,))
+    options = [x for x in UNIT_PHRASE_LENGTHS if x != 1]
+
+    for length in range(UNIT_PHRASE_MAX_LENGTH + 1, _MIN_BITS_MAX_LENGTH + 1):
+        # Least entropy of the rest of a split that has reached `total` words, as in `generate_lengths`
+        counts = length_partition_counts(length, BUFFER)
+        least = [0.0] * len(counts)
+        for total in range(length - 1, -1, -1):
+            least[total] = min(
+                (
+                    (conjunction_bits if total else 0.0) + unit_bits[option] + least[after]
+                    for option in options
+                    if (after := total + option + (1 if total else 0)) < len(counts) and counts[after]
+                ),
+                default=0.0,
+            )
+        if counts[0] and least[0] >= min_bits:
+            return length, None
+
+    raise ValueError(f"Cannot generate a passphrase with {min_bits} bits of entropy")
 
 
 def generate_phrase(
-    length: int = 6, sep: str = "", capitalize: bool = True
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
 ) -> Passphrase:
     """
-    Generate a passphrase of the specified length.
+    Generate a passphrase of the specified length, or with at least `min_bits` bits of entropy.
 
     Args:
         length (int): The number of words in the passphrase.
         sep (str): Separator between words.
         capitalize (bool): Whether to capitalize words.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from, or its
+                                              name in the registry (see `wordlists`).
+                                              Defaults to the package wordlists.
+        min_bits (float | None): If given, generate the fewest words with at least this
+                                 much entropy instead of `length` words (see `min_bits_plan`).
+        min_chars (int | None): If given, the minimum number of characters of the passphrase.
+        max_chars (int | None): If given, the maximum number of characters of the passphrase.
+                                Character bounds are sampled directly (see `chars`).
 
     Returns:
         Passphrase: Generated passphrase with metadata.
+
+    Raises:
+        ValueError: If no passphrase meets the given length and bounds.
     """
-    # If length is greater than the maximum length, generate a phrase of the maximum length
-    # and then generate a new phrase of the remaining length, joining them with the conjunction.
-    if length > UNIT_PHRASE_MAX_LENGTH:
-        words: list[str] = []
-        sub_combinations: list[list[P]] = []
-
-        # Generate a list of sub-phrase lengths
-        lengths = generate_lengths(length, buffer=BUFFER)
-        total_length = (
-            sum(lengths)        # Total number of words in the sub-phrases
-            + len(lengths) - 1  # Number of conjunctions
-        )
+    selector, randbelow = RANDOM_SELECTOR, RANDOM_BELOW
+    if STATS.enabled:
+        # The same source of randomness, counting its reads
+        selector, randbelow = COUNTING_RANDOM.choice, COUNTING_RANDOM.randrange
+    if min_bits is None and min_chars is None and max_chars is None:
+        # The common case: generate directly, without building a factory for one phrase
+        return _generate_phrase(length, sep, capitalize, selector, randbelow, get_wordlists(wordlists))
+    factory = phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    return factory(selector, randbelow)
+
+
+def generate_phrases(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> list[Passphrase]:
+    """
+    Generate `n` passphrases of the specified length.
 
-        for index, curr_length in enumerate(lengths):
-            # Generate a sub-phrase of the current length and add it to the list
-            passphrase = generate_phrase(curr_length, sep, capitalize)
-            words.extend(passphrase.words)
-            sub_combinations.append(passphrase.combination)
+    Produces the same distribution of passphrases as calling `generate_phrase` `n` times,
+    but draws entropy from the OS in large blocks (see `ENTROPY_BLOCK_SIZE`) and maps it
+    to wordlist and combination indices with unbiased rejection sampling, instead of
+    issuing one syscall per word. Settings are resolved once (see `phrase_factory`), so
+    each phrase only costs its random picks: about 2–2.5× less than a `generate_phrase`
+    call.
 
-            if index == len(lengths) - 1:
-                continue
+    Args:
+        n (int): The number of passphrases to generate.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see `generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generate_phrase`).
 
-            # Get the conjunction word and capitalize it if necessary
-            conjunction = (
-                P.CONJUNCTION.word.capitalize() if capitalize else P.CONJUNCTION.word
-            )
-            words.append(conjunction)
-            sub_combinations.append([P.CONJUNCTION])
-
-        # Join the generated phrases with the separator and return the result
-        return Passphrase(
-            words=words, 
-            word_count=total_length, 
-            separator=sep,
-            capitalize=capitalize,
-            sub_combinations=sub_combinations,
+    Returns:
+        list[Passphrase]: Generated passphrases with metadata.
+    """
+    if n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    factory = phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    pool = EntropyPool()
+    choice, randbelow = pool.choice, pool.randbelow
+    return [factory(choice, randbelow) for _ in range(n)]
+
+
+def iter_phrases(
+    n: int | None = None,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> Iterator[Passphrase]:
+    """
+    Lazily generate passphrases of the specified length, one at a time.
+
+    Uses the same block-buffered entropy as `generate_phrases`, but never holds more
+    than one passphrase, which makes it suitable for streaming very large batches.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for no limit).
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see `generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generate_phrase`).
+
+    Yields:
+        Passphrase: Generated passphrases with metadata.
+    """
+    if n is not None and n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    factory = phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    pool = EntropyPool()
+    choice, randbelow = pool.choice, pool.randbelow
+    for _ in repeat(None) if n is None else range(n):
+        yield factory(choice, randbelow)
+
+
+PhraseFactory = Callable[[Selector, RandBelow], Passphrase]
+"""Generates a passphrase with fixed settings from the given sources of randomness."""
+
+
+def phrase_factory(
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> PhraseFactory:
+    """
+    Resolve the settings of a batch of passphrases once, for any source of randomness.
+
+    Wordlists, entropy targets and character bounds are looked up here, so each call
+    of the factory only makes the random choices.
+
+    Args:
+        See `generate_phrase`.
+
+    Returns:
+        PhraseFactory: Generates one passphrase from a selector and a `randbelow` function.
+
+    Raises:
+        ValueError: If no passphrase meets the given length and bounds.
+    """
+    wordlists = get_wordlists(wordlists)
+    if min_chars is not None or max_chars is not None:
+        if min_bits is not None:
+            raise ValueError("Character bounds cannot be combined with an entropy target")
+
+        # Imported here, as only character-bounded generation needs it
+        from .chars import char_plan, generate_bounded_phrase
+
+        plan = char_plan(length, sep, min_chars, max_chars, wordlists)
+        return lambda selector, randbelow: generate_bounded_phrase(plan, sep, capitalize, randbelow, wordlists)
+
+    grammar = compile_grammar(wordlists)
+    if min_bits is not None:
+        length, combinations = min_bits_plan(min_bits, wordlists)
+        if combinations is not None:
+            grammar = {**grammar, length: compile_combinations(combinations, wordlists)}
+    elif length not in grammar and length <= UNIT_PHRASE_MAX_LENGTH:
+        raise ValueError(f"Cannot generate phrase of length {length}")
+    if length <= UNIT_PHRASE_MAX_LENGTH:
+        return _unit_phrase_factory(length, sep, capitalize, wordlists, grammar[length])
+
+    # Sub-phrases come from unit phrase factories, built once
+    units = {
+        unit: _unit_phrase_factory(unit, sep, capitalize, wordlists, compiled)
+        for unit, compiled in grammar.items()
+        if unit <= UNIT_PHRASE_MAX_LENGTH
+    }
+
+    def sub_phrase(curr_length: int, selector: Selector, randbelow: RandBelow) -> Passphrase:
+        return units[curr_length](selector, randbelow)
+
+    return lambda selector, randbelow: _composite_phrase(
+        length, sep, capitalize, selector, randbelow, wordlists, sub_phrase
+    )
+
+
+def _unit_phrase_factory(
+    length: int,
+    sep: str,
+    capitalize: bool,
+    wordlists: WordlistSet,
+    compiled: CompiledCombinations,
+) -> PhraseFactory:
+    """
+    A factory of unit phrases, drawing the same passphrases as `_generate_phrase` from the
+    same randomness, with its lookups done once instead of for every phrase.
+    """
+    sample = compiled.alias.sample
+    combinations = compiled.combinations
+    positions = compiled.wordlists
+    # Whether every wordlist of each combination has words, so its words need no check
+    complete = tuple(all(lists) for lists in positions)
+    owner = None if wordlists.name == DEFAULT_WORDLISTS else wordlists
+
+    def unit_phrase(selector: Selector, randbelow: RandBelow) -> Passphrase:
+        index = sample(randbelow)
+        if complete[index]:
+            words = [selector(wordlist) for wordlist in positions[index]]
+        else:
+            words = [selector(wordlist) if wordlist else "" for wordlist in positions[index]]
+        if capitalize:
+            words = [word.capitalize() for word in words]
+        return Passphrase(words, length, sep, capitalize, [combinations[index]], owner)
+
+    return unit_phrase
+
+
+def _generate_phrase(
+    length: int,
+    sep: str,
+    capitalize: bool,
+    selector: Selector,
+    randbelow: RandBelow,
+    wordlists: WordlistSet,
+    grammar: dict[int, CompiledCombinations] | None = None,
+) -> Passphrase:
+    """
+    Generate a passphrase of the specified length using the given sources of randomness.
+
+    Combinations are drawn from the compiled `grammar` (by default, the one of the
+    wordlists, see `grammar.compile_grammar`) with a probability proportional to their
+    number of phrases, so every phrase of a unit length is equally likely. See
+    `generate_phrase` for details on the other arguments and the return value.
+    """
+    if grammar is None:
+        grammar = compile_grammar(wordlists)
+
+    # If length is greater than the maximum length, generate a phrase of the maximum length
+    # and then generate a new phrase of the remaining length, joining them with the conjunction.
+    if length > UNIT_PHRASE_MAX_LENGTH:
+        return _composite_phrase(
+            length, sep, capitalize, selector, randbelow, wordlists,
+            lambda curr_length, selector, randbelow: _generate_phrase(
+                curr_length, sep, capitalize, selector, randbelow, wordlists, grammar
+            ),
         )
 
-    # If the length is not in the length-to-word-combinations map, raise a ValueError
-    if length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+    # If the length is not in the compiled grammar, raise a ValueError
+    compiled = grammar.get(length)
+    if compiled is None:
         raise ValueError(f"Cannot generate phrase of length {length}")
 
-    # Choose a random combination of parts of speech for the given length
-    combination = RANDOM_SELECTOR(LENGTH_TO_WORD_COMBINATIONS_MAP[length])
+    # Choose a random combination of parts of speech for the given length, weighted by its number of phrases
+    index = compiled.alias.sample(randbelow)
+    combination = compiled.combinations[index]
 
     # NOTE: Uncomment this for debugging (will print the selected combination and its index)
     # print(
     #     f"COMBINATION LENGTH:INDEX:[*PARTS] : {length}"
-    #     f":{LENGTH_TO_WORD_COMBINATIONS_MAP[length].index(combination)}"
+    #     f":{index}"
     #     f":[{', '.join([x.name for x in combination])}]"
     # )
 
-    # Generate the words for the combination and capitalize them if necessary
-    words = [pos.word for pos in combination]
+    # Generate the words for the combination (from direct wordlist references) and capitalize them if necessary
+    words = [selector(w) if w else "" for w in compiled.wordlists[index]]
     if capitalize:
         words = [word.capitalize() for word in words]
 
@@ -160,4 +485,63 @@ def generate_phrase(
         separator=sep,
         capitalize=capitalize,
         sub_combinations=[combination],
+        wordlists=None if wordlists.name == DEFAULT_WORDLISTS else wordlists,
+    )
+
+
+def _composite_phrase(
+    length: int,
+    sep: str,
+    capitalize: bool,
+    selector: Selector,
+    randbelow: RandBelow,
+    wordlists: WordlistSet,
+    sub_phrase: Callable[[int, Selector, RandBelow], Passphrase],
+) -> Passphrase:
+    """
+    Generate a passphrase longer than `UNIT_PHRASE_MAX_LENGTH`, as sub-phrases (generated by
+    `sub_phrase` for each of a random list of unit lengths) joined with conjunctions.
+    """
+    words: list[str] = []
+    sub_combinations: list[list[P]] = []
+
+    # Generate a list of sub-phrase lengths
+    lengths = generate_lengths(length, buffer=BUFFER, randbelow=randbelow)
+    if STATS.enabled:
+        STATS.count("generator.composite_phrases")
+        STATS.count("generator.sub_phrases", len(lengths))
+        STATS.maximum("generator.max_sub_phrases", len(lengths))
+    total_length = (
+        sum(lengths)        # Total number of words in the sub-phrases
+        + len(lengths) - 1  # Number of conjunctions
     )
+
+    for index, curr_length in enumerate(lengths):
+        # Generate a sub-phrase of the current length and add it to the list
+        passphrase = sub_phrase(curr_length, selector, randbelow)
+        words.extend(passphrase.words)
+        sub_combinations.append(passphrase.combination)
+
+        if index == len(lengths) - 1:
+            continue
+
+        # Get the conjunction word and capitalize it if necessary
+        conjunction = _select_word(P.CONJUNCTION, selector, wordlists)
+        words.append(conjunction.capitalize() if capitalize else conjunction)
+        sub_combinations.append([P.CONJUNCTION])
+
+    # Join the generated phrases with the separator and return the result
+    return Passphrase(
+        words=words, 
+        word_count=total_length, 
+        separator=sep,
+        capitalize=capitalize,
+        sub_combinations=sub_combinations,
+        wordlists=None if wordlists.name == DEFAULT_WORDLISTS else wordlists,
+    )
+
+
+def _select_word(pos: P, selector: Selector, wordlists: WordlistSet) -> str:
+    """A random word for the given part of speech (empty if its wordlist is empty)."""
+    words = wordlists[pos]
+    return selector(words) if words else ""
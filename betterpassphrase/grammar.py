@@ -0,0 +1,166 @@
+"""
+The passphrase grammar, compiled for fast and entropy-maximizing generation.
+
+`LENGTH_TO_WORD_COMBINATIONS_MAP` is compiled once per wordlist set into flat tuples:
+for each length, its combinations, direct references to the wordlist of each of their
+positions, and an alias table weighting each combination by its number of phrases.
+Picking a combination through the alias table takes O(1) time, and makes every phrase
+of a length equally likely, which maximizes the entropy of the passphrases of that
+length (picking combinations uniformly would favour the phrases of small combinations).
+
+```python
+from secrets import choice, randbelow
+from betterpassphrase.grammar import compile_grammar
+
+compiled = compile_grammar()[6]
+index = compiled.alias.sample(randbelow)
+words = [choice(wordlist) for wordlist in compiled.wordlists[index]]
+```
+"""
+import math
+from typing import Callable, NamedTuple, Sequence
+
+from .mappings import LENGTH_TO_WORD_COMBINATIONS_MAP
+from .models import P
+from .wordlists import WordlistSet, get_wordlists
+
+
+_WORD_BITS = 32
+_WORD_RANGE = 1 << _WORD_BITS
+
+
+class AliasTable:
+    """
+    Walker's alias method over exact integer weights.
+
+    A sample picks a column uniformly, then keeps it or switches to its alias. Weights
+    are integers and thresholds are exact fractions of the total weight, so the
+    probability of each index is exactly its share of the total. The threshold is
+    compared against one random 32-bit word first, and only on a tie (with probability
+    2^-32) against a draw below the total weight. The column and the word come from a
+    single draw, so sampling costs one random number.
+    """
+
+    def __init__(self, weights: Sequence[int]):
+        """
+        Args:
+            weights (Sequence[int]): The non-negative weight of each index (not all zero).
+        """
+        if not weights or min(weights) < 0 or not any(weights):
+            raise ValueError("Alias tables need non-negative weights, not all zero")
+
+        divisor = math.gcd(*weights)
+        weights = [weight // divisor for weight in weights]
+        self.size = len(weights)
+        self.total = sum(weights)
+
+        # Threshold of each column, out of `total`: below it the column keeps its own index
+        scaled = [weight * self.size for weight in weights]
+        thresholds = [self.total] * self.size
+        aliases = list(range(self.size))
+        small = [index for index, value in enumerate(scaled) if value < self.total]
+        large = [index for index, value in enumerate(scaled) if value >= self.total]
+        while small and large:
+            index, alias = small.pop(), large.pop()
+            thresholds[index], aliases[index] = scaled[index], alias
+            scaled[alias] -= self.total - scaled[index]
+            (small if scaled[alias] < self.total else large).append(alias)
+
+        self.thresholds = tuple(thresholds)
+        self.aliases = tuple(aliases)
+        # Each threshold as a whole number of 32-bit steps, and what is left over
+        self.cuts = tuple((threshold << _WORD_BITS) // self.total for threshold in thresholds)
+        self.remainders = tuple((threshold << _WORD_BITS) % self.total for threshold in thresholds)
+        # A column and a 32-bit word, drawn as one number
+        self.span = self.size << _WORD_BITS
+
+    def sample(self, randbelow: Callable[[int], int]) -> int:
+        """
+        A random index, drawn with a probability proportional to its weight.
+
+        Args:
+            randbelow (Callable[[int], int]): Returns a uniformly random integer in `[0, n)`.
+
+        Returns:
+            int: The index.
+        """
+        column, word = divmod(randbelow(self.span), _WORD_RANGE)
+        cut = self.cuts[column]
+        if word != cut:
+            return column if word < cut else self.aliases[column]
+        # Tie: the rest of the threshold decides, exactly
+        return column if randbelow(self.total) < self.remainders[column] else self.aliases[column]
+
+    def probability(self, index: int) -> float:
+        """The probability of drawing an index."""
+        in_column = self.thresholds[index]
+        as_alias = sum(
+            self.total - threshold
+            for column, (threshold, alias) in enumerate(zip(self.thresholds, self.aliases))
+            if alias == index and column != index
+        )
+        return (in_column + as_alias) / (self.size * self.total)
+
+
+class CompiledCombinations(NamedTuple):
+    """Combinations of parts of speech, compiled for sampling weighted by their phrase counts."""
+
+    combinations: tuple[list[P], ...]
+    """The combinations."""
+
+    wordlists: tuple[tuple[Sequence[str], ...], ...]
+    """The wordlist of each position of each combination."""
+
+    alias: AliasTable
+    """Alias table over the combinations, weighted by their numbers of phrases."""
+
+
+Grammar = dict[int, CompiledCombinations]
+"""The compiled combinations of each unit phrase length."""
+
+
+def compile_combinations(combinations: Sequence[list[P]], wordlists: WordlistSet) -> CompiledCombinations:
+    """
+    Compile combinations of parts of speech, cached per wordlist set.
+
+    Combinations without any phrase (i.e. with an empty wordlist) keep a weight of 1, so
+    that passphrases can still be generated from incomplete wordlists (with empty words).
+
+    Args:
+        combinations (Sequence[list[P]]): The combinations.
+        wordlists (WordlistSet): The wordlist set.
+
+    Returns:
+        CompiledCombinations: The compiled combinations.
+    """
+    compiled_cache = wordlists.tables.setdefault("compiled_combinations", {})
+    key = tuple(map(tuple, combinations))
+    compiled = compiled_cache.get(key)
+    if compiled is None:
+        lists = wordlists.lists
+        compiled = compiled_cache[key] = CompiledCombinations(
+            tuple(combinations),
+            tuple(tuple(lists[pos] for pos in combination) for combination in combinations),
+            AliasTable([wordlists.combination_one_of(combination) or 1 for combination in key]),
+        )
+    return compiled
+
+
+def compile_grammar(wordlists: str | WordlistSet | None = None) -> Grammar:
+    """
+    Compile `LENGTH_TO_WORD_COMBINATIONS_MAP` for a wordlist set, once per set.
+
+    Args:
+        wordlists (str | WordlistSet | None): The wordlist set (see `generator.generate_phrase`).
+
+    Returns:
+        Grammar: The compiled combinations of each unit phrase length.
+    """
+    wordlists = get_wordlists(wordlists)
+    grammar = wordlists.tables.get("grammar")
+    if grammar is None:
+        grammar = wordlists.tables["grammar"] = {
+            length: compile_combinations(combinations, wordlists)
+            for length, combinations in LENGTH_TO_WORD_COMBINATIONS_MAP.items()
+        }
+    return grammar
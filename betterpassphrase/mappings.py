@@ -127,3 +127,23 @@ UNIT_PHRASE_MIN_LENGTH = UNIT_PHRASE_LENGTHS[0]
 
 UNIT_PHRASE_MAX_LENGTH = UNIT_PHRASE_LENGTHS[-1]
 """Maximum length allowed to generate an unit passphrase."""
+
+COMBINATIONS: list[tuple[P, ...]] = [
+    tuple(combination)
+    for length in UNIT_PHRASE_LENGTHS
+    for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[length]
+] + [(P.CONJUNCTION,)]
+"""
+Every combination of parts of speech, in a stable order, so that a combination can be
+referred to by its index (its combination id). The last one is the single conjunction
+used to join the sub-phrases of a long passphrase.
+"""
+
+CONJUNCTION_COMBINATION_ID = len(COMBINATIONS) - 1
+"""Combination id of the conjunction joining the sub-phrases of a long passphrase."""
+
+COMBINATION_IDS: dict[tuple[P, ...], int] = {
+    combination: combination_id
+    for combination_id, combination in enumerate(COMBINATIONS)
+}
+"""Mapping of each combination of parts of speech to its combination id."""
@@ -1,10 +1,15 @@
+import math
 from enum import Enum
 from pathlib import Path
-from typing import NamedTuple
-from functools import cached_property, reduce
+from operator import mul
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+from functools import reduce
 
 from .config import RANDOM_SELECTOR, PARTS_OF_SPEECH_DIR
 
+if TYPE_CHECKING:
+    from .wordlists import WordlistSet
+
 
 class PartsOfSpeech(str, Enum):
     """
@@ -29,22 +34,43 @@ class PartsOfSpeech(str, Enum):
         """
         return PARTS_OF_SPEECH_DIR / self.value
 
-    @cached_property
+    @property
     def words(self) -> list[str]:
         """
-        List of words for the given part of speech.
+        List of words for the given part of speech in the default wordlist set.
+
+        A copy of `wordlist`, so it follows the set swapped in by `reload` too.
 
         Returns:
             list[str]: List of words.
         """
-        wordfile = self.filepath
-        if not wordfile.exists():
-            return []
-        return [
-            x.strip()
-            for x in wordfile.read_text().splitlines()
-        ]
+        return list(_wordlists.get_wordlists()[self])
+
+    @property
+    def wordlist(self) -> Sequence[str]:
+        """
+        Words for the given part of speech in the default wordlist set, as used for generation.
+
+        Backed by the memory-mapped wordlist bundle when it is enabled and up to date,
+        so words are decoded on access instead of being parsed from text up front
+        (see `wordlists.WordlistSet`). Looked up in the current default set on each
+        access, so it follows the set swapped in by `reload`.
+
+        Returns:
+            Sequence[str]: Sequence of words.
+        """
+        return _wordlists.get_wordlists()[self]
     
+    @property
+    def word_indices(self) -> dict[str, int]:
+        """
+        Mapping of each word (lowercased) to its index in `wordlist`.
+
+        Returns:
+            dict[str, int]: Word to index mapping. Repeated words map to their first index.
+        """
+        return _wordlists.get_wordlists().word_indices(self)
+
     @property
     def word(self) -> str:
         """
@@ -53,9 +79,9 @@ class PartsOfSpeech(str, Enum):
         Returns:
             str: A random word.
         """
-        if not self.words:
+        if not self.wordlist:
             return ""
-        return RANDOM_SELECTOR(self.words)
+        return RANDOM_SELECTOR(self.wordlist)
     
     @property
     def n(self) -> int:
@@ -65,7 +91,7 @@ class PartsOfSpeech(str, Enum):
         Returns:
             int: The number of words.
         """
-        return len(self.words)
+        return len(self.wordlist)
 
     def __str__(self) -> str:
         """
@@ -104,6 +130,15 @@ class Passphrase(NamedTuple):
     sub_combinations: list[list[PartsOfSpeech]]
     """A list of sub-combinations of parts of speech used to generate the passphrase."""
 
+    wordlists: "WordlistSet | None" = None
+    """The wordlist set the passphrase was generated from (`None` for the default set)."""
+
+    space: int | None = None
+    """
+    The number of passphrases it was drawn from, if restricted to fewer than its combination
+    allows (e.g. by a character limit, see `chars`). `None` if unrestricted.
+    """
+
     @property
     def passphrase(self) -> str:
         """The generated passphrase."""
@@ -119,29 +154,41 @@ class Passphrase(NamedTuple):
     @property
     def one_of(self) -> int:
         """This is one of the different passphrases can be generated using the same set of parts of speech wordlists."""
-        return reduce(lambda x, y: x * y, [pos.n for pos in self.combination])
+        if self.space is not None:
+            return self.space
+        one_of = _wordlists.get_wordlists(self.wordlists).combination_one_of
+        return reduce(mul, (one_of(tuple(phrase)) for phrase in self.sub_combinations), 1)
 
     @property
     def wordlist_probability(self) -> float:
         """The probability of generating the passphrase using the same set of parts of speech wordlists."""
         return 1 / self.one_of
+
+    @property
+    def entropy_bits(self) -> float:
+        """The entropy of the passphrase in bits, given its combination of parts of speech wordlists."""
+        if self.space is not None:
+            return math.log2(self.space)
+        bits = _wordlists.get_wordlists(self.wordlists).combination_entropy_bits
+        return sum(bits(tuple(phrase)) for phrase in self.sub_combinations)
     
     @property
     def character_one_of(self) -> int:
         """This is one of the different passphrases can be generated using the same of alphabetical characters."""
-        return reduce(
-            lambda x, y: x * y,
-            [
-                26 if char.isalpha() else 10 if char.isdigit() else 1
-                for char in "".join(self.words)
-            ],
-        )
+        alpha, digits = _count_characters(self.words)
+        return 26 ** alpha * 10 ** digits
 
     @property
     def character_probability(self) -> float:
         """The probability of generating the passphrase using alphabetical characters."""
         return 1 / self.character_one_of
 
+    @property
+    def character_entropy_bits(self) -> float:
+        """The entropy of the passphrase in bits, if it were made of random alphabetical characters."""
+        alpha, digits = _count_characters(self.words)
+        return alpha * _ALPHA_BITS + digits * _DIGIT_BITS
+
     def __str__(self) -> str:
         """The string representation of the passphrase."""
         return self.passphrase
@@ -151,3 +198,49 @@ P = PartsOfSpeech
 """
 A short alias for the PartsOfSpeech class.
 """
+
+
+_ALPHA_BITS = math.log2(26)
+_DIGIT_BITS = math.log2(10)
+
+
+def combination_one_of(combination: tuple[PartsOfSpeech, ...]) -> int:
+    """
+    Number of different phrases that can be generated from a combination of parts of speech.
+
+    Computed once per combination from the wordlist sizes of the default set, and cached
+    on the set (see `wordlists.WordlistSet.combination_one_of`).
+
+    Args:
+        combination (tuple[PartsOfSpeech, ...]): The combination of parts of speech.
+
+    Returns:
+        int: The number of phrases.
+    """
+    return _wordlists.get_wordlists().combination_one_of(combination)
+
+
+def combination_entropy_bits(combination: tuple[PartsOfSpeech, ...]) -> float:
+    """
+    Entropy in bits of a phrase drawn uniformly from a combination of parts of speech.
+
+    Args:
+        combination (tuple[PartsOfSpeech, ...]): The combination of parts of speech.
+
+    Returns:
+        float: The entropy in bits (`log2` of `combination_one_of`).
+    """
+    return _wordlists.get_wordlists().combination_entropy_bits(combination)
+
+
+def _count_characters(words: list[str]) -> tuple[int, int]:
+    """The number of alphabetical and of digit characters in the words."""
+    text = "".join(words)
+    digits = sum(map(str.isdigit, text))
+    alpha = len(text) - digits if text.isalnum() else sum(map(str.isalpha, text))
+    return alpha, digits
+
+
+# Imported last, as `wordlists` imports this module: a module-level reference is resolved
+# once, where a function-level import would cost more than the lookups it serves
+from . import wordlists as _wordlists
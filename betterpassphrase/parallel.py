@@ -0,0 +1,306 @@
+import os
+from collections import deque
+from contextlib import ExitStack
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar
+
+from .config import PARALLEL_CHUNK_SIZE
+from .generator import generate_phrases, phrase_factory
+from .models import Passphrase
+from .wordlists import DEFAULT_WORDLISTS, WordlistSet, get_wordlists
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+T = TypeVar("T")
+
+
+def resolve_workers(n: int, workers: int | None = None, chunk_size: int = PARALLEL_CHUNK_SIZE) -> int:
+    """
+    The number of worker processes to use for generating `n` phrases.
+
+    Args:
+        n (int): The number of phrases to generate.
+        workers (int | None): Requested number of workers. `None` or `0` picks one
+                              worker per CPU, but never more than there are chunks.
+        chunk_size (int): Number of phrases generated per work unit.
+
+    Returns:
+        int: The number of workers (1 means generating in the current process).
+    """
+    if workers is not None and workers < 0:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    chunks = max(1, -(-n // chunk_size))
+    if not workers:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, chunks))
+
+
+def iter_batches(
+    batch_func: Callable[[int, int], list[T]],
+    n: int,
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    shared_wordlists: WordlistSet | None = None,
+) -> Iterator[list[T]]:
+    """
+    Run `batch_func(index, size)` for consecutive chunks of `n` items, spread across processes.
+
+    Each chunk is a work unit handed to a process pool, which sidesteps the GIL for
+    CPU-bound work. Only a bounded number of chunks is in flight at any time, so memory
+    stays flat no matter how large `n` is. Batches are yielded in submission order.
+
+    Args:
+        batch_func (Callable[[int, int], list[T]]): Produces the batch with the given chunk
+                                                    index and size. Must be picklable (e.g. a
+                                                    module level function or a
+                                                    `functools.partial` of one).
+        n (int): The total number of items.
+        workers (int | None): Number of worker processes (see `resolve_workers`).
+        chunk_size (int): Number of items produced per work unit.
+        shared_wordlists (WordlistSet | None): If given, this set is published in shared
+                                               memory for the lifetime of the pool, and
+                                               workers attach to it instead of loading
+                                               it (see `shared`).
+
+    Yields:
+        list[T]: Batches of items.
+    """
+    if n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    sizes = (min(chunk_size, n - start) for start in range(0, n, chunk_size))
+    workers = resolve_workers(n, workers, chunk_size)
+
+    if workers == 1:
+        for index, size in enumerate(sizes):
+            yield batch_func(index, size)
+        return
+
+    # Imported here, as it takes longer to import than generating a few phrases
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ExitStack() as stack:
+        initializer, initargs = None, ()
+        if shared_wordlists is not None:
+            from .shared import attach_wordlists, publish_wordlists
+
+            initializer = attach_wordlists
+            initargs = stack.enter_context(publish_wordlists(shared_wordlists)).initargs
+        executor = stack.enter_context(
+            ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+        )
+        pending: "deque[Future]" = deque()
+        for index, size in enumerate(sizes):
+            pending.append(executor.submit(batch_func, index, size))
+            # Keep every worker busy, with one spare batch each, but no more
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_phrase_batches(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    ranks: range | None = None,
+    unique: bool = False,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+    seed: int | None = None,
+    share_wordlists: bool = False,
+) -> Iterator[list[Passphrase]]:
+    """
+    Generate `n` passphrases in batches of up to `chunk_size`, spread across processes.
+
+    See `iter_batches` for how the work is distributed. Unique batches share one
+    permutation key, and each chunk walks its own contiguous range of permutation
+    positions (see `unique.iter_unique_phrases`), so no two batches can overlap. Chunks
+    skip the few positions holding a second rank of an earlier passphrase, so unique
+    batches can be slightly smaller than `chunk_size`, and the shortfall is made up from
+    the next positions.
+
+    Args:
+        n (int): The number of passphrases to generate.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        workers (int | None): Number of worker processes (see `resolve_workers`).
+        chunk_size (int): Number of phrases generated per work unit.
+        ranks (range | None): If given, only generate passphrases with these ranks
+                              (see `codec.shard_range`).
+        unique (bool): Whether all the passphrases must be different from each other.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+        min_bits (float | None): If given, generate the fewest words with at least this much
+                                 entropy instead of `length` words (see `generator.min_bits_plan`).
+        min_chars (int | None): If given, the minimum number of characters of each passphrase.
+        max_chars (int | None): If given, the maximum number of characters of each passphrase
+                                (see `chars`).
+        seed (int | None): If given, generate reproducible passphrases from this seed
+                           instead. NOT SECURE (see `seeded`). The output does not depend
+                           on `workers` or `chunk_size`.
+        share_wordlists (bool): Whether worker processes attach to the wordlists in shared
+                                memory rather than each load them (see `shared`).
+
+    Yields:
+        list[Passphrase]: Batches of generated passphrases.
+
+    Raises:
+        ValueError: If `unique` is set and the separator cannot tell words apart, or
+                    `ranks` or `unique` are combined with custom wordlists, `min_bits` or
+                    character bounds, or no passphrase meets the length and bounds.
+    """
+    wordlists = get_wordlists(wordlists)
+    if (unique or ranks is not None) and wordlists.name != DEFAULT_WORDLISTS:
+        # Ranks are defined over the default wordlists (see `codec`)
+        raise ValueError("Sharded and unique generation only support the default wordlists")
+    bounded = min_chars is not None or max_chars is not None
+    if (unique or ranks is not None) and (min_bits is not None or bounded):
+        # Ranks number every passphrase of a length, not only those meeting the target
+        raise ValueError("Sharded and unique generation do not support entropy targets or character bounds")
+    if (unique or ranks is not None) and seed is not None:
+        raise ValueError("Sharded and unique generation cannot be seeded")
+
+    # Fail before any work is handed out if the target or bounds cannot be met
+    phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+
+    if unique:
+        from .codec import phrase_space
+        from .unique import UNIQUE_KEY_SIZE, check_separable
+
+        check_separable(sep, capitalize)
+        if ranks is None:
+            ranks = range(phrase_space(length))
+        if n > ranks.stop - ranks.start:
+            raise ValueError(f"At most {max(0, ranks.stop - ranks.start)} unique passphrases available, {n} requested")
+        batch_func = partial(
+            _unique_batch,
+            length=length,
+            sep=sep,
+            capitalize=capitalize,
+            ranks=ranks,
+            key=os.urandom(UNIQUE_KEY_SIZE),
+            chunk_size=chunk_size,
+        )
+        return _iter_unique_batches(batch_func, n, ranks.stop - ranks.start, workers, chunk_size)
+    elif seed is not None:
+        batch_func = partial(
+            _seeded_batch,
+            length=length,
+            sep=sep,
+            capitalize=capitalize,
+            wordlists=wordlists,
+            min_bits=min_bits,
+            min_chars=min_chars,
+            max_chars=max_chars,
+            seed=seed,
+            chunk_size=chunk_size,
+        )
+    else:
+        batch_func = partial(
+            _random_batch,
+            length=length,
+            sep=sep,
+            capitalize=capitalize,
+            ranks=ranks,
+            wordlists=wordlists,
+            min_bits=min_bits,
+            min_chars=min_chars,
+            max_chars=max_chars,
+        )
+    return iter_batches(batch_func, n, workers, chunk_size, wordlists if share_wordlists else None)
+
+
+def _random_batch(
+    index: int,
+    size: int,
+    length: int,
+    sep: str,
+    capitalize: bool,
+    ranks: range | None,
+    wordlists: WordlistSet,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> list[Passphrase]:
+    """Generate a batch of independent random passphrases (the chunk index is unused)."""
+    if ranks is None:
+        return generate_phrases(size, length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+
+    from .codec import generate_ranked_phrases
+
+    return generate_ranked_phrases(size, ranks, length, sep, capitalize)
+
+
+def _seeded_batch(
+    index: int,
+    size: int,
+    length: int,
+    sep: str,
+    capitalize: bool,
+    wordlists: WordlistSet,
+    min_bits: float | None,
+    min_chars: int | None,
+    max_chars: int | None,
+    seed: int,
+    chunk_size: int,
+) -> list[Passphrase]:
+    """Generate chunk `index` of a reproducible sequence of passphrases, i.e. passphrases `index * chunk_size` onwards."""
+    from .seeded import generate_seeded_phrases
+
+    return generate_seeded_phrases(
+        size, length, sep, capitalize, seed, index * chunk_size, wordlists, min_bits, min_chars, max_chars
+    )
+
+
+def _iter_unique_batches(
+    batch_func: Callable[..., list[Passphrase]],
+    n: int,
+    span: int,
+    workers: int | None,
+    chunk_size: int,
+) -> Iterator[list[Passphrase]]:
+    """
+    Run unique batches over the first `n` of `span` permutation positions, then over as
+    many of the next ones as passphrases are still missing, until there are `n` of them.
+
+    Raises:
+        ValueError: If the positions run out first.
+    """
+    first, missing = 0, n
+    while missing:
+        if first >= span:
+            raise ValueError(f"Only {n - missing} unique passphrases available, {n} requested")
+        positions = missing
+        for batch in iter_batches(partial(batch_func, first=first), positions, workers, chunk_size):
+            missing -= len(batch)
+            yield batch
+        first += positions
+
+
+def _unique_batch(
+    index: int,
+    size: int,
+    length: int,
+    sep: str,
+    capitalize: bool,
+    ranks: range,
+    key: bytes,
+    first: int,
+    chunk_size: int,
+) -> list[Passphrase]:
+    """Generate the unique passphrases at permutation positions `first + index * chunk_size` to `size` further on."""
+    from .unique import iter_unique_phrases
+
+    offset = first + index * chunk_size
+    return list(iter_unique_phrases(None, length, sep, capitalize, key, ranks, offset, offset + size))
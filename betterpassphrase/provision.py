@@ -0,0 +1,257 @@
+"""
+Bulk credential provisioning: generate passphrases and hash them, across processes.
+
+Each work unit generates a chunk of passphrases and hashes each of them with a key
+derivation function from `hashlib` (scrypt or PBKDF2-HMAC-SHA256) and a random salt, in
+a worker process (see `parallel.iter_batches`). Hashing dominates the cost, so it
+scales with the number of cores, and only a bounded number of chunks is in flight, so
+memory stays flat however many credentials are provisioned. Hashes are PHC strings
+(`$scrypt$ln=14,r=8,p=1$<salt>$<hash>`, `$pbkdf2-sha256$i=600000$<salt>$<hash>`), as
+accepted by most password hashing libraries.
+
+```python
+from betterpassphrase.provision import iter_credential_batches, verify_passphrase
+
+for batch in iter_credential_batches(10_000, length=6, sep="-", kdf="scrypt"):
+    for credential in batch:
+        assert verify_passphrase(credential.passphrase, credential.hash)
+```
+"""
+import os
+import hmac
+import base64
+import hashlib
+from functools import partial
+from typing import Iterator, NamedTuple
+
+from .config import PBKDF2_ITERATIONS, PROVISION_CHUNK_SIZE, PROVISION_KDF, SCRYPT_N, SCRYPT_P, SCRYPT_R
+from .export import export_rows
+from .generator import generate_phrases, phrase_factory
+from .parallel import iter_batches
+from .wordlists import WordlistSet, get_wordlists
+
+
+KDFS = ("scrypt", "pbkdf2")
+"""The supported key derivation functions."""
+
+CREDENTIAL_FIELDS = ("id", "passphrase", "hash")
+"""The fields of each exported credential, in order."""
+
+SALT_SIZE = 16
+HASH_SIZE = 32
+
+_KDF_IDS = {"scrypt": "scrypt", "pbkdf2": "pbkdf2-sha256"}
+"""The identifier of each key derivation function in PHC strings."""
+
+
+class Credential(NamedTuple):
+    """A provisioned credential: a passphrase, its hash, and its id within the run."""
+
+    id: int
+    """The index of the credential."""
+
+    passphrase: str
+    """The passphrase."""
+
+    hash: str
+    """The hash of the passphrase, as a PHC string."""
+
+    def __str__(self) -> str:
+        return f"{self.id}\t{self.passphrase}\t{self.hash}"
+
+
+def hash_passphrase(passphrase: str, kdf: str = PROVISION_KDF, cost: int | None = None) -> str:
+    """
+    Hash a passphrase with a random salt.
+
+    Args:
+        passphrase (str): The passphrase.
+        kdf (str): The key derivation function (see `KDFS`).
+        cost (int | None): The scrypt `N` (a power of 2) or the number of PBKDF2 iterations.
+                           Defaults to `SCRYPT_N` or `PBKDF2_ITERATIONS`.
+
+    Returns:
+        str: The hash, as a PHC string.
+    """
+    cost = resolve_cost(kdf, cost)
+    salt = os.urandom(SALT_SIZE)
+    if kdf == "scrypt":
+        parameters = f"ln={cost.bit_length() - 1},r={SCRYPT_R},p={SCRYPT_P}"
+        key = _scrypt(passphrase, salt, cost, SCRYPT_R, SCRYPT_P)
+    else:
+        parameters = f"i={cost}"
+        key = hashlib.pbkdf2_hmac("sha256", passphrase.encode(), salt, cost, HASH_SIZE)
+    return f"${_KDF_IDS[kdf]}${parameters}${_b64encode(salt)}${_b64encode(key)}"
+
+
+def verify_passphrase(passphrase: str, encoded: str) -> bool:
+    """
+    Check a passphrase against a hash from `hash_passphrase`.
+
+    Args:
+        passphrase (str): The passphrase.
+        encoded (str): The hash, as a PHC string.
+
+    Returns:
+        bool: Whether the passphrase matches the hash.
+
+    Raises:
+        ValueError: If the hash is malformed or from an unsupported function.
+    """
+    try:
+        _, kdf_id, parameters, salt, key = encoded.split("$")
+        parameters = dict(parameter.split("=") for parameter in parameters.split(","))
+        salt, key = _b64decode(salt), _b64decode(key)
+        # A short (or missing) key or salt would weaken or disable the check
+        if len(key) != HASH_SIZE or not salt:
+            raise ValueError(f"expected a {HASH_SIZE} byte key and a salt")
+        if kdf_id == _KDF_IDS["scrypt"]:
+            derived = _scrypt(passphrase, salt, 1 << int(parameters["ln"]), int(parameters["r"]), int(parameters["p"]))
+        elif kdf_id == _KDF_IDS["pbkdf2"]:
+            derived = hashlib.pbkdf2_hmac("sha256", passphrase.encode(), salt, int(parameters["i"]), HASH_SIZE)
+        else:
+            raise ValueError(f"Unsupported hash: {kdf_id!r}")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid hash: {e}")
+    return hmac.compare_digest(derived, key)
+
+
+def resolve_cost(kdf: str, cost: int | None = None) -> int:
+    """
+    The cost of a key derivation function, checked.
+
+    Args:
+        kdf (str): The key derivation function (see `KDFS`).
+        cost (int | None): The requested cost (see `hash_passphrase`), or `None` for the default.
+
+    Returns:
+        int: The cost.
+
+    Raises:
+        ValueError: If the function is unsupported or the cost invalid.
+    """
+    if kdf not in KDFS:
+        raise ValueError(f"Unknown key derivation function: {kdf!r}")
+    if cost is None:
+        return SCRYPT_N if kdf == "scrypt" else PBKDF2_ITERATIONS
+    if cost < 2 or (kdf == "scrypt" and cost & (cost - 1)):
+        power = " and a power of 2" if kdf == "scrypt" else ""
+        raise ValueError(f"{kdf} needs a cost of at least 2{power}, not {cost}")
+    return cost
+
+
+def iter_credential_batches(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    kdf: str = PROVISION_KDF,
+    cost: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = PROVISION_CHUNK_SIZE,
+    start: int = 0,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> Iterator[list[Credential]]:
+    """
+    Generate and hash `n` passphrases in batches of up to `chunk_size`, spread across processes.
+
+    Args:
+        n (int): The number of credentials to provision.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        kdf (str): The key derivation function (see `KDFS`).
+        cost (int | None): The cost of the function (see `hash_passphrase`).
+        workers (int | None): Number of worker processes (see `parallel.resolve_workers`).
+        chunk_size (int): Number of credentials provisioned per work unit.
+        start (int): The id of the first credential, ids being consecutive.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from
+                                              (see `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Yields:
+        list[Credential]: Batches of credentials, in id order.
+
+    Raises:
+        ValueError: If the function or its cost is invalid, or no passphrase meets the
+                    length and bounds.
+    """
+    cost = resolve_cost(kdf, cost)
+    wordlists = get_wordlists(wordlists)
+    # Fail before any work is handed out if the target or bounds cannot be met
+    phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+
+    batch_func = partial(
+        _credential_batch,
+        length=length,
+        sep=sep,
+        capitalize=capitalize,
+        kdf=kdf,
+        cost=cost,
+        first=start,
+        chunk_size=chunk_size,
+        wordlists=wordlists,
+        min_bits=min_bits,
+        min_chars=min_chars,
+        max_chars=max_chars,
+    )
+    return iter_batches(batch_func, n, workers, chunk_size)
+
+
+def export_credentials(batch: list[Credential], fmt: str) -> str:
+    """
+    Format a batch of credentials as records, one per line (see `export.export_rows`).
+
+    Args:
+        batch (list[Credential]): The credentials.
+        fmt (str): The export format (see `export.EXPORT_FORMATS`).
+
+    Returns:
+        str: The records, including the trailing newline.
+    """
+    return export_rows(batch, fmt, CREDENTIAL_FIELDS)
+
+
+def _credential_batch(
+    index: int,
+    size: int,
+    length: int,
+    sep: str,
+    capitalize: bool,
+    kdf: str,
+    cost: int,
+    first: int,
+    chunk_size: int,
+    wordlists: WordlistSet,
+    min_bits: float | None,
+    min_chars: int | None,
+    max_chars: int | None,
+) -> list[Credential]:
+    """Generate and hash chunk `index` of the credentials, i.e. ids `first + index * chunk_size` onwards."""
+    phrases = generate_phrases(size, length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    first += index * chunk_size
+    return [
+        Credential(first + offset, phrase.passphrase, hash_passphrase(phrase.passphrase, kdf, cost))
+        for offset, phrase in enumerate(phrases)
+    ]
+
+
+def _scrypt(passphrase: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    """scrypt, allowing as much memory as the cost needs (OpenSSL caps it at 32 MiB by default)."""
+    maxmem = 128 * r * (2 * n + p + 2)
+    return hashlib.scrypt(passphrase.encode(), salt=salt, n=n, r=r, p=p, maxmem=maxmem, dklen=HASH_SIZE)
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64 without padding, as in PHC strings."""
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    """Decode base64 without padding."""
+    return base64.b64decode(data + "=" * (-len(data) % 4))
@@ -0,0 +1,175 @@
+"""
+Hot reloading of wordlist sets in long-running processes.
+
+A reload builds a complete new `WordlistSet` from the current files (rebuilding its
+bundle if needed), along with every table derived from it (the compiled grammar, the
+entropy tables and, for the default set, the codec tables), then swaps it into the
+registry with a single assignment. Every table derived from a set lives on that set,
+and generation, the entropy tables and the codec resolve the set once per call (the
+`PartsOfSpeech` wordlist properties on each access), so a call in flight on another
+thread keeps using the old set and its tables until it returns, and never sees a
+half-built table.
+
+Changes are detected by a `WordlistWatcher` thread, which polls the modification times
+and sizes of the wordlist files and only reloads a set when the checksum of their
+contents changed. The generation path itself never checks anything.
+
+```python
+from betterpassphrase.reload import WordlistWatcher
+
+with WordlistWatcher(interval=10):
+    serve_forever()  # Edits to parts_of_speech/*.txt are picked up within 10 seconds
+```
+"""
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from . import codec, entropy
+from .bundle import source_checksum
+from .config import WORDLIST_RELOAD_INTERVAL
+from .grammar import compile_grammar
+from .models import PartsOfSpeech
+from .stats import STATS
+from .wordlists import DEFAULT_WORDLISTS, REGISTRY, WordlistSet
+
+
+Fingerprint = tuple[tuple[int, int] | None, ...]
+"""The modification time and size of each wordlist file of a set (`None` if missing)."""
+
+
+def reload_wordlists(name: str = DEFAULT_WORDLISTS, force: bool = False) -> WordlistSet | None:
+    """
+    Reload a loaded wordlist set if the contents of its files changed, and swap it in.
+
+    Args:
+        name (str): The name of the set.
+        force (bool): Whether to reload the set even if its files did not change.
+
+    Returns:
+        WordlistSet | None: The new set, or `None` if the set is unchanged (or not loaded,
+                            in which case it is read afresh when next used).
+
+    Raises:
+        OSError: If the wordlist files cannot be read. The current set is kept.
+    """
+    if name != DEFAULT_WORDLISTS and name not in REGISTRY.loaded():
+        return None
+    current = REGISTRY.get(name)
+    if not force and current.checksum is not None:
+        if source_checksum(current.directory, [pos.value for pos in PartsOfSpeech]) == current.checksum:
+            return None
+
+    with STATS.timer("wordlists.reload"):
+        wordlists = WordlistSet(name, current.directory, current.bundle_path, exclude=current.exclude)
+        # Build the tables now, rather than on the first calls after the swap
+        compile_grammar(wordlists)
+        entropy.build_tables(wordlists)
+        if name == DEFAULT_WORDLISTS:
+            codec.build_tables(wordlists)
+        swap_wordlists(wordlists)
+    return wordlists
+
+
+def swap_wordlists(wordlists: WordlistSet) -> None:
+    """
+    Install a wordlist set in the registry, replacing the set of the same name.
+
+    The swap is a single assignment: calls resolving the set afterwards get the new set
+    and the tables kept on it, while calls in flight keep the old one.
+
+    Args:
+        wordlists (WordlistSet): The new set, fully loaded.
+    """
+    REGISTRY.add(wordlists)
+    if STATS.enabled:
+        STATS.count("wordlists.reloads")
+
+
+class WordlistWatcher:
+    """Watches the files of wordlist sets from a background thread, and reloads the sets that change."""
+
+    def __init__(
+        self,
+        names: Iterable[str] = (DEFAULT_WORDLISTS,),
+        interval: float = WORDLIST_RELOAD_INTERVAL,
+        on_reload: Callable[[WordlistSet], None] | None = None,
+    ):
+        """
+        Args:
+            names (Iterable[str]): The names of the sets to watch.
+            interval (float): Seconds between two checks.
+            on_reload (Callable[[WordlistSet], None] | None): Called with each new set, once
+                                                              swapped in (e.g. to drop
+                                                              passphrases prefetched
+                                                              from the old one).
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid reload interval: {interval}")
+        self.names = list(names)
+        self.interval = interval
+        self.on_reload = on_reload
+        self._fingerprints = {name: self._fingerprint(name) for name in self.names}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._watch_loop, name="wordlist-watcher", daemon=True)
+
+    def start(self) -> "WordlistWatcher":
+        """Start watching."""
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching."""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def __enter__(self) -> "WordlistWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def check(self) -> list[WordlistSet]:
+        """
+        Reload the watched sets whose files changed since the last check.
+
+        Returns:
+            list[WordlistSet]: The sets that were reloaded.
+        """
+        reloaded = []
+        for name in self.names:
+            fingerprint = self._fingerprint(name)
+            if fingerprint == self._fingerprints[name]:
+                continue
+            try:
+                wordlists = reload_wordlists(name)
+            except OSError:
+                # Probably caught mid-update: try again at the next check
+                continue
+            self._fingerprints[name] = fingerprint
+            if wordlists is not None:
+                reloaded.append(wordlists)
+                if self.on_reload is not None:
+                    self.on_reload(wordlists)
+        return reloaded
+
+    def _watch_loop(self) -> None:
+        """Check for changes every `interval` seconds, until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    @staticmethod
+    def _fingerprint(name: str) -> Fingerprint:
+        """The fingerprint of the files of a registered set."""
+        directory = REGISTRY.directory(name)
+        return tuple(_stat(directory / pos.value) for pos in PartsOfSpeech)
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    """The modification time (in nanoseconds) and size of a file, or `None` if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,124 @@
+import os
+import struct
+from typing import Sequence, TypeVar
+
+from .config import ENTROPY_BLOCK_SIZE
+from .stats import STATS
+
+
+T = TypeVar("T")
+
+_WORD_BITS = 32
+_WORD_RANGE = 1 << _WORD_BITS
+
+
+class EntropyPool:
+    """
+    A buffered source of uniformly random integers backed by `os.urandom`.
+
+    Instead of issuing one syscall per random pick (as `secrets.SystemRandom` does),
+    entropy is read from the OS in blocks of `block_size` bytes and consumed as
+    32-bit words. Indices are derived with rejection sampling, so every value in
+    `[0, n)` is exactly equally likely, just like `secrets.randbelow`.
+    """
+
+    def __init__(self, block_size: int = ENTROPY_BLOCK_SIZE):
+        """
+        Args:
+            block_size (int): Number of bytes to read from the OS at a time.
+                              Rounded down to a multiple of 4 (minimum 4).
+        """
+        self.block_size = max(4, block_size - block_size % 4)
+        self._format = f"<{self.block_size // 4}I"
+        self._words = iter(())
+        self._limits: dict[int, int] = {}
+        self._wide_limits: dict[int, tuple[int, int]] = {}
+
+    def _refill(self) -> None:
+        """Read a new block of entropy from the OS."""
+        self._words = iter(struct.unpack(self._format, os.urandom(self.block_size)))
+        if STATS.enabled:
+            STATS.count("entropy.pool_bytes", self.block_size)
+
+    def _next_word(self) -> int:
+        """The next unused 32-bit word from the pool."""
+        word = next(self._words, None)
+        if word is None:
+            self._refill()
+            word = next(self._words)
+        return word
+
+    def _limit(self, n: int) -> int:
+        """The rejection threshold for drawing a value below `n` (`n` must fit in a word)."""
+        limit = self._limits.get(n)
+        if limit is None:
+            # Largest multiple of `n` that fits in a word; words at or above it are rejected
+            limit = self._limits[n] = _WORD_RANGE - _WORD_RANGE % n
+        return limit
+
+    def randbelow(self, n: int) -> int:
+        """
+        A uniformly random integer in the range `[0, n)`.
+
+        Args:
+            n (int): The exclusive upper bound. Must be positive.
+
+        Returns:
+            int: A random integer.
+        """
+        if n <= 0:
+            raise ValueError("Upper bound must be positive")
+
+        if n <= _WORD_RANGE:
+            limit = self._limit(n)
+            word = self._next_word()
+            while word >= limit:
+                if STATS.enabled:
+                    STATS.count("entropy.rejections")
+                word = self._next_word()
+            return word % n
+
+        # Big bounds (e.g. mixed-radix phrase ranks, or an alias table column and word) are
+        # assembled from several words
+        wide = self._wide_limits.get(n)
+        if wide is None:
+            words = -(-n.bit_length() // _WORD_BITS)
+            span = 1 << (words * _WORD_BITS)
+            wide = self._wide_limits[n] = words, span - span % n
+        words, limit = wide
+        next_word = self._next_word
+        while True:
+            value = next_word()
+            for _ in range(words - 1):
+                value = (value << _WORD_BITS) | next_word()
+            if value < limit:
+                return value % n
+            if STATS.enabled:
+                STATS.count("entropy.rejections")
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """
+        A uniformly random element of a non-empty sequence.
+
+        Args:
+            seq (Sequence[T]): The sequence to choose from.
+
+        Returns:
+            T: A random element.
+        """
+        n = len(seq)
+        if not n:
+            raise IndexError("Cannot choose from an empty sequence")
+        if n > _WORD_RANGE:
+            return seq[self.randbelow(n)]
+
+        # Same as `randbelow`, inlined as this is the hot path of batch generation
+        limit = self._limits.get(n) or self._limit(n)
+        word = next(self._words, None)
+        while word is None or word >= limit:
+            if word is None:
+                self._refill()
+            elif STATS.enabled:
+                STATS.count("entropy.rejections")
+            word = next(self._words, None)
+        return seq[word % n]
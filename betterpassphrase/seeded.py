@@ -0,0 +1,151 @@
+"""
+Deterministic, seeded passphrase generation. NOT SECURE: for load tests and fixtures only.
+
+Passphrases generated here are fully determined by the seed, so anyone who knows (or
+guesses) the seed can reproduce them. Never use them as real passwords.
+
+Randomness comes from a counter-based generator: passphrase `i` of a seed is built
+from the keyed BLAKE2b hashes of the counters `(i, 0), (i, 1), ...`, independently
+of every other passphrase. Any passphrase can thus be generated on its own, and a
+batch split across workers (see `parallel.iter_phrase_batches`) gives the same output
+whatever the number of workers or the chunk size. The price is one keyed hash per
+passphrase, which makes seeded generation about 10% slower than `generate_phrases`.
+
+```python
+from betterpassphrase.seeded import generate_seeded_phrases
+
+phrases = generate_seeded_phrases(1000, length=6, sep="-", seed=42)
+assert phrases[500:] == generate_seeded_phrases(500, length=6, sep="-", seed=42, start=500)
+```
+"""
+import struct
+from hashlib import blake2b
+from itertools import count
+from typing import Iterator
+
+from . import config
+from .generator import phrase_factory
+from .models import Passphrase
+from .sampling import EntropyPool
+from .wordlists import WordlistSet
+
+
+_COUNTER = struct.Struct("<QI")
+"""The counter of a hash: the passphrase index and the block number within the passphrase."""
+
+_BLOCK = struct.Struct(f"<{blake2b.MAX_DIGEST_SIZE // 4}I")
+"""A hash, read as 32-bit words."""
+
+
+class SeededPool(EntropyPool):
+    """
+    A deterministic `EntropyPool`, whose words come from keyed hashes of a counter.
+
+    The pool reads from one stream at a time (see `seek`). The words of a stream only
+    depend on the seed and the stream number.
+    """
+
+    def __init__(self, seed: int, stream: int = 0):
+        """
+        Args:
+            seed (int): The seed.
+            stream (int): The stream to start reading from.
+        """
+        super().__init__(blake2b.MAX_DIGEST_SIZE)
+        key = blake2b(str(seed).encode(), digest_size=blake2b.MAX_KEY_SIZE).digest()
+        self._hash = blake2b(key=key)
+        self.seek(stream)
+
+    def seek(self, stream: int) -> None:
+        """Start reading from the beginning of a stream."""
+        self._stream = stream
+        # Every passphrase needs the first block, so it is hashed right away
+        digest = self._hash.copy()
+        digest.update(_COUNTER.pack(stream, 0))
+        self._block = 1
+        self._words = iter(_BLOCK.unpack(digest.digest()))
+
+    def _refill(self) -> None:
+        """Hash the next counter of the current stream."""
+        digest = self._hash.copy()
+        digest.update(_COUNTER.pack(self._stream, self._block))
+        self._block += 1
+        self._words = iter(_BLOCK.unpack(digest.digest()))
+
+
+def iter_seeded_phrases(
+    n: int | None = None,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    seed: int | None = None,
+    start: int = 0,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> Iterator[Passphrase]:
+    """
+    Lazily generate reproducible passphrases of the specified length. NOT SECURE.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for no limit).
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        seed (int | None): The seed. Defaults to `config.SEED` (read at each call), which
+                           must then be set.
+        start (int): The index of the first passphrase, to resume or split a sequence.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from
+                                              (see `generator.generate_phrase`).
+        min_bits (float | None): Entropy target replacing `length` (see `generator.generate_phrase`).
+        min_chars (int | None): Minimum number of characters (see `generator.generate_phrase`).
+        max_chars (int | None): Maximum number of characters (see `generator.generate_phrase`).
+
+    Yields:
+        Passphrase: Passphrases `start, start + 1, ...` of the seed.
+
+    Raises:
+        ValueError: If no seed is given, or the arguments are invalid.
+    """
+    if seed is None:
+        seed = config.SEED
+    if seed is None:
+        raise ValueError("Deterministic generation needs a seed")
+    if n is not None and n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    if start < 0:
+        raise ValueError(f"Invalid start index: {start}")
+
+    factory = phrase_factory(length, sep, capitalize, wordlists, min_bits, min_chars, max_chars)
+    pool = SeededPool(seed)
+    seek, choice, randbelow = pool.seek, pool.choice, pool.randbelow
+    streams = count(start) if n is None else range(start, start + n)
+    for stream in streams:
+        seek(stream)
+        yield factory(choice, randbelow)
+
+
+def generate_seeded_phrases(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    seed: int | None = None,
+    start: int = 0,
+    wordlists: str | WordlistSet | None = None,
+    min_bits: float | None = None,
+    min_chars: int | None = None,
+    max_chars: int | None = None,
+) -> list[Passphrase]:
+    """
+    Generate `n` reproducible passphrases. NOT SECURE.
+
+    See `iter_seeded_phrases` for the arguments.
+
+    Returns:
+        list[Passphrase]: Passphrases `start` to `start + n - 1` of the seed.
+    """
+    return list(
+        iter_seeded_phrases(n, length, sep, capitalize, seed, start, wordlists, min_bits, min_chars, max_chars)
+    )
@@ -0,0 +1,134 @@
+"""
+Wordlist sets published in shared memory, for fleets of worker processes.
+
+A parent process publishes a wordlist set once, as a bundle (see `bundle`) in a
+`multiprocessing.shared_memory` segment. Worker processes attach to the segment by name
+and read words from it in place: nothing is copied or parsed, and the text files are
+not even read to check the bundle, so each worker starts in the same time and holds
+the same private memory however many workers share the segment. The compiled grammar
+(see `grammar`) only depends on the sizes of the wordlists, which the bundle header
+holds, so workers compile it without touching the words.
+
+```python
+from concurrent.futures import ProcessPoolExecutor
+from betterpassphrase.shared import attach_wordlists, publish_wordlists
+
+with publish_wordlists("fr") as shared:
+    with ProcessPoolExecutor(initializer=attach_wordlists, initargs=shared.initargs) as executor:
+        ...  # Workers resolve the "fr" set to the shared one
+```
+
+`parallel.iter_phrase_batches` does this for its own pool with `share_wordlists=True`.
+Workers must be started by `multiprocessing` (e.g. by a process pool), so that the
+segment is only unlinked by the publishing process.
+"""
+import sys
+from multiprocessing.shared_memory import SharedMemory
+
+from .blocklist import Blocklist
+from .bundle import WordlistBundle, encode_bundle, source_checksum
+from .models import PartsOfSpeech
+from .wordlists import REGISTRY, WordlistSet, get_wordlists
+
+
+class _AttachedMemory(SharedMemory):
+    """A shared memory segment attached for the life of the process."""
+
+    def __del__(self):
+        # Words are read from the segment until exit, so it is never closed explicitly
+        pass
+
+
+_ATTACHED: dict[str, tuple[_AttachedMemory, WordlistSet]] = {}
+"""The segments this process is attached to, by name."""
+
+
+class SharedWordlists:
+    """A wordlist set published in a shared memory segment, unlinked when closed."""
+
+    def __init__(self, wordlists: WordlistSet):
+        """
+        Args:
+            wordlists (WordlistSet): The wordlist set to publish.
+        """
+        self.wordlists = wordlists
+        names = [pos.value for pos in PartsOfSpeech]
+        bundle = wordlists.bundle
+        data = None
+        if bundle is None or wordlists.exclude is not None or not all(name in bundle for name in names):
+            # Loaded from the text files, or filtered: encode the wordlists as a bundle first
+            data = encode_bundle(
+                names, [wordlists[pos] for pos in PartsOfSpeech], source_checksum(wordlists.directory, names)
+            )
+
+        self._memory = SharedMemory(create=True, size=len(data) if data is not None else bundle.size)
+        if data is not None:
+            self._memory.buf[:len(data)] = data
+        else:
+            bundle.copy_into(self._memory.buf)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment."""
+        return self._memory.name
+
+    @property
+    def initargs(self) -> tuple[str, str, str, Blocklist | None]:
+        """The arguments of `attach_wordlists` to attach to this set, e.g. as a process pool initializer."""
+        return self.name, self.wordlists.name, str(self.wordlists.directory), self.wordlists.exclude
+
+    def close(self) -> None:
+        """Release and unlink the segment. Attached processes keep their mapping."""
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self) -> "SharedWordlists":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def publish_wordlists(wordlists: str | WordlistSet | None = None) -> SharedWordlists:
+    """
+    Publish a wordlist set in shared memory.
+
+    Args:
+        wordlists (str | WordlistSet | None): The wordlist set (see `generator.generate_phrase`).
+
+    Returns:
+        SharedWordlists: The published set, to close once no more workers will attach to it.
+    """
+    return SharedWordlists(get_wordlists(wordlists))
+
+
+def attach_wordlists(segment: str, name: str, directory: str, exclude: Blocklist | None = None) -> WordlistSet:
+    """
+    Attach to a published wordlist set, and install it in the global registry.
+
+    From then on, the set resolves to the shared one by name in this process (including
+    sets sent from the publishing process, which are sent by name).
+
+    Args:
+        segment (str): The name of the shared memory segment (see `SharedWordlists.name`).
+        name (str): The name of the wordlist set.
+        directory (str): The directory of the wordlist set.
+        exclude (Blocklist | None): The blocklist of the set, already applied to the
+                                    published words.
+
+    Returns:
+        WordlistSet: The wordlist set, reading its words from shared memory.
+
+    Raises:
+        ValueError: If the segment does not hold a valid bundle.
+    """
+    attached = _ATTACHED.get(segment)
+    if attached is None:
+        if sys.version_info >= (3, 13):
+            memory = _AttachedMemory(segment, track=False)
+        else:
+            memory = _AttachedMemory(segment)
+        wordlists = WordlistSet(name, directory, bundle=WordlistBundle(buffer=memory.buf), exclude=exclude)
+        attached = _ATTACHED[segment] = memory, wordlists
+    REGISTRY.add(attached[1])
+    return attached[1]
@@ -0,0 +1,136 @@
+"""
+Optional instrumentation of the generation hot paths.
+
+Counters and stage timers are recorded into the global `STATS` object, only while it is
+enabled. Instrumentation points sit outside the per-word loops (per entropy block, per
+rejected draw, per long passphrase, per wordlist load and per CLI batch) and check
+`STATS.enabled` first, so they cost next to nothing when disabled.
+
+```python
+from betterpassphrase import generate_phrases
+from betterpassphrase.stats import STATS
+
+STATS.enable()
+generate_phrases(10_000, length=12)
+print(STATS.format())
+```
+
+Entropy counters cover the block-buffered pools used for batches (`entropy.pool_bytes`),
+and the reads of the OS's randomness made by single calls to `generate_phrase`
+(`entropy.os_reads` and `entropy.os_bytes`), which draw through `config.RANDOM_SELECTOR`
+and `config.RANDOM_BELOW`. Counters are per process: with several worker processes (see
+`parallel`), only the work done in the current process is recorded.
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from random import SystemRandom
+from typing import Iterator
+
+
+class Stats:
+    """Counters, maxima and cumulative stage timings, recorded only while enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.counters: Counter[str] = Counter()
+        self.maxima: dict[str, int] = {}
+        self.timers: defaultdict[str, float] = defaultdict(float)
+
+    def enable(self) -> None:
+        """Start recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording (the recorded figures are kept)."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear all recorded figures."""
+        self.counters.clear()
+        self.maxima.clear()
+        self.timers.clear()
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add `value` to the counter `name`."""
+        self.counters[name] += value
+
+    def maximum(self, name: str, value: int) -> None:
+        """Record `value` as the maximum `name` if it is the largest seen so far."""
+        if value > self.maxima.get(name, value - 1):
+            self.maxima[name] = value
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Add the wall time spent in the `with` block to the timer `name` (if enabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - start
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        The recorded figures, plus the `cache_info()` of the module-level caches.
+
+        The tables kept on the wordlist sets (see `wordlists.WordlistSet.tables`) are plain
+        dictionaries, so they have no hit counts to report.
+
+        Returns:
+            dict[str, dict]: `counters`, `maxima`, `timers` (in seconds) and `caches`
+                             (hits, misses and size of each module-level cache).
+        """
+        return {
+            "counters": dict(self.counters),
+            "maxima": dict(self.maxima),
+            "timers": dict(self.timers),
+            "caches": {name: info._asdict() for name, info in _cache_infos().items()},
+        }
+
+    def format(self) -> str:
+        """The recorded figures as a human-readable report."""
+        snapshot = self.snapshot()
+        lines = ["Statistics:"]
+        for name, value in sorted({**snapshot["counters"], **snapshot["maxima"]}.items()):
+            lines.append(f"  {name:36} {value:>14,}")
+        for name, seconds in sorted(snapshot["timers"].items()):
+            lines.append(f"  {name:36} {seconds * 1000:>14,.1f} ms")
+        for name, info in snapshot["caches"].items():
+            lookups = info["hits"] + info["misses"]
+            rate = f"{info['hits'] / lookups:.1%}" if lookups else "-"
+            lines.append(f"  {'cache.' + name:36} {rate:>14} hits ({info['hits']:,}/{lookups:,})")
+        return "\n".join(lines)
+
+
+STATS = Stats()
+"""The global statistics, recorded by the instrumented code paths."""
+
+
+class CountingRandom(SystemRandom):
+    """`SystemRandom` that counts its reads of the OS's randomness into `STATS`."""
+
+    def getrandbits(self, k: int) -> int:
+        """Read `k` random bits from the OS, counting the read and its bytes."""
+        STATS.count("entropy.os_reads")
+        STATS.count("entropy.os_bytes", (k + 7) // 8)
+        return super().getrandbits(k)
+
+
+COUNTING_RANDOM = CountingRandom()
+"""
+Stand-in for the default `config.RANDOM_SELECTOR` and `config.RANDOM_BELOW` while `STATS`
+is enabled: the same source of randomness, with its reads counted.
+"""
+
+
+def _cache_infos() -> dict:
+    """The `cache_info()` of each module-level cache on the generation paths."""
+    # Imported here, as the instrumented modules import this one
+    from . import generator
+
+    # The other tables are kept on the wordlist sets (see `wordlists.WordlistSet.tables`)
+    caches = [generator.length_partition_counts]
+    return {cache.__name__: cache.cache_info() for cache in caches}
@@ -0,0 +1,198 @@
+"""
+Generation of large batches of guaranteed-unique passphrases in constant memory.
+
+Instead of remembering every passphrase handed out, a keyed pseudorandom permutation
+of the ranks (see `codec`) is walked: distinct positions map to distinct ranks, and
+distinct ranks to distinct passphrases. A word can belong to several wordlists, so a
+few passphrases have more than one rank; only their lowest (canonical) rank is kept,
+which makes the passphrase strings themselves unique.
+"""
+import os
+import hashlib
+from math import isqrt
+from typing import Iterator
+
+from .config import BUFFER
+from .codec import ambiguous_words, phrase_space, rank, unrank
+from .models import Passphrase
+
+
+UNIQUE_KEY_SIZE = 32
+"""Size in bytes of the randomly generated permutation keys."""
+
+
+class PhrasePermutation:
+    """
+    A keyed pseudorandom permutation of the integers in `[0, size)`.
+
+    Uses a Feistel network over `Z_a x Z_b` with modular addition (as in format-preserving
+    encryption), where `a * b` is the smallest such product not below `size`, plus cycle
+    walking for the few values in `[size, a * b)`. Each round function is a keyed hash
+    of the fixed-width bytes of its input (BLAKE2s, BLAKE2b for larger ranges, or SHAKE-256
+    keyed by prefix for very large ones), so the permutation cannot be predicted without
+    the key.
+    """
+
+    ROUNDS = 8
+    """Number of Feistel rounds (as in FF3-1, the NIST format-preserving encryption mode)."""
+
+    def __init__(self, size: int, key: bytes):
+        """
+        Args:
+            size (int): The size of the permuted range. Must be positive.
+            key (bytes): The permutation key.
+        """
+        if size <= 0:
+            raise ValueError("Cannot permute an empty range")
+        self.size = size
+        self._key = key
+        self._a = max(1, isqrt(size - 1) + 1)
+        self._b = -(-size // self._a)
+        # Round inputs are fed as fixed-width bytes, which is cheaper than formatting them
+        self._value_size = (max(self._a, self._b).bit_length() + 7) // 8
+        # Enough digest bytes for a negligible modular bias in the round function
+        self._digest_size = self._value_size + 16
+        # The cheapest keyed hash with a large enough digest (BLAKE2s is faster for short ones)
+        self._digest_args = ()
+        for blake in (hashlib.blake2s, hashlib.blake2b):
+            if self._digest_size <= blake.MAX_DIGEST_SIZE and len(key) <= blake.MAX_KEY_SIZE:
+                keyed = blake(key=key, digest_size=self._digest_size)
+                break
+        else:
+            keyed = hashlib.shake_256(key)
+            self._digest_args = (self._digest_size,)
+        # The keyed hash of each round, already fed with the round index (kept as its bound
+        # `copy`, called once per round)
+        self._rounds = []
+        for index in range(self.ROUNDS):
+            round_hash = keyed.copy()
+            round_hash.update(b"%d:" % index)
+            self._rounds.append(round_hash.copy)
+
+    def _round(self, index: int, value: int, modulus: int) -> int:
+        """The round function: a keyed hash of `value`, reduced modulo `modulus`."""
+        digest = self._rounds[index]()
+        digest.update(value.to_bytes(self._value_size, "big"))
+        return int.from_bytes(digest.digest(*self._digest_args), "big") % modulus
+
+    def __call__(self, value: int) -> int:
+        """
+        The image of `value` under the permutation.
+
+        Args:
+            value (int): An integer in `[0, size)`.
+
+        Returns:
+            int: An integer in `[0, size)`.
+        """
+        if not 0 <= value < self.size:
+            raise ValueError(f"{value} is out of range for a permutation of size {self.size}")
+        while True:
+            left, right = divmod(value, self._b)
+            for index in range(self.ROUNDS):
+                if index % 2:
+                    right = (right + self._round(index, left, self._b)) % self._b
+                else:
+                    left = (left + self._round(index, right, self._a)) % self._a
+            value = left * self._b + right
+            # Cycle walking: re-encrypt until the value falls back into the range
+            if value < self.size:
+                return value
+
+
+def check_separable(sep: str, capitalize: bool) -> None:
+    """
+    Ensure the words of a passphrase can be told apart, so distinct words mean distinct strings.
+
+    Args:
+        sep (str): Separator between words.
+        capitalize (bool): Whether words are capitalized.
+
+    Raises:
+        ValueError: If the words can run into each other.
+    """
+    if any(char.isalpha() for char in sep) or not (sep or capitalize):
+        raise ValueError(
+            "Unique passphrases need a non-alphabetic separator, or capitalization with no separator"
+        )
+
+
+def iter_unique_phrases(
+    n: int | None = None,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    key: bytes | None = None,
+    ranks: range | None = None,
+    offset: int = 0,
+    stop: int | None = None,
+) -> Iterator[Passphrase]:
+    """
+    Generate passphrases that are all different from each other.
+
+    Positions `offset, offset + 1, ...` of a keyed permutation of the ranks are decoded in
+    turn, up to `stop`. Callers that use the same `key` with disjoint ranges of positions
+    therefore never produce the same passphrase either, which lets parallel workers
+    generate unique passphrases without coordination.
+
+    Args:
+        n (int | None): The number of passphrases to generate (`None` for all of them).
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        key (bytes | None): The permutation key (random if not given).
+        ranks (range | None): Only generate passphrases with these ranks (defaults to all).
+        offset (int): The first permutation position to use.
+        stop (int | None): The permutation position to stop at (defaults to the end).
+
+    Yields:
+        Passphrase: Generated passphrases with metadata.
+
+    Raises:
+        ValueError: If fewer than `n` unique passphrases are available.
+    """
+    check_separable(sep, capitalize)
+    if ranks is None:
+        ranks = range(phrase_space(length, BUFFER))
+    if ranks.step != 1 or ranks.stop <= ranks.start:
+        raise ValueError("Ranks must be a non-empty contiguous range")
+
+    permutation = PhrasePermutation(ranks.stop - ranks.start, key or os.urandom(UNIQUE_KEY_SIZE))
+    stop = permutation.size if stop is None else min(stop, permutation.size)
+    ambiguous = ambiguous_words()
+    count = 0
+    position = offset
+    while n is None or count < n:
+        if position >= stop:
+            if n is None:
+                return
+            raise ValueError(f"Only {count} unique passphrases available, {n} requested")
+
+        value = ranks.start + permutation(position)
+        position += 1
+
+        phrase = unrank(value, length, sep, capitalize)
+        # Skip ranks that spell the same words as a lower rank (only possible with ambiguous words)
+        if not ambiguous.isdisjoint(map(str.lower, phrase.words)) and rank(phrase.words, length) != value:
+            continue
+
+        yield phrase
+        count += 1
+
+
+def generate_unique_phrases(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    key: bytes | None = None,
+    ranks: range | None = None,
+    offset: int = 0,
+    stop: int | None = None,
+) -> list[Passphrase]:
+    """
+    Generate `n` passphrases that are all different from each other.
+
+    See `iter_unique_phrases` for details.
+    """
+    return list(iter_unique_phrases(n, length, sep, capitalize, key, ranks, offset, stop))
@@ -53,10 +53,17 @@ def run_parallel_exec_but_return_in_order(exec_func: Callable, iterable: Iterabl
     Runs the `exec_func` function in parallel for each element in the `iterable` using a thread pool executor.
     Returns the result in the same order as the `iterable`.
     """
-    # note this is usable only when iterable has types that are hashable
-    result = run_parallel_exec(exec_func, iterable:=list(iterable), *func_args, **kwargs)
+    iterable = list(iterable)
 
-    # sort the result in the same order as the iterable
-    result.sort(key=lambda x: iterable.index(x[0]))
+    # run on positions rather than elements, so that duplicate or unhashable elements keep their place
+    result = run_parallel_exec(
+        lambda index, *args: exec_func(iterable[index], *args),
+        range(len(iterable)),
+        *func_args,
+        **kwargs,
+    )
 
-    return [x[-1] for x in result]
+    ordered = [None] * len(iterable)
+    for index, value in result:
+        ordered[index] = value
+    return ordered
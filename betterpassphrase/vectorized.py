@@ -0,0 +1,186 @@
+"""
+Optional NumPy backend for generating large batches of passphrase strings.
+
+Install it with `pip install BetterPassphrase[numpy]`. For a whole batch at once, the
+combination of each passphrase (through the alias table of the compiled grammar, see
+`grammar`) and the index of each of its words are drawn as integer arrays from OS
+entropy (with the same unbiased rejection sampling as `EntropyPool`), words are gathered
+from per-wordlist arrays, and the passphrases are joined in one final pass. No
+`Passphrase` objects are built, so this only returns the passphrase strings.
+
+```python
+from betterpassphrase.vectorized import generate_passphrase_strings
+
+phrases = generate_passphrase_strings(1_000_000, length=6, sep="-")
+```
+
+Passphrases of more than `UNIT_PHRASE_MAX_LENGTH` words, and every length when NumPy is
+not installed, are generated with the pure-Python path instead.
+"""
+import os
+from functools import partial
+from typing import Iterator
+
+from .config import PARALLEL_CHUNK_SIZE, RANDOM_BELOW
+from .generator import generate_phrases
+from .grammar import AliasTable, compile_grammar
+from .mappings import LENGTH_TO_WORD_COMBINATIONS_MAP
+from .models import P
+from .parallel import iter_batches
+from .stats import STATS
+from .wordlists import WordlistSet, get_wordlists
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+"""Whether NumPy is installed, i.e. whether batches are actually vectorized."""
+
+_WORD_RANGE = 1 << 32
+
+
+def generate_passphrase_strings(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    wordlists: str | WordlistSet | None = None,
+) -> list[str]:
+    """
+    Generate `n` passphrases of the specified length, as strings.
+
+    Produces the same distribution of passphrases as `generator.generate_phrases`.
+
+    Args:
+        n (int): The number of passphrases to generate.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from (see
+                                              `generator.generate_phrase`).
+
+    Returns:
+        list[str]: The passphrases.
+    """
+    if n < 0:
+        raise ValueError(f"Cannot generate {n} phrases")
+    wordlists = get_wordlists(wordlists)
+    if np is None or length not in LENGTH_TO_WORD_COMBINATIONS_MAP:
+        return [phrase.passphrase for phrase in generate_phrases(n, length, sep, capitalize, wordlists)]
+
+    words = _word_arrays(wordlists, capitalize)
+    compiled = compile_grammar(wordlists)[length]
+    combinations = compiled.combinations
+    chosen = _alias_array(compiled.alias, n)
+
+    # Draw the words of all the passphrases of each combination together
+    phrases = np.empty(n, dtype=object)
+    for combination_id, combination in enumerate(combinations):
+        rows = np.flatnonzero(chosen == combination_id)
+        if not rows.size:
+            continue
+        columns = [words[pos][_randbelow_array(len(words[pos]), rows.size)].tolist() for pos in combination]
+        phrases[rows] = list(map(sep.join, zip(*columns)))
+    return phrases.tolist()
+
+
+def iter_passphrase_string_batches(
+    n: int,
+    length: int = 6,
+    sep: str = "",
+    capitalize: bool = True,
+    workers: int | None = None,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    wordlists: str | WordlistSet | None = None,
+    share_wordlists: bool = False,
+) -> Iterator[list[str]]:
+    """
+    Generate `n` passphrase strings in batches of up to `chunk_size`, spread across processes.
+
+    See `parallel.iter_batches` for how the work is distributed.
+
+    Args:
+        n (int): The number of passphrases to generate.
+        length (int): The number of words in each passphrase.
+        sep (str): Separator between words.
+        capitalize (bool): Whether to capitalize words.
+        workers (int | None): Number of worker processes (see `parallel.resolve_workers`).
+        chunk_size (int): Number of phrases generated per work unit.
+        wordlists (str | WordlistSet | None): The wordlist set to draw words from.
+        share_wordlists (bool): Whether worker processes attach to the wordlists in shared
+                                memory rather than each load them (see `shared`).
+
+    Yields:
+        list[str]: Batches of passphrases.
+    """
+    wordlists = get_wordlists(wordlists)
+    batch_func = partial(_string_batch, length=length, sep=sep, capitalize=capitalize, wordlists=wordlists)
+    return iter_batches(batch_func, n, workers, chunk_size, wordlists if share_wordlists else None)
+
+
+def _string_batch(index: int, size: int, length: int, sep: str, capitalize: bool, wordlists: WordlistSet) -> list[str]:
+    """Generate a batch of passphrase strings (the chunk index is unused)."""
+    return generate_passphrase_strings(size, length, sep, capitalize, wordlists)
+
+
+def _word_arrays(wordlists: WordlistSet, capitalize: bool) -> dict[P, "np.ndarray"]:
+    """
+    The words of each part of speech as object arrays, cached per wordlist set.
+
+    An empty wordlist has a single empty word, as in `generator.generate_phrase`.
+    """
+    key = ("numpy_words", capitalize)
+    arrays = wordlists.tables.get(key)
+    if arrays is None:
+        arrays = {}
+        for pos in P:
+            words = [word.capitalize() if capitalize else word for word in wordlists[pos]] or [""]
+            arrays[pos] = np.empty(len(words), dtype=object)
+            arrays[pos][:] = words
+        wordlists.tables[key] = arrays
+    return arrays
+
+
+def _alias_array(alias: AliasTable, size: int) -> "np.ndarray":
+    """`size` random indices drawn through an alias table (see `AliasTable.sample`)."""
+    columns = _randbelow_array(alias.size, size)
+    words = np.frombuffer(os.urandom(4 * size), dtype="<u4").astype(np.int64)
+    cuts = np.array(alias.cuts, dtype=np.int64)[columns]
+    chosen = np.where(words < cuts, columns, np.array(alias.aliases, dtype=np.intp)[columns])
+    # Ties (each with probability 2^-32) are settled exactly, one at a time
+    for row in np.flatnonzero(words == cuts).tolist():
+        column = int(columns[row])
+        keep = RANDOM_BELOW(alias.total) < alias.remainders[column]
+        chosen[row] = column if keep else alias.aliases[column]
+    return chosen
+
+
+def _randbelow_array(n: int, size: int) -> "np.ndarray":
+    """
+    `size` uniformly random integers in `[0, n)`, from OS entropy.
+
+    32-bit words at or above the largest multiple of `n` are rejected and drawn again,
+    so every value is exactly equally likely.
+    """
+    if n == 1:
+        return np.zeros(size, dtype=np.intp)
+    if n > _WORD_RANGE:
+        raise ValueError(f"Cannot draw below {n} in a batch")
+
+    limit = _WORD_RANGE - _WORD_RANGE % n
+    values = np.empty(size, dtype=np.intp)
+    filled = 0
+    while filled < size:
+        # Draw enough for the expected rejections, plus a few spare words
+        missing = size - filled
+        count = missing + missing * (_WORD_RANGE - limit) // limit + 16
+        words = np.frombuffer(os.urandom(4 * count), dtype="<u4")
+        if STATS.enabled:
+            STATS.count("entropy.pool_bytes", 4 * count)
+            STATS.count("entropy.rejections", int(np.count_nonzero(words >= limit)))
+        words = words[words < limit][:missing]
+        values[filled:filled + words.size] = words % n
+        filled += words.size
+    return values
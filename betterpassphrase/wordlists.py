@@ -0,0 +1,337 @@
+"""
+Registry of named wordlist sets.
+
+A wordlist set holds one wordlist per part of speech, loaded from a directory laid out
+like `PARTS_OF_SPEECH_DIR` (one text file per part of speech, see `PartsOfSpeech`).
+Sets are registered by name, loaded on first use and kept in a bounded LRU cache, so
+switching between a few tenants or locales never goes back to disk, while the number
+of sets held in memory stays capped. The package wordlists are always available as
+the `DEFAULT_WORDLISTS` set.
+
+```python
+from betterpassphrase import generate_phrase
+from betterpassphrase.wordlists import register_wordlists
+
+register_wordlists("fr", "/srv/wordlists/fr")
+phrase = generate_phrase(6, "-", wordlists="fr")
+```
+
+Each set is loaded through a memory-mapped bundle built next to its text files (see
+`bundle`), so even large wordlists are indexed without parsing them up front. If the
+directory is read-only and has no up-to-date bundle, the text files are read instead.
+"""
+import math
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+from .bundle import WordlistBundle, load_bundle, read_wordlist
+from .config import (
+    PARTS_OF_SPEECH_DIR,
+    USE_WORDLIST_BUNDLE,
+    WORDLIST_BUNDLE_PATH,
+    WORDLIST_CACHE_SIZE,
+)
+from .models import PartsOfSpeech
+from .stats import STATS
+
+if TYPE_CHECKING:
+    # Only needed when a set has a blocklist, which brings its own import
+    from .blocklist import Blocklist
+
+
+DEFAULT_WORDLISTS = "default"
+"""Name of the wordlist set shipped with the package (in `PARTS_OF_SPEECH_DIR`)."""
+
+
+class WordlistSet:
+    """A named set of wordlists, one per part of speech, loaded from a directory."""
+
+    def __init__(
+        self,
+        name: str,
+        directory: Path,
+        bundle_path: Path | None = None,
+        use_bundle: bool = USE_WORDLIST_BUNDLE,
+        bundle: WordlistBundle | None = None,
+        exclude: "Blocklist | None" = None,
+    ):
+        """
+        Args:
+            name (str): The name of the set.
+            directory (Path): The directory containing one wordlist file per part of speech.
+            bundle_path (Path | None): Where to keep the bundle (defaults to the directory).
+            use_bundle (bool): Whether to load the wordlists through a memory-mapped bundle.
+            bundle (WordlistBundle | None): An already loaded bundle to read the wordlists from
+                                            (e.g. from shared memory, see `shared`), instead
+                                            of the directory.
+            exclude (Blocklist | None): Words to leave out of the wordlists, when they are read
+                                        from the directory (a given `bundle` must already
+                                        leave them out, see `shared`).
+        """
+        self.name = name
+        self.directory = Path(directory)
+        self.exclude = exclude
+        self.bundle_path = bundle_path = bundle_path or self.directory / WORDLIST_BUNDLE_PATH.name
+
+        names = [pos.value for pos in PartsOfSpeech]
+        with STATS.timer("wordlists.load"):
+            filter_words = exclude is not None and bundle is None
+            if bundle is None and use_bundle:
+                bundle = load_bundle(names, self.directory, bundle_path)
+            # The bundle the wordlists are read from, if any, and the checksum of its sources
+            self.bundle = bundle
+            self.checksum = bundle.checksum if bundle is not None else None
+            self.lists: dict[PartsOfSpeech, Sequence[str]] = {
+                pos: bundle[pos.value]
+                if bundle is not None and pos.value in bundle
+                else read_wordlist(self.directory / pos.value)
+                for pos in PartsOfSpeech
+            }
+            if filter_words:
+                # Filtered once, so that everything derived from the wordlists only sees allowed words
+                self.lists = {pos: exclude.filter(words) for pos, words in self.lists.items()}
+        self._word_indices: dict[PartsOfSpeech, dict[str, int]] = {}
+        self._length_buckets: dict[PartsOfSpeech, dict[int, list[int]]] = {}
+        self._one_of: dict[tuple[PartsOfSpeech, ...], int] = {}
+        self._entropy_bits: dict[tuple[PartsOfSpeech, ...], float] = {}
+        # Tables derived from the wordlists (e.g. by `generator.min_bits_plan`), dropped along with the set
+        self.tables: dict = {}
+
+    def __getitem__(self, pos: PartsOfSpeech) -> Sequence[str]:
+        """The wordlist of a part of speech."""
+        return self.lists[pos]
+
+    def n(self, pos: PartsOfSpeech) -> int:
+        """The number of words in the wordlist of a part of speech."""
+        return len(self.lists[pos])
+
+    def word_indices(self, pos: PartsOfSpeech) -> dict[str, int]:
+        """
+        Mapping of each word (lowercased) of a part of speech to its index in its wordlist.
+
+        Built on first use. Repeated words map to their first index.
+        """
+        indices = self._word_indices.get(pos)
+        if indices is None:
+            indices = {}
+            for index, word in enumerate(self.lists[pos]):
+                indices.setdefault(word.lower(), index)
+            self._word_indices[pos] = indices
+        return indices
+
+    def length_buckets(self, pos: PartsOfSpeech) -> dict[int, list[int]]:
+        """
+        The indices of the words of a part of speech, grouped by their number of characters.
+
+        Built on first use. Lengths are in increasing order.
+        """
+        buckets = self._length_buckets.get(pos)
+        if buckets is None:
+            unsorted: dict[int, list[int]] = {}
+            for index, word in enumerate(self.lists[pos]):
+                unsorted.setdefault(len(word), []).append(index)
+            buckets = self._length_buckets[pos] = dict(sorted(unsorted.items()))
+        return buckets
+
+    def combination_one_of(self, combination: tuple[PartsOfSpeech, ...]) -> int:
+        """Number of different phrases that can be generated from a combination of parts of speech."""
+        one_of = self._one_of.get(combination)
+        if one_of is None:
+            one_of = self._one_of[combination] = math.prod(len(self.lists[pos]) for pos in combination)
+        return one_of
+
+    def combination_entropy_bits(self, combination: tuple[PartsOfSpeech, ...]) -> float:
+        """Entropy in bits of a phrase drawn uniformly from a combination of parts of speech."""
+        bits = self._entropy_bits.get(combination)
+        if bits is None:
+            one_of = self.combination_one_of(combination)
+            bits = self._entropy_bits[combination] = math.log2(one_of) if one_of else 0.0
+        return bits
+
+    def __reduce__(self):
+        # Sets are sent to worker processes (and back) by name, and loaded there at most once
+        return _registered_wordlists, (self.name, str(self.directory), self.exclude)
+
+    def __repr__(self) -> str:
+        return f"WordlistSet({self.name!r}, {str(self.directory)!r})"
+
+
+class WordlistRegistry:
+    """
+    Named wordlist sets, loaded on demand and kept in a bounded LRU cache.
+
+    The default set is always registered and never evicted. Safe to use from several
+    threads.
+    """
+
+    def __init__(self, max_loaded: int = WORDLIST_CACHE_SIZE):
+        """
+        Args:
+            max_loaded (int): The maximum number of sets (besides the default one) kept loaded.
+        """
+        if max_loaded < 1:
+            raise ValueError(f"Invalid wordlist cache size: {max_loaded}")
+        self.max_loaded = max_loaded
+        self._directories: dict[str, Path] = {DEFAULT_WORDLISTS: PARTS_OF_SPEECH_DIR}
+        self._exclusions: dict[str, "Blocklist"] = {}
+        self._loaded: OrderedDict[str, WordlistSet] = OrderedDict()
+        self._default: WordlistSet | None = None
+        self._lock = threading.RLock()
+
+    def register(self, name: str, directory: Path | str, exclude: "Blocklist | None" = None) -> None:
+        """
+        Register a wordlist set. It is loaded on first use.
+
+        Args:
+            name (str): The name of the set.
+            directory (Path | str): The directory containing one wordlist file per part of speech.
+            exclude (Blocklist | None): Words to leave out of the wordlists (see `blocklist`).
+
+        Raises:
+            ValueError: If `name` is the default set, or `directory` does not exist.
+        """
+        if name == DEFAULT_WORDLISTS:
+            raise ValueError(f"Cannot replace the {DEFAULT_WORDLISTS!r} wordlists")
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise ValueError(f"Wordlist directory not found: {directory}")
+        with self._lock:
+            if self._directories.get(name) != directory or self._exclusions.get(name) != exclude:
+                self._loaded.pop(name, None)
+            self._directories[name] = directory
+            self._exclusions.pop(name, None)
+            if exclude is not None:
+                self._exclusions[name] = exclude
+
+    def add(self, wordlists: WordlistSet) -> None:
+        """
+        Register an already loaded wordlist set, replacing any set of the same name.
+
+        Used to install sets loaded from elsewhere than their directory (e.g. attached
+        from shared memory, see `shared`), or reloaded (see `reload`).
+
+        Args:
+            wordlists (WordlistSet): The wordlist set.
+        """
+        with self._lock:
+            self._directories[wordlists.name] = wordlists.directory
+            if wordlists.name == DEFAULT_WORDLISTS:
+                self._default = wordlists
+                return
+            self._exclusions.pop(wordlists.name, None)
+            if wordlists.exclude is not None:
+                self._exclusions[wordlists.name] = wordlists.exclude
+            self._loaded[wordlists.name] = wordlists
+            self._loaded.move_to_end(wordlists.name)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+                if STATS.enabled:
+                    STATS.count("wordlists.evictions")
+
+    def unregister(self, name: str) -> None:
+        """Forget a wordlist set, unloading it if it is loaded."""
+        if name == DEFAULT_WORDLISTS:
+            raise ValueError(f"Cannot remove the {DEFAULT_WORDLISTS!r} wordlists")
+        with self._lock:
+            self._directories.pop(name, None)
+            self._exclusions.pop(name, None)
+            self._loaded.pop(name, None)
+
+    def directory(self, name: str) -> Path:
+        """
+        The directory of a registered wordlist set.
+
+        Raises:
+            ValueError: If no set is registered under `name`.
+        """
+        directory = self._directories.get(name)
+        if directory is None:
+            raise ValueError(f"Unknown wordlists: {name!r}")
+        return directory
+
+    def names(self) -> list[str]:
+        """The names of all registered sets."""
+        return list(self._directories)
+
+    def loaded(self) -> list[str]:
+        """The names of the currently loaded sets (besides the default one), least recently used first."""
+        return list(self._loaded)
+
+    def get(self, name: str = DEFAULT_WORDLISTS) -> WordlistSet:
+        """
+        A registered wordlist set, loading it (and evicting the least recently used set) if needed.
+
+        Args:
+            name (str): The name of the set.
+
+        Returns:
+            WordlistSet: The wordlist set.
+
+        Raises:
+            ValueError: If no set is registered under `name`.
+        """
+        if name == DEFAULT_WORDLISTS:
+            if self._default is None:
+                with self._lock:
+                    if self._default is None:
+                        self._default = WordlistSet(
+                            DEFAULT_WORDLISTS, PARTS_OF_SPEECH_DIR, WORDLIST_BUNDLE_PATH
+                        )
+            return self._default
+
+        with self._lock:
+            wordlists = self._loaded.get(name)
+            if wordlists is not None:
+                self._loaded.move_to_end(name)
+                return wordlists
+
+            if name not in self._directories:
+                raise ValueError(f"Unknown wordlists: {name!r}")
+            wordlists = self._loaded[name] = WordlistSet(
+                name, self._directories[name], exclude=self._exclusions.get(name)
+            )
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+                if STATS.enabled:
+                    STATS.count("wordlists.evictions")
+            return wordlists
+
+
+REGISTRY = WordlistRegistry()
+"""The global wordlist registry."""
+
+
+def register_wordlists(name: str, directory: Path | str, exclude: "Blocklist | None" = None) -> None:
+    """
+    Register a wordlist set in the global registry (see `WordlistRegistry.register`).
+
+    Args:
+        name (str): The name of the set.
+        directory (Path | str): The directory containing one wordlist file per part of speech.
+        exclude (Blocklist | None): Words to leave out of the wordlists (see `blocklist`).
+    """
+    REGISTRY.register(name, directory, exclude)
+
+
+def get_wordlists(wordlists: "str | WordlistSet | None" = None) -> WordlistSet:
+    """
+    Resolve a wordlist set given by name (from the global registry) or as is.
+
+    Args:
+        wordlists (str | WordlistSet | None): A set, the name of a set, or `None` for the default set.
+
+    Returns:
+        WordlistSet: The wordlist set.
+    """
+    if isinstance(wordlists, WordlistSet):
+        return wordlists
+    return REGISTRY.get(wordlists or DEFAULT_WORDLISTS)
+
+
+def _registered_wordlists(name: str, directory: str, exclude: "Blocklist | None" = None) -> WordlistSet:
+    """The wordlist set `name`, registering it first if this process does not know it yet."""
+    if name != DEFAULT_WORDLISTS and name not in REGISTRY.names():
+        REGISTRY.register(name, directory, exclude)
+    return REGISTRY.get(name)
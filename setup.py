@@ -18,9 +18,14 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.10",
+    extras_require={
+        "numpy": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "betterpassphrase=betterpassphrase.cli:main",
+            "betterpassphrase-daemon=betterpassphrase.daemon:main",
+            "betterpassphrase-client=betterpassphrase.client:main",
         ],
     },
 )
@@ -0,0 +1,16 @@
+import pytest
+
+from betterpassphrase.models import P
+
+
+@pytest.fixture
+def make_wordlists():
+    # Writes a directory of small wordlists, with words like "averb0" for the prefix "a"
+    def make(directory, prefix, count=3):
+        directory.mkdir()
+        for pos in P:
+            words = [f"{prefix}{pos.name.lower()}{i}" for i in range(count)]
+            (directory / pos.value).write_text("\n".join(words))
+        return directory
+
+    return make
@@ -0,0 +1,80 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from betterpassphrase.aio import agenerate_phrase, agenerate_phrases, aiter_phrase_batches, aiter_phrases
+
+
+def test_agenerate_phrase():
+    phrase = asyncio.run(agenerate_phrase(length=5, sep=" "))
+    assert len(phrase.passphrase.split(" ")) == 5
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+def test_agenerate_phrases(executor):
+    phrases = asyncio.run(agenerate_phrases(25, length=4, sep=" ", executor=executor, chunk_size=10))
+    assert len(phrases) == 25
+    assert all(len(phrase.passphrase.split(" ")) == 4 for phrase in phrases)
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+def test_min_bits(executor):
+    async def main():
+        single = await agenerate_phrase(min_bits=60)
+        batch = await agenerate_phrases(15, executor=executor, chunk_size=10, min_bits=60)
+        streamed = [phrase async for phrase in aiter_phrases(5, executor=executor, min_bits=60)]
+        return [single, *batch, *streamed]
+
+    phrases = asyncio.run(main())
+    assert len(phrases) == 21
+    assert all(phrase.entropy_bits >= 60 for phrase in phrases)
+    with pytest.raises(ValueError):
+        asyncio.run(agenerate_phrases(1, executor=executor, min_bits=10**6))
+
+
+@pytest.mark.parametrize("executor", [None, ThreadPoolExecutor(2)])
+def test_char_bounds(executor):
+    async def main():
+        single = await agenerate_phrase(4, "-", min_chars=20, max_chars=24)
+        batch = await agenerate_phrases(15, 4, "-", executor=executor, chunk_size=10, min_chars=20, max_chars=24)
+        streamed = [phrase async for phrase in aiter_phrases(5, 4, "-", executor=executor, max_chars=24)]
+        return [single, *batch], streamed
+
+    bounded, streamed = asyncio.run(main())
+    assert len(bounded) == 16 and all(20 <= len(phrase.passphrase) <= 24 for phrase in bounded)
+    assert len(streamed) == 5 and all(len(phrase.passphrase) <= 24 for phrase in streamed)
+    with pytest.raises(ValueError):
+        asyncio.run(agenerate_phrases(1, 4, executor=executor, max_chars=3))
+
+
+def test_aiter_phrases_unbounded():
+    async def take(count):
+        phrases = []
+        async for phrase in aiter_phrases(length=3, chunk_size=4):
+            phrases.append(phrase)
+            if len(phrases) == count:
+                break
+        return phrases
+
+    assert len(asyncio.run(take(10))) == 10
+
+
+def test_batches_yield_to_event_loop():
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        batches = [batch async for batch in aiter_phrase_batches(100, chunk_size=10)]
+        task.cancel()
+        return batches, ticks
+
+    batches, ticks = asyncio.run(main())
+    assert [len(batch) for batch in batches] == [10] * 10
+    assert ticks >= 9
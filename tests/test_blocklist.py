@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from betterpassphrase.blocklist import Blocklist
+from betterpassphrase.config import PARTS_OF_SPEECH_DIR
+from betterpassphrase.generator import generate_phrases
+from betterpassphrase.models import P
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.wordlists import REGISTRY, get_wordlists, register_wordlists
+
+BLOCKLIST = Blocklist.from_rules(["# comment", "Nine", "*SHIP*", "re:^un", ""])
+
+
+def banned(word: str) -> bool:
+    word = word.lower()
+    return word == "nine" or "ship" in word or word.startswith("un")
+
+
+@pytest.fixture
+def clean():
+    register_wordlists("clean", PARTS_OF_SPEECH_DIR, exclude=BLOCKLIST)
+    yield get_wordlists("clean")
+    REGISTRY.unregister("clean")
+
+
+def test_rules():
+    assert BLOCKLIST == Blocklist(frozenset({"nine"}), ("ship",), ("^un",))
+    assert BLOCKLIST.filter(["Nine", "Friendship", "Unlock", "Fun", "Nineteen"]) == ["Fun", "Nineteen"]
+    with pytest.raises(ValueError):
+        Blocklist.from_rules(["re:("])
+    # Valid alone, but not where `filter` puts it, nor next to each other
+    with pytest.raises(ValueError, match="global flags"):
+        Blocklist.from_rules(["re:(?i)foo"])
+    with pytest.raises(ValueError, match="redefinition"):
+        Blocklist.from_rules(["re:(?P<x>a)", "re:(?P<x>b)"])
+
+
+def test_filtered_wordlists(clean):
+    default = get_wordlists()
+    for pos in P:
+        assert list(clean[pos]) == [word for word in default[pos] if not banned(word)]
+
+    phrase = generate_phrases(1, 4, "-", wordlists="clean")[0]
+    expected = sum(math.log2(len(clean[pos])) for pos in phrase.combination)
+    assert phrase.entropy_bits == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_no_banned_words(clean, workers):
+    batches = iter_phrase_batches(1000, 6, " ", workers=workers, chunk_size=250, wordlists="clean")
+    assert not any(banned(word) for batch in batches for phrase in batch for word in phrase.words)
+
+
+def test_shared_filtered_wordlists(clean):
+    from betterpassphrase.shared import attach_wordlists, publish_wordlists
+
+    with publish_wordlists(clean) as shared:
+        attached = attach_wordlists(*shared.initargs)
+    assert attached.exclude == BLOCKLIST
+    assert all(list(attached[pos]) == list(clean[pos]) for pos in P)
@@ -0,0 +1,43 @@
+import shutil
+
+from betterpassphrase.bundle import WordlistBundle, build_bundle, load_bundle, read_wordlist
+from betterpassphrase.config import PARTS_OF_SPEECH_DIR
+from betterpassphrase.models import PartsOfSpeech
+
+
+NAMES = [pos.value for pos in PartsOfSpeech]
+
+
+def test_bundle_matches_text_wordlists(tmp_path):
+    bundle = WordlistBundle(build_bundle(NAMES, PARTS_OF_SPEECH_DIR, tmp_path / "wordlists.bin"))
+    for pos in PartsOfSpeech:
+        section = bundle[pos.value]
+        words = read_wordlist(PARTS_OF_SPEECH_DIR / pos.value)
+        assert len(section) == len(words)
+        assert list(section) == words
+        assert section[-1] == words[-1]
+        assert section[1:4] == words[1:4]
+
+
+def test_stale_bundle_is_rebuilt(tmp_path):
+    source_dir = tmp_path / "parts_of_speech"
+    shutil.copytree(PARTS_OF_SPEECH_DIR, source_dir, ignore=shutil.ignore_patterns("*.bin"))
+    bundle_path = tmp_path / "wordlists.bin"
+
+    assert load_bundle(NAMES, source_dir, bundle_path, build=False) is None
+    bundle = load_bundle(NAMES, source_dir, bundle_path)
+    assert bundle is not None
+    assert "zymurgy" not in bundle[PartsOfSpeech.VERB.value]
+
+    with open(source_dir / PartsOfSpeech.VERB.value, "a") as f:
+        f.write("\nzymurgy")
+
+    assert load_bundle(NAMES, source_dir, bundle_path, build=False) is None
+    bundle = load_bundle(NAMES, source_dir, bundle_path)
+    assert bundle[PartsOfSpeech.VERB.value][-1] == "zymurgy"
+
+
+def test_generation_uses_bundle():
+    for pos in PartsOfSpeech:
+        assert len(pos.wordlist) == pos.n == len(pos.words)
+        assert pos.word in pos.words
@@ -0,0 +1,46 @@
+from collections import Counter
+from itertools import product
+
+import pytest
+
+from betterpassphrase.chars import char_plan
+from betterpassphrase.generator import generate_phrase, generate_phrases
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.wordlists import get_wordlists
+
+
+@pytest.mark.parametrize("min_chars, max_chars", [(None, 20), (30, None), (22, 26)])
+def test_phrases_within_bounds(min_chars, max_chars):
+    phrases = generate_phrases(500, length=4, sep="-", min_chars=min_chars, max_chars=max_chars)
+    assert all(phrase.word_count == len(phrase.words) == 4 for phrase in phrases)
+    assert all((min_chars or 0) <= len(phrase.passphrase) <= (max_chars or 1000) for phrase in phrases)
+
+
+def test_space_counts_valid_phrases():
+    wordlists = get_wordlists()
+    plan = char_plan(3, "-", None, 16, wordlists)
+    for table in plan.tables:
+        lengths = [Counter(len(word) for word in wordlists[pos]) for pos in table.combination]
+        valid = sum(
+            a * b * c
+            for (x, a), (y, b), (z, c) in product(*(counts.items() for counts in lengths))
+            if x + y + z + 2 <= 16
+        )
+        assert table.ways[0][0] == valid
+
+
+def test_entropy_reflects_bounds():
+    phrase = generate_phrase(6, "-", max_chars=32)
+    assert phrase.one_of == phrase.space
+    assert phrase.entropy_bits < generate_phrase(6, "-").entropy_bits
+
+
+def test_impossible_bounds():
+    with pytest.raises(ValueError):
+        generate_phrase(5, "-", max_chars=10)
+    with pytest.raises(ValueError):
+        generate_phrase(5, "-", min_chars=30, max_chars=20)
+    with pytest.raises(ValueError):
+        generate_phrase(12, "-", max_chars=80)
+    with pytest.raises(ValueError):
+        list(iter_phrase_batches(10, 4, "-", unique=True, max_chars=30))
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from betterpassphrase.codec import (
+    generate_ranked_phrases,
+    phrase_space,
+    rank,
+    shard_range,
+    unrank,
+)
+from betterpassphrase.config import BUFFER
+from betterpassphrase.generator import generate_phrases
+from betterpassphrase.mappings import UNIT_PHRASE_MAX_LENGTH
+
+
+LENGTHS = [3, 6, UNIT_PHRASE_MAX_LENGTH, UNIT_PHRASE_MAX_LENGTH + 1, 20]
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_unrank_rank_round_trip(length):
+    space = phrase_space(length)
+    for value in [0, space - 1] + [random.randrange(space) for _ in range(50)]:
+        phrase = unrank(value, length, sep="-")
+        # Repeated words can spell the same passphrase for several ranks
+        assert unrank(rank(phrase, length), length, sep="-") == phrase
+        assert unrank(rank(phrase.passphrase, length, sep="-"), length, sep="-").passphrase == phrase.passphrase
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_generated_phrases_have_ranks(length):
+    for phrase in generate_phrases(20, length=length, sep=" "):
+        value = rank(phrase.passphrase, length, sep=" ")
+        assert 0 <= value < phrase_space(length)
+        assert unrank(value, length, sep=" ").passphrase == phrase.passphrase
+
+
+def test_invalid_ranks_and_phrases():
+    with pytest.raises(ValueError):
+        unrank(phrase_space(6), 6)
+    with pytest.raises(ValueError):
+        rank("not-a-real-pass-phrase-at", 6)
+    with pytest.raises(ValueError):
+        rank("the-quick", 2)
+
+
+def test_shards_are_disjoint():
+    length = UNIT_PHRASE_MAX_LENGTH + BUFFER
+    shards = [shard_range(shard, 3, length) for shard in range(3)]
+    assert shards[0].start == 0
+    assert shards[-1].stop == phrase_space(length)
+    assert all(left.stop == right.start for left, right in zip(shards, shards[1:]))
+
+    for shard in shards:
+        for phrase in generate_ranked_phrases(10, shard, length=length, sep="-"):
+            assert shard.start <= rank(phrase, length) < shard.stop
+
+    with pytest.raises(ValueError):
+        shard_range(3, 3, length)
@@ -0,0 +1,65 @@
+import pytest
+
+from betterpassphrase.blocklist import Blocklist
+from betterpassphrase.compact import CompactPassphrase
+from betterpassphrase.config import BUFFER, PARTS_OF_SPEECH_DIR
+from betterpassphrase.generator import generate_phrases
+from betterpassphrase.mappings import UNIT_PHRASE_MAX_LENGTH
+from betterpassphrase.models import Passphrase, PartsOfSpeech
+from betterpassphrase.wordlists import REGISTRY, WordlistSet, register_wordlists
+
+
+@pytest.mark.parametrize("length", [3, 6, UNIT_PHRASE_MAX_LENGTH + BUFFER])
+@pytest.mark.parametrize("capitalize", [True, False])
+def test_round_trip(length, capitalize):
+    for phrase in generate_phrases(20, length=length, sep="-", capitalize=capitalize):
+        compact = CompactPassphrase.from_passphrase(phrase)
+        assert compact.passphrase == phrase.passphrase
+        assert compact.word_count == phrase.word_count
+        assert compact.combination == phrase.combination
+        assert compact.one_of == phrase.one_of
+        assert compact.to_passphrase() == phrase
+
+
+def test_round_trip_keeps_wordlists_and_space():
+    # Filtered, so that word indices differ from the default set
+    register_wordlists("compact", PARTS_OF_SPEECH_DIR, exclude=Blocklist.from_rules(["re:^[a-m]"]))
+    try:
+        for phrase in generate_phrases(20, length=6, sep="-", wordlists="compact", max_chars=40):
+            compact = CompactPassphrase.from_passphrase(phrase)
+            assert (compact.wordlists, compact.space) == ("compact", phrase.space)
+            assert compact.passphrase == phrase.passphrase
+            assert compact.one_of == phrase.one_of == phrase.space
+            assert compact.to_passphrase() == phrase
+            assert compact != CompactPassphrase.from_passphrase(phrase._replace(space=None))
+    finally:
+        REGISTRY.unregister("compact")
+
+    unregistered = WordlistSet("unregistered", PARTS_OF_SPEECH_DIR)
+    phrase = generate_phrases(1, wordlists=unregistered)[0]
+    with pytest.raises(ValueError, match="not the registered ones"):
+        CompactPassphrase.from_passphrase(phrase)
+
+
+def test_equality_and_caching():
+    phrase = generate_phrases(1, length=5)[0]
+    first = CompactPassphrase.from_passphrase(phrase)
+    second = CompactPassphrase.from_passphrase(phrase)
+    assert first == second
+    assert len({first, second}) == 1
+
+    assert first.words is first.words
+    first.release()
+    assert str(first) == phrase.passphrase
+
+
+def test_unknown_word():
+    phrase = Passphrase(
+        words=["the", "notaword", "hunter"],
+        word_count=3,
+        separator=" ",
+        capitalize=False,
+        sub_combinations=[[PartsOfSpeech.DETERMINER, PartsOfSpeech.ADJECTIVE, PartsOfSpeech.SUBJECT_NOUN]],
+    )
+    with pytest.raises(ValueError, match="is not a known adjective"):
+        CompactPassphrase.from_passphrase(phrase)
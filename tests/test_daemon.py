@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+
+from betterpassphrase.client import PassphraseClient, default_socket_path
+from betterpassphrase.daemon import PassphraseServer, PhrasePool
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    pool = PhrasePool(high_water=50).start()
+    server = PassphraseServer(str(tmp_path / "daemon.sock"), pool)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_refills_in_background():
+    pool = PhrasePool(high_water=20).start()
+    try:
+        assert len(pool.take(5, length=4, capitalize=False)) == 5
+        deadline = time.monotonic() + 5
+        while pool.size(4, False) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.size(4, False) == 20
+        assert all(len(words) == 4 for words in pool.take(30, length=4, capitalize=False))
+    finally:
+        pool.close()
+
+
+def test_invalid_requests_create_no_pool(monkeypatch):
+    from betterpassphrase import daemon
+
+    pool = PhrasePool(high_water=20).start()
+    try:
+        # Even with nothing to generate, invalid settings are rejected up front
+        with pytest.raises(ValueError):
+            pool.take(0, length=0)
+        assert (0, True) not in pool._pools
+
+        # A failing refill does not stop the refill thread
+        generate_phrases = daemon.generate_phrases
+        calls = []
+
+        def flaky(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise RuntimeError("refill failed")
+            return generate_phrases(*args)
+
+        monkeypatch.setattr(daemon, "generate_phrases", flaky)
+        pool.take(0, length=4)
+        deadline = time.monotonic() + 5
+        while pool.size(4, True) < 20 and time.monotonic() < deadline:
+            pool._wakeup.set()
+            time.sleep(0.01)
+        assert pool.size(4, True) == 20
+    finally:
+        pool.close()
+
+
+def test_client_requests(socket_path):
+    with PassphraseClient(socket_path) as client:
+        phrases = client.request(3, length=5, sep=" ", capitalize=False)
+        assert len(phrases) == 3
+        assert all(len(phrase.split(" ")) == 5 for phrase in phrases)
+
+        # Connections are reused and errors do not close them
+        with pytest.raises(ValueError):
+            client.request(1, length=0)
+        assert len(client.request(100, length=3, sep="-")) == 100
+
+
+def test_socket_is_private(socket_path, tmp_path, monkeypatch):
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+    # Others must not be able to replace the socket
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        PassphraseServer(str(shared / "daemon.sock"), PhrasePool(high_water=0))
+
+    # Nor to serve passphrases in place of our own daemon
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(socket_path).st_uid + 1)
+    with pytest.raises(PermissionError):
+        PassphraseClient(socket_path).connect()
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "betterpassphrase.sock")
+    assert PassphraseClient().path == default_socket_path()
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    directory = os.path.basename(os.path.dirname(default_socket_path()))
+    assert directory.startswith("betterpassphrase-")
@@ -0,0 +1,45 @@
+import math
+import random
+
+from betterpassphrase.config import BUFFER
+from betterpassphrase.entropy import (
+    combination_bits,
+    combination_sizes,
+    length_entropy,
+    unit_length_entropy,
+)
+from betterpassphrase.generator import generate_phrase
+from betterpassphrase.mappings import (
+    COMBINATION_IDS,
+    UNIT_PHRASE_LENGTHS,
+    UNIT_PHRASE_MAX_LENGTH,
+    LENGTH_TO_WORD_COMBINATIONS_MAP,
+)
+
+
+def test_combination_tables():
+    for combination, combination_id in COMBINATION_IDS.items():
+        size = math.prod(pos.n for pos in combination)
+        assert combination_sizes()[combination_id] == size
+        assert math.isclose(combination_bits()[combination_id], math.log2(size))
+
+
+def test_phrase_entropy_matches_one_of():
+    for length in (random.choice(UNIT_PHRASE_LENGTHS), UNIT_PHRASE_MAX_LENGTH + BUFFER):
+        phrase = generate_phrase(length=length)
+        assert math.isclose(phrase.entropy_bits, math.log2(phrase.one_of))
+        assert math.isclose(phrase.character_entropy_bits, math.log2(phrase.character_one_of))
+
+
+def test_length_entropy():
+    for length in UNIT_PHRASE_LENGTHS:
+        # Combinations are weighted by their sizes, so every phrase is equally likely
+        combinations = LENGTH_TO_WORD_COMBINATIONS_MAP[length]
+        expected = math.log2(sum(math.prod(pos.n for pos in combination) for combination in combinations))
+        assert math.isclose(unit_length_entropy(length), expected)
+        assert length_entropy(length) == unit_length_entropy(length)
+
+    # Longer phrases add words, and the choice of their sub-phrase lengths
+    entropies = [length_entropy(length) for length in range(UNIT_PHRASE_MAX_LENGTH + 1, 40)]
+    assert all(entropy > length_entropy(UNIT_PHRASE_MAX_LENGTH) for entropy in entropies)
+    assert length_entropy(2000) > length_entropy(1000) > 0
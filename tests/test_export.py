@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from betterpassphrase.cli import main as betterpassphrase_cli
+from betterpassphrase.export import FIELDS, export_batch, export_header
+from betterpassphrase.generator import generate_phrases
+
+
+def test_ndjson_records():
+    phrases = generate_phrases(50, length=12, sep="-")
+    records = [json.loads(line) for line in export_batch(phrases, "ndjson").splitlines()]
+    assert [record["passphrase"] for record in records] == [phrase.passphrase for phrase in phrases]
+    for record, phrase in zip(records, phrases):
+        assert list(record) == list(FIELDS)
+        assert record["word_count"] == phrase.word_count
+        assert record["combination"] == [pos.name.lower() for pos in phrase.combination]
+        assert record["entropy_bits"] == pytest.approx(phrase.entropy_bits)
+
+
+@pytest.mark.parametrize("fmt, delimiter", [("csv", ","), ("tsv", "\t")])
+def test_delimited_records(fmt, delimiter):
+    # Separators that clash with the delimiter are quoted
+    phrases = generate_phrases(50, length=4, sep=delimiter)
+    text = export_header(fmt) + export_batch(phrases, fmt)
+    rows = list(csv.reader(io.StringIO(text), delimiter=delimiter))
+    assert tuple(rows[0]) == FIELDS
+    assert [row[0] for row in rows[1:]] == [phrase.passphrase for phrase in phrases]
+    assert all(float(row[3]) == pytest.approx(phrase.entropy_bits) for row, phrase in zip(rows[1:], phrases))
+
+
+def test_restricted_space_entropy():
+    phrases = generate_phrases(20, length=5, sep="-", max_chars=26)
+    records = [json.loads(line) for line in export_batch(phrases, "ndjson").splitlines()]
+    assert all(record["entropy_bits"] == pytest.approx(phrase.entropy_bits) for record, phrase in zip(records, phrases))
+
+
+def test_cli_export(capsys):
+    temp_file = Path(".temp_export.csv")
+    betterpassphrase_cli(f"-n 25 -k 10 -w 1 -l 4 --format csv -o {temp_file}".split(" "))
+    rows = temp_file.read_text().splitlines()
+    temp_file.unlink()
+    assert capsys.readouterr().out == ""
+    assert rows[0] == ",".join(FIELDS)
+    assert len(rows) == 26
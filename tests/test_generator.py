@@ -2,12 +2,23 @@ from functools import reduce
 from pathlib import Path
 import random
 import re
+import subprocess
+import sys
 
 import pytest
 
 from betterpassphrase.config import BUFFER
 from betterpassphrase.models import PartsOfSpeech
-from betterpassphrase.generator import generate_phrase
+from betterpassphrase.wordlists import get_wordlists
+from betterpassphrase.generator import (
+    generate_lengths,
+    generate_phrase,
+    generate_phrases,
+    length_partition_counts,
+    min_bits_plan,
+    phrase_factory,
+)
+from betterpassphrase import generator
 from betterpassphrase.cli import main as betterpassphrase_cli
 from betterpassphrase.mappings import (
     UNIT_PHRASE_LENGTHS,
@@ -48,6 +59,22 @@ def test_word_count_and_combinations():
     assert phrase.word_count == len(phrase.words) == len(phrase.combination)
 
 
+def test_generate_lengths():
+    unit_lengths = list(UNIT_PHRASE_LENGTHS)
+    for length in (UNIT_PHRASE_MAX_LENGTH + 1, 20, 1000):
+        lengths = generate_lengths(length, buffer=BUFFER)
+        total = sum(lengths) + len(lengths) - 1
+        assert length <= total <= length + BUFFER
+        assert all(x in UNIT_PHRASE_LENGTHS for x in lengths)
+    assert UNIT_PHRASE_LENGTHS == unit_lengths
+
+
+def test_generate_lengths_is_uniform():
+    length = 12
+    splits = {tuple(generate_lengths(length, buffer=BUFFER)) for _ in range(2000)}
+    assert len(splits) == length_partition_counts(length, BUFFER)[0]
+
+
 def test_phrase_capitalization():
     phrase = generate_phrase(length=3, capitalize=True)
     assert all(word[0].isupper() for word in phrase.passphrase.split())
@@ -86,6 +113,65 @@ def test_one_of_calculation():
     assert phrase.one_of == one_of_calculated
 
 
+def test_batch_phrase_generation():
+    phrases = generate_phrases(50, length=5, sep=" ", capitalize=False)
+    assert len(phrases) == 50
+    assert all(len(phrase.passphrase.split(" ")) == 5 for phrase in phrases)
+    assert all(
+        word in pos.words
+        for phrase in phrases
+        for word, pos in zip(phrase.words, phrase.combination)
+    )
+
+    out_length = UNIT_PHRASE_MAX_LENGTH + BUFFER
+    phrases = generate_phrases(10, length=out_length, sep=" ")
+    assert all(phrase.word_count == len(phrase.words) == len(phrase.combination) for phrase in phrases)
+
+    assert generate_phrases(0) == []
+    with pytest.raises(ValueError, match="Cannot generate phrase of length"):
+        generate_phrases(1, length=-2)
+
+
+@pytest.mark.parametrize("length", [4, UNIT_PHRASE_MAX_LENGTH, 24])
+def test_phrase_factory_matches_generate_phrase(monkeypatch, length):
+    # Batches generate with a factory: from the same randomness, it draws the same phrases
+    single, batch = random.Random(7), random.Random(7)
+    monkeypatch.setattr(generator, "RANDOM_SELECTOR", single.choice)
+    monkeypatch.setattr(generator, "RANDOM_BELOW", single.randrange)
+    factory = phrase_factory(length, "-")
+    assert [generate_phrase(length, "-") for _ in range(20)] == [
+        factory(batch.choice, batch.randrange) for _ in range(20)
+    ]
+
+
+@pytest.mark.parametrize("min_bits", [20, 40, 60, 128])
+def test_min_bits(min_bits):
+    length, combinations = min_bits_plan(min_bits)
+    phrases = generate_phrases(200, sep="-", min_bits=min_bits)
+    assert all(phrase.entropy_bits >= min_bits for phrase in phrases)
+    # Long passphrases get up to `BUFFER` extra words, as with a fixed length
+    assert all(length <= phrase.word_count <= length + BUFFER for phrase in phrases)
+    if combinations is not None:
+        assert all(phrase.word_count == length for phrase in phrases)
+        assert {tuple(phrase.combination) for phrase in phrases} <= set(map(tuple, combinations))
+    # No shorter length can meet the target
+    assert min_bits_plan(min_bits - 1)[0] <= length
+    assert generate_phrase(min_bits=min_bits).entropy_bits >= min_bits
+
+
+def test_min_bits_unreachable():
+    with pytest.raises(ValueError):
+        generate_phrase(min_bits=1e6)
+
+
+def test_min_bits_plans_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(generator, "_MIN_BITS_CACHE_SIZE", 8)
+    plans = get_wordlists().tables.setdefault("min_bits_plans", {})
+    for min_bits in range(20, 60):
+        assert min_bits_plan(min_bits + 0.5) == generator._min_bits_plan(min_bits + 0.5, get_wordlists())
+        assert len(plans) <= 8
+
+
 def test_parts_of_speech_loading():
     for part in PartsOfSpeech:
         words = part.words
@@ -112,3 +198,27 @@ def test_cli_integration():
     assert min_length <= len(result.strip().split("-")) <= max_length
     assert min_length <= len(extract_capitals(result)) <= max_length
     temp_file.unlink()
+
+
+def test_cli_streams_multiple_phrases(capsys):
+    temp_file = Path(".temp_many.txt")
+    betterpassphrase_cli(f"-n 25 -k 10 -w 1 -l 4 -s - -o {temp_file} -v 1".split(" "))
+    written = temp_file.read_text().splitlines()
+    printed = capsys.readouterr().out
+    temp_file.unlink()
+    assert len(written) == 25
+    assert all(len(line.split("-")) == 4 for line in written)
+    assert printed.count("Generated phrase:") == 25
+    assert all(f"Generated phrase: {line}\n" in printed for line in written)
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, betterpassphrase.cli\n"
+        "heavy = ['betterpassphrase.codec', 'betterpassphrase.unique', 'betterpassphrase.blocklist',"
+        " 'concurrent.futures', 'hashlib', 'tempfile']\n"
+        "assert not [name for name in heavy if name in sys.modules], sys.modules.keys()\n"
+        "import betterpassphrase\n"
+        "assert betterpassphrase.generate_phrase(4).word_count == 4\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
@@ -0,0 +1,49 @@
+import math
+import random
+from collections import Counter
+from fractions import Fraction
+
+import pytest
+
+from betterpassphrase.generator import generate_phrases
+from betterpassphrase.grammar import AliasTable, compile_grammar
+from betterpassphrase.mappings import LENGTH_TO_WORD_COMBINATIONS_MAP
+
+
+@pytest.mark.parametrize("weights", [[1], [1, 1, 1], [5, 0, 3, 1], [10**20, 3, 10**18 + 7]])
+def test_alias_table_is_exact(weights):
+    table = AliasTable(weights)
+    total = table.size * table.total
+    for index, weight in enumerate(weights):
+        in_column = table.thresholds[index]
+        as_alias = sum(
+            table.total - threshold
+            for column, (threshold, alias) in enumerate(zip(table.thresholds, table.aliases))
+            if alias == index and column != index
+        )
+        assert Fraction(in_column + as_alias, total) == Fraction(weight, sum(weights))
+
+
+def test_alias_table_ties_are_exact():
+    # Force every draw of the 32-bit word onto the cut, so that the remainder decides
+    table = AliasTable([1, 2])
+    for column in range(table.size):
+        if table.cuts[column] >= 1 << 32:
+            continue  # A full column: no 32-bit word reaches its cut
+        draws = iter([(column << 32) + table.cuts[column], 0])
+        expected = column if table.remainders[column] > 0 else table.aliases[column]
+        assert table.sample(lambda n: next(draws)) == expected
+
+
+def test_alias_table_sampling():
+    table = AliasTable([1, 2, 7])
+    counts = Counter(table.sample(random.randrange) for _ in range(20_000))
+    assert all(abs(counts[index] / 20_000 - weight / 10) < 0.02 for index, weight in enumerate([1, 2, 7]))
+
+
+def test_combinations_weighted_by_phrase_count():
+    compiled = compile_grammar()[5]
+    sizes = [math.prod(pos.n for pos in combination) for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[5]]
+    counts = Counter(tuple(phrase.combination) for phrase in generate_phrases(20_000, length=5))
+    for combination, size in zip(compiled.combinations, sizes):
+        assert abs(counts[tuple(combination)] / 20_000 - size / sum(sizes)) < 0.02
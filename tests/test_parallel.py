@@ -0,0 +1,23 @@
+import pytest
+
+from betterpassphrase.parallel import iter_phrase_batches, resolve_workers
+
+
+def test_resolve_workers():
+    assert resolve_workers(10, workers=4, chunk_size=100) == 1
+    assert resolve_workers(1000, workers=4, chunk_size=100) == 4
+    assert resolve_workers(1000, workers=0, chunk_size=100) >= 1
+
+    with pytest.raises(ValueError):
+        resolve_workers(10, workers=-1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batches_cover_requested_count(workers):
+    batches = list(iter_phrase_batches(25, length=4, sep=" ", workers=workers, chunk_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert all(
+        len(phrase.passphrase.split(" ")) == 4
+        for batch in batches
+        for phrase in batch
+    )
@@ -0,0 +1,59 @@
+import csv
+import io
+
+import pytest
+
+from betterpassphrase.cli import main as betterpassphrase_cli
+from betterpassphrase.provision import (
+    CREDENTIAL_FIELDS,
+    hash_passphrase,
+    iter_credential_batches,
+    resolve_cost,
+    verify_passphrase,
+)
+
+
+@pytest.mark.parametrize("kdf, cost", [("scrypt", 16), ("pbkdf2", 10)])
+def test_hash_and_verify(kdf, cost):
+    encoded = hash_passphrase("Correct-Horse", kdf, cost)
+    assert verify_passphrase("Correct-Horse", encoded)
+    assert not verify_passphrase("Correct-Horses", encoded)
+    # Every hash has its own salt
+    assert encoded != hash_passphrase("Correct-Horse", kdf, cost)
+
+
+def test_invalid_kdf():
+    for kdf, cost in [("bcrypt", None), ("scrypt", 1000), ("pbkdf2", 1)]:
+        with pytest.raises(ValueError):
+            resolve_cost(kdf, cost)
+    with pytest.raises(ValueError):
+        verify_passphrase("Correct-Horse", "$argon2id$v=19$c2FsdA$aGFzaA")
+
+
+@pytest.mark.parametrize("key", ["", "AAAAAAAAAAA", "A" * 42])
+def test_truncated_hashes_rejected(key):
+    salt = "AAAAAAAAAAAAAAAAAAAAAA"
+    for encoded in (f"$scrypt$ln=4,r=8,p=1${salt}${key}", f"$pbkdf2-sha256$i=10${salt}${key}"):
+        with pytest.raises(ValueError):
+            verify_passphrase("anything", encoded)
+    # A full-length key with an empty salt is rejected too
+    full = hash_passphrase("anything", "pbkdf2", 10).rsplit("$", 1)[1]
+    with pytest.raises(ValueError):
+        verify_passphrase("anything", f"$pbkdf2-sha256$i=10$${full}")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_credential_batches(workers):
+    batches = list(iter_credential_batches(25, 4, "-", kdf="pbkdf2", cost=10, workers=workers, chunk_size=10, start=5))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    credentials = [credential for batch in batches for credential in batch]
+    assert [credential.id for credential in credentials] == list(range(5, 30))
+    assert all(verify_passphrase(credential.passphrase, credential.hash) for credential in credentials)
+
+
+def test_cli_credentials(capsys):
+    betterpassphrase_cli("-n 5 -l 4 -w 1 --kdf scrypt --kdf-cost 16 --format csv".split(" "))
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert tuple(rows[0]) == CREDENTIAL_FIELDS
+    assert [row[0] for row in rows[1:]] == [str(i) for i in range(5)]
+    assert all(verify_passphrase(passphrase, encoded) for _, passphrase, encoded in rows[1:])
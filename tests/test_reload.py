@@ -0,0 +1,82 @@
+import os
+import json
+
+import pytest
+
+from betterpassphrase.generator import generate_phrase
+from betterpassphrase.models import P
+from betterpassphrase.reload import WordlistWatcher, reload_wordlists, swap_wordlists
+from betterpassphrase.wordlists import DEFAULT_WORDLISTS, REGISTRY, WordlistSet, get_wordlists
+
+
+@pytest.fixture
+def default_directory(tmp_path, make_wordlists):
+    # Stand-in default wordlists, restored afterwards
+    original = get_wordlists()
+    directory = make_wordlists(tmp_path / "default", "a")
+    swap_wordlists(WordlistSet(DEFAULT_WORDLISTS, directory))
+    yield directory
+    swap_wordlists(original)
+
+
+def rewrite(directory, prefix, count):
+    for pos in P:
+        path = directory / pos.value
+        path.write_text("\n".join(f"{prefix}{pos.name.lower()}{i}" for i in range(count)))
+        # Make the change visible even within the timestamp resolution of the file system
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+
+
+def test_reload_swaps_default_tables(default_directory):
+    old = get_wordlists()
+    phrase = generate_phrase(6, capitalize=False)
+    assert phrase.one_of == 3 ** 6 and all(word.startswith("a") for word in phrase.words)
+    assert reload_wordlists() is None
+
+    rewrite(default_directory, "b", 5)
+    new = reload_wordlists()
+    assert get_wordlists() is new is not old
+    assert P.VERB.wordlist is new[P.VERB] and P.VERB.n == 5
+    assert P.VERB.words == [f"bverb{i}" for i in range(5)] and P.VERB.word in P.VERB.words
+    phrase = generate_phrase(6, capitalize=False)
+    assert phrase.one_of == 5 ** 6 and all(word.startswith("b") for word in phrase.words)
+    # The old set is untouched, for calls still using it
+    assert list(old[P.VERB]) == [f"averb{i}" for i in range(3)]
+
+
+def test_watcher_reloads_changed_sets(default_directory, tmp_path, make_wordlists):
+    REGISTRY.register("tenant", make_wordlists(tmp_path / "tenant", "t"))
+    get_wordlists("tenant")
+    reloaded = []
+    try:
+        watcher = WordlistWatcher([DEFAULT_WORDLISTS, "tenant"], on_reload=reloaded.append)
+        assert watcher.check() == []
+
+        rewrite(tmp_path / "tenant", "u", 4)
+        assert [wordlists.name for wordlists in watcher.check()] == ["tenant"]
+        assert reloaded == [get_wordlists("tenant")]
+        assert get_wordlists("tenant")[P.ADVERB][0] == "uadverb0"
+        assert watcher.check() == []
+    finally:
+        REGISTRY.unregister("tenant")
+
+
+def test_reload_prebuilds_tables_on_the_new_set(default_directory):
+    from betterpassphrase.codec import phrase_space, unrank
+    from betterpassphrase.entropy import length_entropy
+    from betterpassphrase.export import export_batch
+
+    old = get_wordlists()
+    bits, space = length_entropy(6), phrase_space(6)
+    phrase = generate_phrase(6, capitalize=False)
+    assert f'"entropy_bits": {json.dumps(phrase.entropy_bits)}' in export_batch([phrase], "ndjson")
+
+    rewrite(default_directory, "b", 5)
+    new = reload_wordlists()
+    assert {"grammar", "unit_length_entropy", "unit_spaces", "word_lookup"} <= new.tables.keys()
+    assert length_entropy(6) > bits and phrase_space(6) > space
+    assert unrank(0, 6, capitalize=False).words[0].startswith("b")
+    phrase = generate_phrase(6, capitalize=False)
+    assert f'"entropy_bits": {json.dumps(phrase.entropy_bits)}' in export_batch([phrase], "ndjson")
+    # The old set keeps its own tables, for calls still using it
+    assert length_entropy(6, wordlists=old) == bits
@@ -0,0 +1,24 @@
+from collections import Counter
+
+import pytest
+
+from betterpassphrase.sampling import EntropyPool
+
+
+def test_randbelow_bounds():
+    pool = EntropyPool(block_size=64)
+    for n in (1, 2, 3, 7, 369, 2**32, 2**32 + 1, 10**30):
+        assert all(0 <= pool.randbelow(n) < n for _ in range(200))
+
+    with pytest.raises(ValueError):
+        pool.randbelow(0)
+
+
+def test_choice_covers_sequence():
+    pool = EntropyPool(block_size=64)
+    counts = Counter(pool.choice("abcde") for _ in range(5000))
+    assert set(counts) == set("abcde")
+    assert all(600 < count < 1400 for count in counts.values())
+
+    with pytest.raises(IndexError):
+        pool.choice([])
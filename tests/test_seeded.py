@@ -0,0 +1,48 @@
+import pytest
+
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.seeded import SeededPool, generate_seeded_phrases
+
+
+def passphrases(phrases):
+    return [phrase.passphrase for phrase in phrases]
+
+
+def test_seeded_phrases_are_reproducible():
+    first = generate_seeded_phrases(200, length=12, sep="-", seed=42)
+    assert passphrases(first) == passphrases(generate_seeded_phrases(200, length=12, sep="-", seed=42))
+    assert passphrases(first) != passphrases(generate_seeded_phrases(200, length=12, sep="-", seed=43))
+    assert len(set(passphrases(first))) == 200
+
+
+def test_seeded_phrases_jump_ahead():
+    phrases = generate_seeded_phrases(100, length=6, sep="-", seed=7)
+    assert passphrases(phrases[60:]) == passphrases(generate_seeded_phrases(40, length=6, sep="-", seed=7, start=60))
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1000), (1, 7), (2, 13)])
+def test_seeded_batches_do_not_depend_on_workers(workers, chunk_size):
+    expected = passphrases(generate_seeded_phrases(100, length=5, sep=" ", seed=3))
+    batches = iter_phrase_batches(100, 5, " ", workers=workers, chunk_size=chunk_size, seed=3)
+    assert [phrase for batch in batches for phrase in passphrases(batch)] == expected
+
+
+def test_seeded_pool_streams():
+    pool = SeededPool(1)
+    first = [pool.randbelow(1000) for _ in range(40)]
+    pool.seek(1)
+    assert [pool.randbelow(1000) for _ in range(40)] != first
+    pool.seek(0)
+    assert [pool.randbelow(1000) for _ in range(40)] == first
+
+
+def test_seed_is_required():
+    with pytest.raises(ValueError):
+        generate_seeded_phrases(1)
+
+
+def test_default_seed_is_read_at_call_time(monkeypatch):
+    from betterpassphrase import config
+
+    monkeypatch.setattr(config, "SEED", 5)
+    assert passphrases(generate_seeded_phrases(3, seed=None)) == passphrases(generate_seeded_phrases(3, seed=5))
@@ -0,0 +1,25 @@
+import pytest
+
+from betterpassphrase.config import PARTS_OF_SPEECH_DIR
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.shared import attach_wordlists, publish_wordlists
+from betterpassphrase.wordlists import REGISTRY, WordlistSet, get_wordlists
+
+
+@pytest.mark.parametrize("use_bundle", [True, False])
+def test_attach_reads_published_words(use_bundle):
+    name = f"shared-{use_bundle}"
+    wordlists = WordlistSet(name, PARTS_OF_SPEECH_DIR, use_bundle=use_bundle)
+    try:
+        with publish_wordlists(wordlists) as shared:
+            attached = attach_wordlists(*shared.initargs)
+        # The mapping outlives the published segment
+        assert attached is get_wordlists(name)
+        assert all(list(attached[pos]) == list(wordlists[pos]) for pos in wordlists.lists)
+    finally:
+        REGISTRY.unregister(name)
+
+
+def test_batches_with_shared_wordlists():
+    batches = list(iter_phrase_batches(25, length=4, sep=" ", workers=2, chunk_size=10, share_wordlists=True))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
@@ -0,0 +1,49 @@
+import pytest
+
+from betterpassphrase import generate_phrase, generate_phrases
+from betterpassphrase.cli import main as betterpassphrase_cli
+from betterpassphrase.stats import STATS
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    STATS.reset()
+    yield
+    STATS.disable()
+    STATS.reset()
+
+
+def test_stats_disabled_by_default():
+    generate_phrases(100, length=12)
+    assert not STATS.counters and not STATS.timers
+
+
+def test_stats_record_generation():
+    STATS.enable()
+    generate_phrases(100, length=12)
+    snapshot = STATS.snapshot()
+    assert snapshot["counters"]["entropy.pool_bytes"] > 0
+    assert snapshot["counters"]["generator.composite_phrases"] == 100
+    assert snapshot["counters"]["generator.sub_phrases"] >= 200
+    assert snapshot["maxima"]["generator.max_sub_phrases"] >= 2
+    assert snapshot["caches"]["length_partition_counts"]["hits"] > 0
+
+
+def test_stats_count_os_reads():
+    generate_phrase(length=6)
+    assert "entropy.os_reads" not in STATS.counters
+
+    STATS.enable()
+    generate_phrase(length=6)
+    generate_phrase(min_bits=40)
+    counters = STATS.snapshot()["counters"]
+    # At least one read per word
+    assert counters["entropy.os_reads"] >= 2 * 6
+    assert counters["entropy.os_bytes"] >= counters["entropy.os_reads"]
+
+
+def test_cli_stats(capsys):
+    betterpassphrase_cli("-n 20 -k 10 -w 1 -l 4 --stats".split(" "))
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 20
+    assert "cli.phrases" in captured.err and "cli.generate" in captured.err
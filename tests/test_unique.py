@@ -0,0 +1,80 @@
+import pytest
+
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.unique import PhrasePermutation, generate_unique_phrases, iter_unique_phrases
+
+
+@pytest.mark.parametrize("size", [1, 2, 97, 1000])
+def test_permutation_is_a_bijection(size):
+    permutation = PhrasePermutation(size, b"key")
+    assert sorted(permutation(value) for value in range(size)) == list(range(size))
+
+
+def test_permutation_depends_on_key():
+    first, second = PhrasePermutation(10_000, b"one"), PhrasePermutation(10_000, b"two")
+    assert [first(value) for value in range(20)] != [second(value) for value in range(20)]
+
+
+def test_unique_phrases_are_unique():
+    phrases = generate_unique_phrases(2000, length=3, sep="-")
+    assert len({phrase.passphrase for phrase in phrases}) == 2000
+
+
+def test_unique_offsets_are_disjoint():
+    key = b"shared"
+    first = list(iter_unique_phrases(length=3, sep="-", key=key, offset=0, stop=500))
+    second = list(iter_unique_phrases(length=3, sep="-", key=key, offset=500, stop=1000))
+    assert first and second
+    assert not {phrase.passphrase for phrase in first} & {phrase.passphrase for phrase in second}
+
+
+def test_unique_phrases_exhaust_small_ranges():
+    phrases = list(iter_unique_phrases(length=3, sep="-", ranks=range(50)))
+    assert 0 < len(phrases) <= 50
+    assert len({phrase.passphrase for phrase in phrases}) == len(phrases)
+
+    with pytest.raises(ValueError):
+        generate_unique_phrases(51, length=3, sep="-", ranks=range(50))
+
+
+@pytest.mark.parametrize("sep, capitalize", [("", False), ("x", True)])
+def test_unique_needs_separable_words(sep, capitalize):
+    with pytest.raises(ValueError):
+        generate_unique_phrases(1, sep=sep, capitalize=capitalize)
+
+
+def test_unique_batches_are_unique():
+    batches = iter_phrase_batches(250, length=3, sep=" ", workers=1, chunk_size=60, unique=True)
+    phrases = [phrase.passphrase for batch in batches for phrase in batch]
+    assert len(phrases) == len(set(phrases)) == 250
+
+
+def test_unique_batches_fill_small_shards():
+    from betterpassphrase.codec import shard_range
+
+    # Every chunk gets its own positions, so many small chunks can use up a whole shard
+    ranks = shard_range(0, 1_000_000, length=3)
+    available = len(list(iter_unique_phrases(length=3, sep="-", ranks=ranks)))
+    batches = iter_phrase_batches(available, length=3, sep="-", workers=1, chunk_size=7, ranks=ranks, unique=True)
+    phrases = [phrase.passphrase for batch in batches for phrase in batch]
+    assert len(phrases) == len(set(phrases)) == available
+
+    with pytest.raises(ValueError):
+        list(iter_phrase_batches(available + 1, length=3, sep="-", workers=1, chunk_size=7, ranks=ranks, unique=True))
+    with pytest.raises(ValueError):
+        iter_phrase_batches(len(ranks) + 1, length=3, sep="-", ranks=ranks, unique=True)
+
+
+def test_cli_reports_running_out_of_unique_phrases(capsys):
+    from betterpassphrase.cli import main as betterpassphrase_cli
+    from betterpassphrase.codec import shard_range
+
+    # A shard with an ambiguous passphrase, so running out only shows while streaming
+    ranks = shard_range(2991, 5_000_000, length=3)
+    available = len(list(iter_unique_phrases(length=3, sep="-", ranks=ranks)))
+    assert available < len(ranks)
+    with pytest.raises(SystemExit):
+        betterpassphrase_cli(f"-u -l 3 -s - -n {available + 1} --shard 2991/5000000".split(" "))
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == available
+    assert "unique passphrases available" in captured.err
@@ -0,0 +1,45 @@
+from collections import Counter
+
+import pytest
+
+from betterpassphrase.mappings import LENGTH_TO_WORD_COMBINATIONS_MAP
+from betterpassphrase.models import P
+from betterpassphrase.vectorized import generate_passphrase_strings, iter_passphrase_string_batches
+
+
+@pytest.mark.parametrize("length", [3, 6, 12])
+def test_passphrase_strings(length):
+    phrases = generate_passphrase_strings(500, length, "-", capitalize=False)
+    assert len(phrases) == 500
+    assert all(isinstance(phrase, str) for phrase in phrases)
+    assert all(length <= len(phrase.split("-")) <= length + 3 for phrase in phrases)
+    assert all(phrase == phrase.lower() for phrase in phrases)
+
+
+def test_passphrase_string_batches():
+    batches = list(iter_passphrase_string_batches(250, 4, " ", workers=1, chunk_size=100))
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+
+
+def test_vectorized_words_follow_combinations():
+    pytest.importorskip("numpy")
+    combinations = {tuple(combination) for combination in LENGTH_TO_WORD_COMBINATIONS_MAP[5]}
+    wordlists = {pos: set(pos.words) for pos in P}
+    for phrase in generate_passphrase_strings(2000, 5, " ", capitalize=False):
+        words = phrase.split(" ")
+        assert any(all(word in wordlists[pos] for word, pos in zip(words, combination)) for combination in combinations)
+
+
+def test_vectorized_randbelow_is_uniform():
+    pytest.importorskip("numpy")
+    from betterpassphrase.vectorized import _randbelow_array
+
+    counts = Counter(_randbelow_array(7, 70_000).tolist())
+    assert sorted(counts) == list(range(7))
+    assert all(abs(count - 10_000) < 600 for count in counts.values())
+
+
+def test_vectorized_capitalization():
+    pytest.importorskip("numpy")
+    phrases = generate_passphrase_strings(100, 6, "-")
+    assert all(all(word[:1].isupper() for word in phrase.split("-") if word) for phrase in phrases)
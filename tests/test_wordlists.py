@@ -0,0 +1,50 @@
+import pickle
+
+import pytest
+
+from betterpassphrase import generate_phrase, generate_phrases
+from betterpassphrase.models import P
+from betterpassphrase.parallel import iter_phrase_batches
+from betterpassphrase.wordlists import DEFAULT_WORDLISTS, WordlistRegistry, get_wordlists
+
+
+def test_registry_evicts_least_recently_used(tmp_path, make_wordlists):
+    registry = WordlistRegistry(max_loaded=2)
+    for name in "abc":
+        registry.register(name, make_wordlists(tmp_path / name, name))
+
+    a = registry.get("a")
+    registry.get("b")
+    assert registry.get("a") is a
+    registry.get("c")
+    assert registry.loaded() == ["a", "c"]
+    assert registry.get("b") is not None and registry.loaded() == ["c", "b"]
+    assert registry.get(DEFAULT_WORDLISTS) is registry.get(DEFAULT_WORDLISTS)
+
+    with pytest.raises(ValueError):
+        registry.get("missing")
+    with pytest.raises(ValueError):
+        registry.register(DEFAULT_WORDLISTS, tmp_path)
+
+
+def test_generate_with_custom_wordlists(tmp_path, monkeypatch, make_wordlists):
+    registry = WordlistRegistry()
+    registry.register("tenant", make_wordlists(tmp_path / "tenant", "x"))
+    monkeypatch.setattr("betterpassphrase.wordlists.REGISTRY", registry)
+
+    phrase = generate_phrase(12, "-", capitalize=False, wordlists="tenant")
+    assert all(word.startswith("x") for word in phrase.words)
+    assert phrase.one_of == 3 ** phrase.word_count
+    assert phrase.wordlists is get_wordlists("tenant")
+
+    batches = iter_phrase_batches(20, length=4, sep="-", workers=1, chunk_size=10, wordlists="tenant")
+    assert all(phrase.passphrase.startswith("X") for batch in batches for phrase in batch)
+
+    # Sets are pickled by name, and resolved from the registry on the other side
+    assert pickle.loads(pickle.dumps(phrase)).wordlists is phrase.wordlists
+
+
+def test_default_wordlists_unchanged():
+    phrase = generate_phrases(1, 6)[0]
+    assert phrase.wordlists is None
+    assert get_wordlists()[P.VERB] is P.VERB.wordlist